@@ -1,8 +1,24 @@
 from django.apps import AppConfig
+from django.core.checks import Error, register
+from django.core.exceptions import ImproperlyConfigured
 
 class MainConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main'
 
     def ready(self):
-        import main.signals
\ No newline at end of file
+        import main.signals
+        from django.db.backends.signals import connection_created
+        from main.metrics import install_query_wrapper
+        connection_created.connect(install_query_wrapper)  # ✅ 모든 DB 연결의 쿼리 수/시간을 요청 지표에 기록
+        register(check_password_hash_iterations)
+
+
+def check_password_hash_iterations(app_configs, **kwargs):
+    """ ✅ PASSWORD_HASH_ITERATIONS가 Django 기본값보다 낮으면 서버 시작 전에 오류 """
+    from main.hashers import configured_iterations
+    try:
+        configured_iterations()
+    except ImproperlyConfigured as e:
+        return [Error(str(e), id='main.E001')]
+    return []
@@ -0,0 +1,53 @@
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404, HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import APIException, NotAuthenticated, NotFound
+from main.authentication import ProfileJWTAuthentication
+from main.renderers import FastJSONRenderer
+
+# ✅ async 조회 API 공통 처리
+# - DRF APIView는 동기 전용이라 ASGI에서 요청마다 스레드를 하나씩 점유함
+# - AsyncAPIView는 인증(JWT)부터 조회/직렬화까지 이벤트 루프에서 처리하고, DB 조회만 Django async ORM으로 위임
+# - 응답 형식(JSON 인코딩, 오류 본문, 401 헤더)은 DRF와 같게 맞춤
+
+
+def api_response(data, status=200):
+    """ ✅ DRF 뷰와 같은 렌더러로 만든 JSON 응답 """
+    return HttpResponse(FastJSONRenderer().render(data), status=status, content_type='application/json')
+
+
+class AsyncAPIView(View):
+    """
+    ✅ async 조회 API 기반 클래스
+    - request.user: JWT 인증 결과 (토큰이 없으면 AnonymousUser)
+    - authentication_required = True면 로그인하지 않은 요청은 401 (IsAuthenticated와 같음)
+    - 뷰에서 발생한 DRF 예외(ValidationError, NotFound 등)와 Http404는 DRF와 같은 형식으로 응답
+    - 직렬화 중 지연 로딩 쿼리가 생기면 async 컨텍스트에서 오류가 나므로, 필요한 관계는 조회할 때 모두 함께 가져와야 함
+    """
+    authentication_required = True
+    authenticator = ProfileJWTAuthentication()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # ✅ 토큰 기반 API이므로 DRF APIView와 같이 CSRF 검사 제외
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            authenticated = await self.authenticator.aauthenticate(request)
+            request.user = authenticated[0] if authenticated else AnonymousUser()
+            if self.authentication_required and not request.user.is_authenticated:
+                raise NotAuthenticated()
+            return await super().dispatch(request, *args, **kwargs)
+        except (APIException, Http404) as exc:
+            return self.handle_exception(request, exc)
+
+    def handle_exception(self, request, exc):
+        if isinstance(exc, Http404):
+            exc = NotFound(*exc.args)
+        data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+        response = api_response(data, status=exc.status_code)
+        if exc.status_code == 401:
+            response['WWW-Authenticate'] = self.authenticator.authenticate_header(request)
+        return response
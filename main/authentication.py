@@ -0,0 +1,61 @@
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from main.db_router import apin_recent_writer, pin_recent_writer
+
+
+class ProfileJWTAuthentication(JWTAuthentication):
+    """
+    ✅ JWT 인증 + 사용자와 프로필을 한 번에 로드
+    - 기본 JWTAuthentication은 사용자만 조회하므로 뷰에서 request.user.profile에 접근할 때 쿼리가 한 번 더 발생
+    - select_related('profile')로 한 번의 PK 조회 (is_active, 비밀번호 변경 여부, 프로필은 매 요청 DB 기준)
+    - 사용자/프로필 객체는 캐시하지 않음: 캐시 삭제가 다른 워커에 전달되지 않아 비활성화가 늦게 반영되고,
+      뷰가 오래된 프로필을 다시 저장할 수 있음
+    """
+
+    def get_user(self, validated_token):
+        user_id, version = self._identity(validated_token)
+        pin_recent_writer(user_id)  # ✅ 최근에 쓰기를 한 사용자면 이후 조회를 주 DB에서 (read-your-writes)
+        return self._check(self._user_query(user_id).first(), version)
+
+    async def aauthenticate(self, request):
+        """ ✅ authenticate()의 async 버전 (AsyncAPIView에서 사용, 토큰 검증은 DB 조회 없음) """
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        user_id, version = self._identity(validated_token)
+        await apin_recent_writer(user_id)
+        return self._check(await self._user_query(user_id).afirst(), version)
+
+    def _identity(self, validated_token):
+        """ ✅ (사용자 ID, 토큰 버전) """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        return user_id, validated_token.get(api_settings.REVOKE_TOKEN_CLAIM)
+
+    def _user_query(self, user_id):
+        """ ✅ 비활성화/비밀번호 변경이 바로 반영되도록 복제 DB가 아닌 주 DB에서 조회 """
+        return self.user_model.objects.using(DEFAULT_DB_ALIAS).select_related('profile').filter(**{api_settings.USER_ID_FIELD: user_id})
+
+    def _check(self, user, version):
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN and version != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+        return user
@@ -0,0 +1,126 @@
+import random
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# ✅ 주/복제 DB 라우팅
+# - settings.DATABASE_REPLICAS에 복제 DB 별칭이 있으면, 읽기 전용 요청(GET/HEAD/OPTIONS)의 조회만 복제 DB로 보냄
+# - 쓰기 요청, 요청 밖(관리 명령, 백그라운드 작업), 트랜잭션 안의 조회는 항상 주 DB
+# - read-your-writes: 쓰기가 있었던 요청 이후 REPLICA_PIN_SECONDS 동안 같은 사용자의 조회는 주 DB에 고정
+#   (브라우저는 쿠키, JWT 클라이언트는 사용자 ID 기준 캐시로 판단)
+PIN_COOKIE = 'db_primary_pin'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def _pin_key(user_id):
+    return f"db:pin:user:{user_id}"
+
+
+def _pin_seconds():
+    return getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+
+class RoutingState:
+    """ ✅ 요청 하나의 라우팅 상태 """
+    __slots__ = ('replica', 'pinned', 'wrote')
+
+    def __init__(self, replica, pinned):
+        self.replica = replica  # ✅ 이 요청에서 사용할 복제 DB (None이면 주 DB만 사용)
+        self.pinned = pinned
+        self.wrote = False
+
+
+routing_state = ContextVar('routing_state', default=None)
+
+
+def pin_recent_writer(user_id):
+    """ ✅ 인증된 사용자가 최근에 쓰기를 했다면 남은 조회를 주 DB로 고정 (인증 클래스에서 호출) """
+    state = routing_state.get()
+    if state is not None and state.replica and not state.pinned and cache.get(_pin_key(user_id)):
+        state.pinned = True
+
+
+async def apin_recent_writer(user_id):
+    state = routing_state.get()
+    if state is not None and state.replica and not state.pinned and await cache.aget(_pin_key(user_id)):
+        state.pinned = True
+
+
+class PrimaryReplicaRouter:
+    """ ✅ settings.DATABASE_ROUTERS에 등록 """
+
+    def db_for_read(self, model, **hints):
+        state = routing_state.get()
+        if state is None or not state.replica or state.pinned:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS  # ✅ 트랜잭션 안의 조회(select_for_update 등)는 방금 쓴 값을 봐야 함
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = routing_state.get()
+        if state is not None:
+            state.wrote = True
+            state.pinned = True  # ✅ 같은 요청의 이후 조회도 주 DB
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        pool = {DEFAULT_DB_ALIAS, *getattr(settings, 'DATABASE_REPLICAS', ())}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # ✅ 복제 DB는 주 DB에서 복제되므로 직접 마이그레이션하지 않음
+        return db not in getattr(settings, 'DATABASE_REPLICAS', ())
+
+
+class ReplicaRoutingMiddleware:
+    """
+    ✅ 요청마다 라우팅 상태를 만들고, 쓰기가 있었으면 응답에 고정 쿠키 + 사용자별 고정 캐시를 남김
+    - sync / async 요청 모두 지원 (contextvar라 sync_to_async로 실행되는 ORM 호출에도 전달됨)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = self.begin(request)
+        token = routing_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            routing_state.reset(token)
+        return self.finish(request, response, state)
+
+    async def __acall__(self, request):
+        state = self.begin(request)
+        token = routing_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            routing_state.reset(token)
+        return self.finish(request, response, state)
+
+    def begin(self, request):
+        replicas = getattr(settings, 'DATABASE_REPLICAS', ())
+        if not replicas or request.method not in SAFE_METHODS:
+            return RoutingState(None, True)
+        return RoutingState(random.choice(replicas), PIN_COOKIE in request.COOKIES)
+
+    def finish(self, request, response, state):
+        if state.wrote and getattr(settings, 'DATABASE_REPLICAS', ()):
+            seconds = _pin_seconds()
+            response.set_cookie(PIN_COOKIE, '1', max_age=seconds, httponly=True, samesite='Lax')
+            user = getattr(request, 'user', None)  # ✅ DRF 인증 결과도 request.user에 반영됨
+            if user is not None and user.is_authenticated:
+                cache.set(_pin_key(user.pk), True, seconds)
+        return response
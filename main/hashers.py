@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.exceptions import ImproperlyConfigured
+
+
+def configured_iterations():
+    """
+    ✅ settings.PASSWORD_HASH_ITERATIONS (없으면 Django 기본값)
+    - Django 기본값보다 낮으면 ImproperlyConfigured (로그인할 때마다 기존 해시가 더 낮은 cost로 다시 저장되므로)
+    """
+    iterations = getattr(settings, 'PASSWORD_HASH_ITERATIONS', None) or PBKDF2PasswordHasher.iterations
+    if iterations < PBKDF2PasswordHasher.iterations:
+        raise ImproperlyConfigured(
+            f"PASSWORD_HASH_ITERATIONS({iterations})는 Django 기본값({PBKDF2PasswordHasher.iterations}) 이상이어야 합니다."
+        )
+    return iterations
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    ✅ 반복 횟수(cost)를 settings.PASSWORD_HASH_ITERATIONS로 조정할 수 있는 PBKDF2 해셔
+    - 알고리즘 이름이 기본 해셔와 같으므로 기존 비밀번호를 그대로 검증
+    - 저장된 해시의 반복 횟수가 설정과 다르면 로그인할 때 새 cost로 다시 해시하여 저장 (Django must_update)
+    - 설정은 Django 기본값 이상만 허용 (기본값보다 약한 해시로 바뀌지 않도록)
+    """
+
+    def __init__(self):
+        self.iterations = configured_iterations()
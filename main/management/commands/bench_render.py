@@ -0,0 +1,71 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from main.middleware import brotli, compress
+from main.models import Post
+from main.renderers import FastJSONRenderer
+from main.serializers.post import PostSerializer
+
+
+def measure(func, iterations):
+    """ ✅ func를 iterations번 실행한 (결과, 1회 중앙값 ms) """
+    timings = []
+    result = None
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return result, timings[len(timings) // 2]
+
+
+class Command(BaseCommand):
+    """
+    ✅ 게시글 목록 응답 렌더링 / 압축 벤치마크 (python manage.py bench_render --posts 100)
+    - 게시글 N개를 PostSerializer로 직렬화한 데이터를 DRF JSONRenderer와 FastJSONRenderer로 렌더링하여 비교
+    - 두 렌더러의 출력이 바이트 단위로 같은지 확인하고, gzip / br 압축 크기와 시간을 출력
+    - 직렬화(serializer.data) 시간은 렌더러와 무관하므로 따로 출력
+    """
+    help = "게시글 목록 응답의 JSON 렌더링 시간과 압축 크기를 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=100, help="직렬화할 게시글 수 (기본 100)")
+        parser.add_argument('--iterations', type=int, default=200, help="렌더링 반복 횟수 (기본 200)")
+
+    def handle(self, *args, **options):
+        posts = list(
+            Post.objects.filter(is_complete=True).select_related('author__profile')
+            .prefetch_related('texts', 'images').order_by('-created_at', '-id')[:options['posts']]
+        )
+        if len(posts) < options['posts']:
+            raise CommandError(f"작성 완료된 게시글이 {len(posts)}개뿐입니다. 먼저 seed_bench를 실행하세요.")
+
+        request = RequestFactory().get('/posts/')
+        iterations = options['iterations']
+        data, serialize_ms = measure(
+            lambda: PostSerializer(posts, many=True, context={'request': request}).data, max(1, iterations // 10)
+        )
+
+        baseline, baseline_ms = measure(lambda: JSONRenderer().render(data), iterations)
+        fast, fast_ms = measure(lambda: FastJSONRenderer().render(data), iterations)
+
+        self.stdout.write(f"게시글 {len(posts)}개, 반복 {iterations}회 (1회 중앙값)")
+        self.stdout.write(f"{'PostSerializer.data':<26}{serialize_ms:8.2f}ms")
+        self.stdout.write(f"{'DRF JSONRenderer':<26}{baseline_ms:8.2f}ms  {len(baseline):>9,}B")
+        self.stdout.write(
+            f"{'FastJSONRenderer':<26}{fast_ms:8.2f}ms  {len(fast):>9,}B  "
+            f"(x{baseline_ms / fast_ms:.1f}, 출력 {'같음' if fast == baseline else '다름'})"
+        )
+
+        for encoding in (('gzip', 'br') if brotli else ('gzip',)):
+            compressed, compress_ms = measure(lambda: compress(fast, encoding), max(1, iterations // 10))
+            self.stdout.write(
+                f"{encoding:<26}{compress_ms:8.2f}ms  {len(compressed):>9,}B  "
+                f"({(1 - len(compressed) / len(fast)) * 100:.1f}% 절감)"
+            )
+        if not brotli:
+            self.stdout.write("br: brotli 패키지가 설치되어 있지 않아 측정하지 않음")
+
+        if fast != baseline:
+            raise CommandError("FastJSONRenderer 출력이 DRF JSONRenderer와 다릅니다.")
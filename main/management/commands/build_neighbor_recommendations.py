@@ -0,0 +1,21 @@
+import time
+from django.core.management.base import BaseCommand
+from main.recommendations import build_neighbor_recommendations
+
+
+class Command(BaseCommand):
+    """
+    ✅ 알 수도 있는 이웃 배치 계산 (python manage.py build_neighbor_recommendations)
+    - cron 등으로 주기적으로 실행
+    """
+    help = "서로이웃 관계와 공감/댓글 기록으로 사용자별 추천 이웃 상위 K명을 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-k', type=int, default=20, help="사용자별로 저장할 추천 수 (기본 20)")
+        parser.add_argument('--batch-size', type=int, default=500, help="한 트랜잭션에서 처리할 사용자 수 (기본 500)")
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        written = build_neighbor_recommendations(top_k=options['top_k'], batch_size=options['batch_size'])
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f"추천 {written}건을 저장했습니다. ({elapsed:.1f}초)"))
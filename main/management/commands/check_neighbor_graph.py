@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef
+from main.models.neighbor import Neighbor, NeighborEdge
+
+
+class Command(BaseCommand):
+    """
+    ✅ 서로이웃 관계 테이블 정합성 검사 (python manage.py check_neighbor_graph [--fix])
+    - 한 방향만 저장된 관계, 자기 자신과의 관계
+    - 처리가 끝났는데 남아 있는 신청 내역 (accepted/rejected)
+    - 이미 서로이웃인데 남아 있는 대기 중인 신청
+    """
+    help = "서로이웃 관계 테이블(Profile.neighbors)과 신청 내역(Neighbor)의 정합성을 검사합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fix', action='store_true', help="발견한 문제를 바로 수정합니다.")
+
+    def handle(self, *args, **options):
+        reverse_edge = NeighborEdge.objects.filter(
+            from_profile_id=OuterRef('to_profile_id'), to_profile_id=OuterRef('from_profile_id')
+        )
+        one_way = NeighborEdge.objects.exclude(from_profile_id=F('to_profile_id')).exclude(Exists(reverse_edge))
+        self_edges = NeighborEdge.objects.filter(from_profile_id=F('to_profile_id'))
+        settled = Neighbor.objects.exclude(status='pending')
+        already_neighbors = Neighbor.objects.filter(status='pending').filter(Exists(NeighborEdge.objects.filter(
+            from_profile__user_id=OuterRef('from_user_id'), to_profile__user_id=OuterRef('to_user_id')
+        )))
+
+        problems = {
+            "한 방향만 저장된 관계": one_way.count(),
+            "자기 자신과의 관계": self_edges.count(),
+            "처리가 끝난 신청 내역": settled.count(),
+            "이미 서로이웃인 대기 중 신청": already_neighbors.count(),
+        }
+        for label, count in problems.items():
+            style = self.style.WARNING if count else self.style.SUCCESS
+            self.stdout.write(style(f"{label}: {count}"))
+
+        if not any(problems.values()):
+            self.stdout.write(self.style.SUCCESS("서로이웃 관계가 일관됩니다."))
+            return
+
+        if not options['fix']:
+            raise CommandError("불일치가 있습니다. --fix 옵션으로 수정할 수 있습니다.")
+
+        with transaction.atomic():
+            NeighborEdge.objects.bulk_create(
+                [NeighborEdge(from_profile_id=b, to_profile_id=a) for a, b in one_way.values_list('from_profile_id', 'to_profile_id')],
+                batch_size=500, ignore_conflicts=True,
+            )
+            self_edges.delete()
+            # ✅ 수락된 신청은 관계에 반영한 뒤 삭제 (Neighbor.save()와 동일한 처리)
+            for request in settled.filter(status='accepted').select_related('from_user__profile', 'to_user__profile'):
+                if request.from_user.profile.id != request.to_user.profile.id:
+                    request.from_user.profile.neighbors.add(request.to_user.profile)
+            settled.delete()
+            already_neighbors.delete()
+
+        self.stdout.write(self.style.SUCCESS("불일치를 수정했습니다."))
@@ -0,0 +1,193 @@
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import django
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from main.models.customuser import CustomUser
+from main.models.profile import Profile
+
+URLNAME_MAX_LENGTH = Profile._meta.get_field('urlname').max_length
+USERNAME_MAX_LENGTH = Profile._meta.get_field('username').max_length
+USER_ID_MAX_LENGTH = CustomUser._meta.get_field('id').max_length
+BLOG_NAME_MAX_LENGTH = Profile._meta.get_field('blog_name').max_length
+INTRO_MAX_LENGTH = Profile._meta.get_field('intro').max_length
+
+
+def _init_worker():
+    """ ✅ 해시 작업 프로세스 초기화 (spawn 방식에서도 settings.PASSWORD_HASHERS를 읽을 수 있도록) """
+    django.setup()
+
+
+def read_rows(path, fmt):
+    """
+    ✅ CSV/JSONL 파일을 한 줄씩 읽어 (줄 번호, dict)로 반환 (파일 전체를 메모리에 올리지 않음)
+    - JSON 객체로 읽을 수 없는 줄은 dict 대신 None을 반환 (전체 가져오기를 중단하지 않고 잘못된 행으로 처리)
+    - JSONL 값은 CSV와 같도록 문자열로 변환 (숫자 id 등)
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if fmt == 'csv':
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                yield line_no, row
+        else:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    row = None
+                if isinstance(row, dict):
+                    yield line_no, {key: str(value) for key, value in row.items() if value is not None}
+                else:
+                    yield line_no, None
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Command(BaseCommand):
+    """
+    ✅ 사용자 일괄 가져오기 (python manage.py import_users users.csv)
+    - 컬럼: id, password (필수) / username, blog_name, urlname, intro (선택)
+    - 비밀번호 해시는 프로세스 풀에서 병렬로 계산
+    - chunk_size명씩 한 트랜잭션에서 CustomUser/Profile을 bulk_create
+      (post_save 시그널이 발생하지 않으므로 프로필도 여기서 함께 생성)
+    - 이미 있는 id는 건너뛰고, 겹치는 urlname은 뒤에 -2, -3 ... 을 붙여 해결
+    """
+    help = "CSV 또는 JSONL 파일에서 사용자와 프로필을 일괄 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="가져올 파일 경로 (.csv 또는 .jsonl)")
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help="파일 형식 (기본: 확장자로 판단)")
+        parser.add_argument('--chunk-size', type=int, default=500, help="한 트랜잭션에서 생성할 사용자 수 (기본 500)")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help="비밀번호 해시 프로세스 수")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f"파일을 찾을 수 없습니다: {path}")
+        fmt = options['format'] or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+
+        self.created = self.skipped = self.invalid = 0
+        self.used_urlnames = set()  # ✅ 이번 실행에서 이미 배정한 urlname
+
+        with ProcessPoolExecutor(max_workers=options['workers'], initializer=_init_worker) as pool:
+            for chunk in chunked(read_rows(path, fmt), options['chunk_size']):
+                self.import_chunk(chunk, pool)
+                self.stdout.write(f"생성 {self.created} / 건너뜀 {self.skipped} / 오류 {self.invalid}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"가져오기 완료: 생성 {self.created}명, 이미 있는 아이디 {self.skipped}명, 잘못된 행 {self.invalid}건"
+        ))
+
+    def import_chunk(self, chunk, pool):
+        rows = []
+        seen_ids = set()
+        for line_no, row in chunk:
+            error = self.validate_row(row, seen_ids)
+            if error:
+                self.invalid += 1
+                self.stderr.write(f"{line_no}번째 줄: {error}")
+                continue
+            seen_ids.add(row['id'].strip())
+            rows.append(row | {'id': row['id'].strip()})
+
+        existing = set(CustomUser.objects.filter(id__in=seen_ids).values_list('id', flat=True))
+        rows = [row for row in rows if row['id'] not in existing]
+        self.skipped += len(existing)
+        if not rows:
+            return
+
+        # ✅ 해시 계산은 CPU 작업이므로 프로세스 풀에서 병렬로
+        hashes = pool.map(make_password, [row['password'] for row in rows], chunksize=max(1, len(rows) // 32))
+        urlnames = self.assign_urlnames([row.get('urlname') or row['id'] for row in rows])
+
+        users = []
+        profiles = []
+        for row, password_hash, urlname in zip(rows, hashes, urlnames):
+            user = CustomUser(id=row['id'], password=password_hash)
+            users.append(user)
+            profiles.append(Profile(
+                user=user,
+                blog_name=row.get('blog_name') or f"{row['id']}님의 블로그"[:BLOG_NAME_MAX_LENGTH],
+                username=(row.get('username') or row['id'])[:USERNAME_MAX_LENGTH],
+                urlname=urlname,
+                intro=row.get('intro') or None,
+            ))
+
+        try:
+            with transaction.atomic():
+                CustomUser.objects.bulk_create(users)
+                Profile.objects.bulk_create(profiles)
+        except IntegrityError as e:
+            raise CommandError(f"{rows[0]['id']}부터 시작하는 묶음을 저장하지 못했습니다: {e}")
+        self.created += len(users)
+
+    @staticmethod
+    def validate_row(row, seen_ids):
+        """
+        ✅ 한 행 검사 → 문제가 있으면 오류 메시지, 없으면 None
+        - 모델 최대 길이를 넘는 값은 DB(MySQL DataError)까지 보내지 않고 여기서 걸러냄
+        - 기본 블로그 이름(f"{id}님의 블로그")은 최대 길이에 맞게 잘라서 사용하므로 검사하지 않음
+        """
+        if row is None:
+            return "JSON 객체 형식이 아닙니다."
+        user_id = (row.get('id') or '').strip()
+        password = row.get('password') or ''
+        if not user_id or not password or len(user_id) > USER_ID_MAX_LENGTH or user_id in seen_ids:
+            return "id/password가 없거나 잘못되었습니다."
+        if len(row.get('blog_name') or '') > BLOG_NAME_MAX_LENGTH:
+            return f"blog_name은 최대 {BLOG_NAME_MAX_LENGTH}자까지 가능합니다."
+        if len(row.get('intro') or '') > INTRO_MAX_LENGTH:
+            return f"intro는 최대 {INTRO_MAX_LENGTH}자까지 가능합니다."
+        urlname = row.get('urlname')
+        if urlname and not urlname.strip():
+            return "urlname이 비어 있습니다."
+        return None
+
+    def assign_urlnames(self, wanted):
+        """
+        ✅ 원하는 urlname 목록 → 겹치지 않는 urlname 목록
+        - DB와 이번 실행에서 이미 사용한 urlname을 피해서 -2, -3 ... 접미사를 붙임 (최대 길이 유지)
+        """
+        wanted = [urlname.strip()[:URLNAME_MAX_LENGTH] for urlname in wanted]
+        taken = self.used_urlnames | set(Profile.objects.filter(urlname__in=set(wanted)).values_list('urlname', flat=True))
+
+        assigned = []
+        pending = []
+        for index, urlname in enumerate(wanted):
+            if urlname in taken:
+                pending.append(index)
+                assigned.append(None)
+            else:
+                taken.add(urlname)
+                assigned.append(urlname)
+
+        suffix = 2
+        while pending:
+            candidates = {index: self._with_suffix(wanted[index], suffix) for index in pending}
+            taken |= set(Profile.objects.filter(urlname__in=set(candidates.values())).values_list('urlname', flat=True))
+            still_pending = []
+            for index, candidate in candidates.items():
+                if candidate in taken:
+                    still_pending.append(index)
+                else:
+                    taken.add(candidate)
+                    assigned[index] = candidate
+            pending = still_pending
+            suffix += 1
+
+        self.used_urlnames.update(assigned)
+        return assigned
+
+    @staticmethod
+    def _with_suffix(urlname, suffix):
+        tail = f"-{suffix}"
+        return urlname[:URLNAME_MAX_LENGTH - len(tail)] + tail
@@ -0,0 +1,41 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+
+class Command(BaseCommand):
+    """
+    ✅ 만료된 토큰 정리 (python manage.py prune_tokens)
+    - 리프레시 토큰을 회전할 때마다 OutstandingToken/BlacklistedToken이 쌓이므로 cron 등으로 주기적으로 실행
+    - batch_size건씩 나누어 삭제하여 긴 트랜잭션/테이블 잠금을 피함
+    """
+    help = "만료된 OutstandingToken과 BlacklistedToken을 나누어 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="한 번에 삭제할 토큰 수 (기본 1000)")
+        parser.add_argument('--sleep', type=float, default=0.0, help="배치 사이 대기 시간 (초)")
+        parser.add_argument('--dry-run', action='store_true', help="삭제하지 않고 대상 수만 출력")
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        expired = OutstandingToken.objects.filter(expires_at__lte=now)
+
+        if options['dry_run']:
+            self.stdout.write(f"삭제 대상: {expired.count()}건")
+            return
+
+        deleted = 0
+        while True:
+            ids = list(expired.order_by('id').values_list('id', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            with transaction.atomic():
+                BlacklistedToken.objects.filter(token_id__in=ids).delete()
+                OutstandingToken.objects.filter(id__in=ids).delete()
+            deleted += len(ids)
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(f"만료된 토큰 {deleted}건을 삭제했습니다."))
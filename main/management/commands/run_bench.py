@@ -0,0 +1,214 @@
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+from main.models import CustomUser, Post, Comment
+
+# ✅ (이름, 가중치, 메서드, 경로 생성 함수) - 경로 생성 함수는 (rng, data, user_id)를 받음
+SCENARIOS = [
+    ("post-mutual", 10, "GET", lambda rng, d, u: "/posts/mutual/"),
+    ("post-detail", 15, "GET", lambda rng, d, u: f"/posts/{rng.choice(d['posts'])}/"),
+    ("comment-list", 10, "GET", lambda rng, d, u: f"/posts/{rng.choice(d['threads'])[0]}/comments/"),  # ✅ 댓글이 없으면 403
+    ("comment-reply-list", 5, "GET", lambda rng, d, u: "/posts/{}/comments/{}/replies/".format(*rng.choice(d['threads']))),
+    ("profile-public", 5, "GET", lambda rng, d, u: f"/profile/{rng.choice(d['urlnames'])}/"),
+    ("my-neighbor-list", 3, "GET", lambda rng, d, u: "/neighbors/list/me/"),
+    ("my-news-list", 5, "GET", lambda rng, d, u: "/news/list/"),
+    ("my-news-unread-count", 5, "GET", lambda rng, d, u: "/news/unread-count/"),
+    ("my-news-digest", 2, "GET", lambda rng, d, u: "/news/digest/"),
+    ("my-activity-history", 3, "GET", lambda rng, d, u: "/activity/history/"),
+    ("toggle-heart", 5, "POST", lambda rng, d, u: f"/posts/{rng.choice(d['posts'])}/heart/"),
+    ("toggle-comment-heart", 2, "POST", lambda rng, d, u: "/posts/{}/comments/{}/heart/".format(*rng.choice(d['threads']))),
+    # ✅ 페이지네이션 없이 (거의) 전체 게시글을 반환하는 피드 (데이터가 많으면 매우 느리므로 --only로 지정할 때만 실행)
+    ("post-list", 0, "GET", lambda rng, d, u: "/posts/"),
+    ("post-list-urlname", 0, "GET", lambda rng, d, u: f"/posts/?urlname={rng.choice(d['urlnames'])}"),
+    ("post-list-keyword", 0, "GET", lambda rng, d, u: f"/posts/?keyword={rng.choice(d['keywords'])}"),
+]
+
+
+def percentile(sorted_values, q):
+    """ ✅ nearest-rank 백분위수 """
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    """
+    ✅ 주요 API 부하 벤치마크 (python manage.py run_bench --requests 2000 --concurrency 8)
+    - seed_bench로 만든 데이터를 대상으로, 같은 --seed면 같은 순서/같은 경로로 요청
+    - 프로세스 안에서 Django 테스트 클라이언트로 전체 미들웨어/인증(JWT)을 거쳐 호출 (서버 불필요)
+    - API별 p50/p95/p99 응답 시간과 요청당 쿼리 수를 출력
+    - --output으로 결과를 JSON으로 저장하고, --compare로 이전 결과와 비교 (--max-regression을 넘으면 실패)
+    - 좋아요 토글은 데이터를 바꾸므로, 결과를 비교할 때는 같은 seed_bench 데이터로 다시 만든 뒤 실행
+    """
+    help = "주요 API를 동시에 호출하여 응답 시간 백분위수와 요청당 쿼리 수를 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000, help="측정할 요청 수 (기본 2000)")
+        parser.add_argument('--warmup', type=int, default=100, help="측정 전에 보낼 요청 수 (기본 100)")
+        parser.add_argument('--concurrency', type=int, default=8, help="동시 요청 스레드 수 (기본 8)")
+        parser.add_argument('--users', type=int, default=50, help="요청을 보낼 사용자 수 (기본 50)")
+        parser.add_argument('--seed', type=int, default=42, help="난수 시드 (기본 42)")
+        parser.add_argument('--prefix', default='bench', help="seed_bench로 생성한 사용자 ID 접두어 (기본 bench)")
+        parser.add_argument('--only', nargs='+', metavar='SCENARIO', help="실행할 시나리오 이름 (기본: 가중치가 있는 전체)")
+        parser.add_argument('--output', help="결과를 저장할 JSON 파일 경로")
+        parser.add_argument('--compare', help="비교할 이전 결과 JSON 파일 경로")
+        parser.add_argument('--max-regression', type=float,
+                            help="--compare 시 p95가 이 비율(%%) 이상 느려지거나 쿼리 수가 늘면 실패")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        scenarios = self.select_scenarios(options['only'])
+        data = self.load_data(rng, options['prefix'], options['users'])
+
+        # ✅ 요청 순서를 미리 만들어 두어 실행마다 같은 요청을 보냄
+        total = options['warmup'] + options['requests']
+        chosen = rng.choices(scenarios, weights=[weight or 1 for _, weight, _, _ in scenarios], k=total)
+        plan = []
+        for name, _, method, make_path in chosen:
+            user_id = rng.choice(data['users'])
+            plan.append((name, method, make_path(rng, data, user_id), data['tokens'][user_id]))
+
+        local = threading.local()
+
+        def run(item):
+            name, method, path, token = item
+            if not hasattr(local, 'client'):
+                local.client = Client()  # ✅ 스레드마다 클라이언트/DB 연결 하나씩
+            queries = [0]
+
+            def count(execute, sql, params, many, context):
+                queries[0] += 1
+                return execute(sql, params, many, context)
+
+            with connection.execute_wrapper(count):
+                started = time.perf_counter()
+                response = local.client.generic(method, path, HTTP_AUTHORIZATION=f"Bearer {token}")
+                elapsed = time.perf_counter() - started
+            return name, elapsed, queries[0], response.status_code
+
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            list(pool.map(run, plan[:options['warmup']]))
+            started = time.perf_counter()
+            samples = list(pool.map(run, plan[options['warmup']:]))
+            wall = time.perf_counter() - started
+
+        report = self.summarize(samples, wall, options)
+        self.print_report(report)
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"결과 저장: {options['output']}")
+
+        if options['compare']:
+            self.compare(report, options['compare'], options['max_regression'])
+
+    def select_scenarios(self, only):
+        if not only:
+            return [scenario for scenario in SCENARIOS if scenario[1] > 0]
+        names = {name for name, *_ in SCENARIOS}
+        unknown = set(only) - names
+        if unknown:
+            raise CommandError(f"알 수 없는 시나리오: {', '.join(sorted(unknown))} (가능: {', '.join(sorted(names))})")
+        return [scenario for scenario in SCENARIOS if scenario[0] in only]
+
+    def load_data(self, rng, prefix, user_count):
+        """ ✅ 요청에 사용할 사용자/게시글/댓글 (ID 순으로 읽은 뒤 시드로 샘플링하여 재현 가능) """
+        user_ids = list(CustomUser.objects.filter(id__startswith=prefix).order_by('id').values_list('id', flat=True))
+        if not user_ids:
+            raise CommandError(f"'{prefix}'로 시작하는 사용자가 없습니다. 먼저 seed_bench를 실행하세요.")
+        posts = list(Post.objects.filter(
+            author__id__startswith=prefix, visibility='everyone', is_complete=True
+        ).order_by('id').values_list('id', flat=True)[:5000])
+        threads = list(Comment.objects.filter(
+            post_id__in=posts, parent__isnull=True, is_private=False
+        ).order_by('id').values_list('post_id', 'id')[:5000])
+        if not posts or not threads:
+            raise CommandError("전체 공개 게시글/댓글이 없습니다. seed_bench 옵션을 확인하세요.")
+
+        users = rng.sample(user_ids, min(user_count, len(user_ids)))
+        tokens = {user.id: str(AccessToken.for_user(user)) for user in CustomUser.objects.filter(id__in=users)}
+        return {
+            "users": users,
+            "tokens": tokens,
+            "urlnames": rng.sample(user_ids, min(500, len(user_ids))),  # ✅ seed_bench는 urlname = 사용자 ID
+            "posts": posts,
+            "threads": threads,
+            "keywords": [key for key, _ in Post.KEYWORD_CHOICES],
+        }
+
+    def summarize(self, samples, wall, options):
+        grouped = {}
+        for name, elapsed, queries, status in samples:
+            grouped.setdefault(name, []).append((elapsed, queries, status))
+
+        results = {}
+        for name, rows in sorted(grouped.items()):
+            latencies = sorted(elapsed * 1000 for elapsed, _, _ in rows)
+            queries = [q for _, q, _ in rows]
+            results[name] = {
+                "count": len(rows),
+                "errors": sum(1 for _, _, status in rows if status >= 400),
+                "p50_ms": round(percentile(latencies, 50), 2),
+                "p95_ms": round(percentile(latencies, 95), 2),
+                "p99_ms": round(percentile(latencies, 99), 2),
+                "mean_queries": round(sum(queries) / len(queries), 2),
+                "max_queries": max(queries),
+            }
+        return {
+            "meta": {
+                "created_at": timezone.now().isoformat(),
+                "vendor": connection.vendor,
+                "seed": options['seed'],
+                "requests": len(samples),
+                "concurrency": options['concurrency'],
+                "wall_seconds": round(wall, 3),
+                "throughput_rps": round(len(samples) / wall, 1) if wall else 0,
+            },
+            "results": results,
+        }
+
+    def print_report(self, report):
+        meta = report["meta"]
+        self.stdout.write(
+            f"{meta['requests']}건 / 동시 {meta['concurrency']} / {meta['wall_seconds']}초 "
+            f"({meta['throughput_rps']} req/s, {meta['vendor']})"
+        )
+        header = f"{'scenario':<24}{'count':>7}{'err':>5}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'queries':>9}{'max':>6}"
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        for name, r in report["results"].items():
+            self.stdout.write(
+                f"{name:<24}{r['count']:>7}{r['errors']:>5}{r['p50_ms']:>10}{r['p95_ms']:>10}{r['p99_ms']:>10}"
+                f"{r['mean_queries']:>9}{r['max_queries']:>6}"
+            )
+
+    def compare(self, report, path, max_regression):
+        with open(path, encoding='utf-8') as f:
+            baseline = json.load(f)["results"]
+
+        self.stdout.write(f"\n이전 결과와 비교 ({path})")
+        regressions = []
+        for name, r in report["results"].items():
+            base = baseline.get(name)
+            if not base:
+                continue
+            p95_delta = (r["p95_ms"] - base["p95_ms"]) / base["p95_ms"] * 100 if base["p95_ms"] else 0.0
+            query_delta = r["mean_queries"] - base["mean_queries"]
+            self.stdout.write(
+                f"{name:<24} p95 {base['p95_ms']} → {r['p95_ms']}ms ({p95_delta:+.1f}%), "
+                f"쿼리 {base['mean_queries']} → {r['mean_queries']} ({query_delta:+.2f})"
+            )
+            if max_regression is not None and (p95_delta > max_regression or query_delta > 0.5):
+                regressions.append(name)
+
+        if regressions:
+            raise CommandError(f"성능 저하: {', '.join(regressions)}")
@@ -0,0 +1,284 @@
+import os
+import random
+from itertools import accumulate
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from main.models import CustomUser, Profile, Post, PostText, PostImage, Comment, Heart, CommentHeart, Neighbor, Notification
+from main.models.neighbor import NeighborEdge
+
+SENTENCES = [
+    "오늘은 날씨가 정말 좋아서 한참 동안 산책을 했어요.",
+    "요즘 읽고 있는 책이 생각보다 훨씬 재미있네요.",
+    "주말에 다녀온 맛집 후기를 남겨봅니다.",
+    "사진으로는 다 담기지 않을 만큼 멋진 풍경이었어요.",
+    "처음 도전해 본 레시피인데 꽤 괜찮게 완성됐습니다.",
+    "다음에는 친구들과 함께 다시 오고 싶어요.",
+    "작은 변화가 하루를 다르게 만든다는 걸 느꼈습니다.",
+    "궁금한 점이 있으면 댓글로 남겨주세요!",
+]
+COMMENTS = ["잘 보고 갑니다!", "사진이 너무 예뻐요.", "저도 가보고 싶네요.", "좋은 정보 감사합니다 :)", "공감하고 갑니다.", "다음 글도 기대할게요!"]
+SUBJECTS = [value for value, _ in Post.SUBJECT_CHOICES]
+CATEGORIES = ["게시판", "일상", "여행", "맛집", "리뷰"]
+
+
+class Command(BaseCommand):
+    """
+    ✅ 벤치마크용 가상 데이터 생성 (python manage.py seed_bench --users 1000 --seed 42)
+    - 같은 --seed면 같은 데이터 (ID, 관계, 내용 모두 재현 가능)
+    - 서로이웃: 선호적 연결(preferential attachment)로 만든 멱법칙(power-law) 그래프
+    - 게시글/댓글/좋아요 수도 이웃이 많은 사용자에게 몰리도록 가중치 부여
+    - 모두 bulk_create로 저장 (시그널이 발생하지 않으므로 like_count/comment_count, 내 소식도 여기서 함께 생성)
+    - 비밀번호 해시는 한 번만 계산하여 모든 사용자에게 사용
+    """
+    help = "벤치마크용 사용자, 서로이웃, 게시글, 댓글, 좋아요 데이터를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help="생성할 사용자 수 (기본 1000)")
+        parser.add_argument('--posts', type=float, default=10, help="사용자당 평균 게시글 수 (기본 10)")
+        parser.add_argument('--comments', type=float, default=5, help="게시글당 평균 댓글 수 (기본 5, 대댓글 포함)")
+        parser.add_argument('--hearts', type=float, default=8, help="게시글당 평균 좋아요 수 (기본 8)")
+        parser.add_argument('--neighbors', type=int, default=3, help="새 사용자마다 연결할 서로이웃 수 (그래프 밀도, 기본 3)")
+        parser.add_argument('--days', type=int, default=30, help="작성 시각을 분포시킬 기간 (기본 30일)")
+        parser.add_argument('--seed', type=int, default=42, help="난수 시드 (기본 42)")
+        parser.add_argument('--prefix', default='bench', help="생성할 사용자 ID/urlname 접두어 (기본 bench)")
+        parser.add_argument('--password', default='bench1234!', help="모든 사용자의 비밀번호")
+        parser.add_argument('--batch-size', type=int, default=1000, help="bulk_create 배치 크기")
+        parser.add_argument('--flush', action='store_true', help="같은 접두어로 생성한 기존 데이터를 먼저 삭제")
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.now = timezone.now()
+        self.window = timedelta(days=options['days'])
+        prefix = options['prefix']
+
+        existing = CustomUser.objects.filter(id__startswith=prefix)
+        if existing.exists():
+            if not options['flush']:
+                raise CommandError(f"'{prefix}'로 시작하는 사용자가 이미 있습니다. --flush로 삭제 후 다시 생성하세요.")
+            with transaction.atomic():
+                deleted, _ = existing.delete()
+            self.stdout.write(f"기존 데이터 {deleted}건 삭제")
+
+        with transaction.atomic():
+            users = self.create_users(prefix, options['users'], options['password'])
+            degrees = self.create_neighbors(users, options['neighbors'])
+            posts = self.create_posts(users, degrees, options['posts'])
+            self.create_interactions(users, degrees, posts, options['comments'], options['hearts'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"생성 완료: 사용자 {len(users)}명, 게시글 {len(posts)}개, 서로이웃 {sum(degrees) // 2}쌍 (seed={options['seed']})"
+        ))
+
+    # ✅ 사용자 + 프로필
+    def create_users(self, prefix, count, password):
+        encoded = make_password(password)
+        profile_start = self.next_id(Profile)
+        users = []
+        for i in range(count):
+            user_id = f"{prefix}{i:06d}"
+            users.append({"user_id": user_id, "profile_id": profile_start + i, "neighbors": set()})
+
+        CustomUser.objects.bulk_create(
+            [CustomUser(id=u["user_id"], password=encoded) for u in users], batch_size=self.batch_size
+        )
+        Profile.objects.bulk_create([
+            Profile(
+                id=u["profile_id"], user_id=u["user_id"], urlname=u["user_id"], username=f"사용자{i}",
+                blog_name=f"{i}번째 블로그", intro=self.rng.choice(SENTENCES)[:100],
+            )
+            for i, u in enumerate(users)
+        ], batch_size=self.batch_size)
+        self.stdout.write(f"사용자 {count}명 생성")
+        return users
+
+    # ✅ 서로이웃 (Barabási–Albert 방식: 이웃이 많은 사용자일수록 새 이웃이 생길 확률이 높음)
+    def create_neighbors(self, users, per_user):
+        endpoints = []  # ✅ 각 사용자가 연결 수만큼 등장하는 목록 (여기서 고르면 연결 수에 비례한 확률)
+        edges = []
+        for i in range(len(users)):
+            targets = set()
+            if endpoints:
+                for _ in range(per_user * 3):  # ✅ 중복 선택 대비 재시도 한도
+                    if len(targets) >= min(per_user, i):
+                        break
+                    targets.add(self.rng.choice(endpoints))
+            for j in targets:
+                users[i]["neighbors"].add(j)
+                users[j]["neighbors"].add(i)
+                edges.append((i, j))
+                endpoints.extend((i, j))
+            if not targets:
+                endpoints.append(i)
+
+        NeighborEdge.objects.bulk_create([
+            NeighborEdge(from_profile_id=users[a]["profile_id"], to_profile_id=users[b]["profile_id"])
+            for i, j in edges for a, b in ((i, j), (j, i))
+        ], batch_size=self.batch_size)
+
+        # ✅ 대기 중인 서로이웃 신청 (서로이웃이 아닌 사용자 사이)
+        requests = {}
+        for _ in range(len(users) // 2):
+            i, j = self.rng.randrange(len(users)), self.rng.randrange(len(users))
+            if i != j and j not in users[i]["neighbors"] and (j, i) not in requests:
+                requests[(i, j)] = Neighbor(from_user_id=users[i]["user_id"], to_user_id=users[j]["user_id"], status='pending')
+        Neighbor.objects.bulk_create(requests.values(), batch_size=self.batch_size)
+
+        self.stdout.write(f"서로이웃 {len(edges)}쌍, 대기 중인 신청 {len(requests)}건 생성")
+        return [len(u["neighbors"]) for u in users]
+
+    # ✅ 게시글 + 본문 + 이미지 (게시글은 좋아요/댓글 수를 채운 뒤 create_interactions에서 저장)
+    def create_posts(self, users, degrees, per_user):
+        total = int(len(users) * per_user)
+        weights = [degree + 1 for degree in degrees]
+        authors = self.rng.choices(range(len(users)), weights=weights, k=total)
+        images = self.sample_images()
+
+        post_start = self.next_id(Post)
+        posts, texts, post_images = [], [], []
+        for n, author in enumerate(authors):
+            roll = self.rng.random()
+            post = Post(
+                id=post_start + n,
+                author_id=users[author]["user_id"],
+                category=self.rng.choice(CATEGORIES),
+                subject=(subject := self.rng.choice(SUBJECTS)),
+                keyword=Post.keyword_for(subject),  # ✅ bulk_create는 save()를 거치지 않으므로 직접 설정
+                title=f"{self.rng.choice(SENTENCES)[:40]} #{n}",
+                visibility='everyone' if roll < 0.8 else 'mutual' if roll < 0.95 else 'me',
+                is_complete=self.rng.random() < 0.95,
+            )
+            posts.append((post, author, self.random_time()))
+            for _ in range(self.rng.randint(1, 3)):
+                texts.append(PostText(
+                    post_id=post.id, content=" ".join(self.rng.sample(SENTENCES, 3)),
+                    font_size=self.rng.choice(PostText.FONT_SIZE_CHOICES), is_bold=self.rng.random() < 0.1,
+                ))
+            for k in range(self.rng.choice([0, 1, 1, 2, 3])):
+                post_images.append(PostImage(post_id=post.id, image=self.rng.choice(images), is_representative=k == 0))
+
+        self.post_children = (texts, post_images)
+        return posts
+
+    # ✅ 댓글, 대댓글, 좋아요, 댓글 좋아요, 내 소식
+    def create_interactions(self, users, degrees, posts, comments_per_post, hearts_per_post):
+        cum_weights = list(accumulate(degree + 1 for degree in degrees))
+        comment_id = self.next_id(Comment)
+        heart_id = self.next_id(Heart)
+        comments, hearts, comment_hearts, notifications = [], [], [], []
+
+        for post, author, post_created_at in posts:
+            audience = self.audience(users, cum_weights, author, post.visibility) if post.is_complete else []
+
+            parents = []
+            for _ in range(self.poisson_like(comments_per_post) if audience else 0):
+                commenter = self.rng.choice(audience)
+                parent = self.rng.choice(parents) if parents and self.rng.random() < 0.3 else None
+                created_at = self.random_time(after=parent[1] if parent else post_created_at)
+                comment = Comment(
+                    id=comment_id, post_id=post.id, author_id=users[commenter]["profile_id"],
+                    author_name=f"사용자{commenter}", content=self.rng.choice(COMMENTS),
+                    parent_id=parent[0].id if parent else None, is_parent=parent is None,
+                    is_post_author=commenter == author, is_private=self.rng.random() < 0.05,
+                )
+                comment_id += 1
+                post.comment_count += 1
+                comments.append((comment, created_at))
+                if parent is None:
+                    parents.append((comment, created_at))
+                    if commenter != author:
+                        notifications.append(Notification(
+                            recipient_id=post.author_id, actor_id=users[commenter]["user_id"], type='post_comment',
+                            post_id=post.id, comment_id=comment.id, created_at=created_at,
+                        ))
+                elif parent[0].author_id != comment.author_id:
+                    notifications.append(Notification(
+                        recipient_id=users[self.user_index(users, parent[0].author_id)]["user_id"],
+                        actor_id=users[commenter]["user_id"], type='comment_reply',
+                        post_id=post.id, comment_id=comment.id, created_at=created_at,
+                    ))
+
+                for liker in self.rng.sample(audience, min(len(audience), self.rng.choice([0, 0, 1, 2]))):
+                    comment_hearts.append(CommentHeart(comment_id=comment.id, user_id=users[liker]["user_id"]))
+                    comment.like_count += 1
+
+            for liker in self.rng.sample(audience, min(len(audience), self.poisson_like(hearts_per_post))):
+                created_at = self.random_time(after=post_created_at)
+                hearts.append((Heart(id=heart_id, post_id=post.id, user_id=users[liker]["user_id"]), created_at))
+                notifications.append(Notification(
+                    recipient_id=post.author_id, actor_id=users[liker]["user_id"], type='post_like',
+                    post_id=post.id, heart_id=heart_id, created_at=created_at,
+                ))
+                heart_id += 1
+                post.like_count += 1
+
+        texts, post_images = self.post_children
+        Post.objects.bulk_create([post for post, _, _ in posts], batch_size=self.batch_size)
+        PostText.objects.bulk_create(texts, batch_size=self.batch_size)
+        PostImage.objects.bulk_create(post_images, batch_size=self.batch_size)
+        Comment.objects.bulk_create([comment for comment, _ in comments], batch_size=self.batch_size)
+        Heart.objects.bulk_create([heart for heart, _ in hearts], batch_size=self.batch_size)
+        CommentHeart.objects.bulk_create(comment_hearts, batch_size=self.batch_size)
+        Notification.objects.bulk_create(notifications, batch_size=self.batch_size)
+
+        # ✅ auto_now_add 필드는 bulk_create에서 현재 시각으로 덮어쓰므로 작성 시각을 다시 저장
+        self.backdate(Post, ['created_at', 'updated_at'], [(post, created_at) for post, _, created_at in posts])
+        self.backdate(Comment, ['created_at', 'updated_at'], comments)
+        self.backdate(Heart, ['created_at'], hearts)
+
+        self.stdout.write(
+            f"게시글 {len(posts)}개 (본문 {len(texts)}개, 이미지 {len(post_images)}개), 댓글/대댓글 {len(comments)}개, "
+            f"좋아요 {len(hearts)}개, 댓글 좋아요 {len(comment_hearts)}개, 내 소식 {len(notifications)}건 생성"
+        )
+
+    def backdate(self, model, fields, rows):
+        """ ✅ (객체, 시각) 목록을 UPDATE ... WHERE id = %s 한 문장으로 executemany (bulk_update의 CASE 식보다 빠름) """
+        quote = connection.ops.quote_name
+        assignments = ", ".join(f"{quote(field)} = %s" for field in fields)
+        sql = f"UPDATE {quote(model._meta.db_table)} SET {assignments} WHERE {quote('id')} = %s"
+        with connection.cursor() as cursor:
+            for start in range(0, len(rows), self.batch_size):
+                cursor.executemany(sql, [
+                    (*[connection.ops.adapt_datetimefield_value(created_at)] * len(fields), obj.id)
+                    for obj, created_at in rows[start:start + self.batch_size]
+                ])
+
+    def audience(self, users, cum_weights, author, visibility):
+        """ ✅ 게시글에 댓글/좋아요를 남길 수 있는 사용자 후보 (공개 범위 반영) """
+        if visibility == 'me':
+            return []
+        neighbors = list(users[author]["neighbors"])
+        if visibility == 'mutual':
+            return neighbors
+        others = self.rng.choices(range(len(users)), cum_weights=cum_weights, k=max(10, len(neighbors)))
+        return list((set(neighbors) | set(others)) - {author})
+
+    def user_index(self, users, profile_id):
+        return profile_id - users[0]["profile_id"]
+
+    def poisson_like(self, mean):
+        """ ✅ 평균이 mean인 지수 분포를 반올림 (대부분은 적고 일부 게시글에 몰림) """
+        return int(self.rng.expovariate(1 / mean)) if mean > 0 else 0
+
+    def random_time(self, after=None):
+        start = after or self.now - self.window
+        return start + (self.now - start) * self.rng.random()
+
+    def sample_images(self):
+        """ ✅ media/post_pics에 있는 이미지 경로 (없으면 기본 이미지) """
+        root = os.path.join(settings.MEDIA_ROOT, 'post_pics')
+        images = sorted(
+            os.path.relpath(os.path.join(path, name), settings.MEDIA_ROOT)
+            for path, _, names in os.walk(root) for name in names
+        )
+        return images or ['default/blog_default.jpg']
+
+    @staticmethod
+    def next_id(model):
+        """ ✅ 재현 가능한 ID를 직접 지정하기 위해 현재 최대 ID 다음 값부터 사용 """
+        return (model.objects.aggregate(max_id=Max('id'))['max_id'] or 0) + 1
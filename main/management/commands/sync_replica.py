@@ -0,0 +1,33 @@
+import sqlite3
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class Command(BaseCommand):
+    """
+    ✅ 로컬 SQLite 주 DB를 복제 DB 파일로 복사 (python manage.py sync_replica)
+    - naver_blog/settings_replica.py처럼 주/복제 DB가 모두 SQLite일 때 복제를 흉내내기 위한 명령
+    - 실제 복제 서버(MySQL 등)는 DB 자체 복제를 사용
+    """
+    help = "SQLite 주 DB의 내용을 복제 DB로 복사합니다 (로컬 확인용)."
+
+    def handle(self, *args, **options):
+        replicas = getattr(settings, 'DATABASE_REPLICAS', ())
+        if not replicas:
+            raise CommandError("settings.DATABASE_REPLICAS가 비어 있습니다.")
+
+        primary = connections[DEFAULT_DB_ALIAS]
+        for alias in [DEFAULT_DB_ALIAS, *replicas]:
+            if connections[alias].vendor != 'sqlite':
+                raise CommandError(f"'{alias}' DB가 SQLite가 아닙니다. 실제 복제 DB는 DB 서버의 복제 기능을 사용하세요.")
+
+        primary.ensure_connection()
+        for alias in replicas:
+            connections[alias].close()  # ✅ 복사하는 동안 열린 연결이 없도록
+            target = sqlite3.connect(connections[alias].settings_dict['NAME'])
+            try:
+                primary.connection.backup(target)  # ✅ sqlite 온라인 백업 API (쓰기 중에도 일관된 사본)
+            finally:
+                target.close()
+            self.stdout.write(self.style.SUCCESS(f"{DEFAULT_DB_ALIAS} → {alias} 복사 완료"))
@@ -0,0 +1,234 @@
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from django.conf import settings
+
+# ✅ 요청 지표 (뷰별 응답 시간, DB 쿼리 수/시간, 응답 크기) - Prometheus 텍스트 형식으로 노출
+# - 프로세스마다 메모리에서 집계 (스레드 잠금)
+# - 여러 워커로 운영할 때 METRICS_DIR을 설정하면 각 프로세스가 METRICS_FLUSH_SECONDS마다
+#   자신의 집계를 <pid>.json으로 저장하고, /metrics는 모든 파일을 합쳐서 응답
+# - 종료한 워커의 파일은 종료 시 삭제하고, 비정상 종료로 남은 파일은 합산에서 제외 후 삭제
+#   (죽은 워커의 게이지(해시 풀 대기열 등)가 계속 더해지지 않도록)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+HISTOGRAMS = {
+    "http_request_duration_seconds": ("뷰별 응답 시간 (초)", LATENCY_BUCKETS),
+    "http_request_db_queries": ("요청당 DB 쿼리 수", QUERY_COUNT_BUCKETS),
+    "http_request_db_seconds": ("요청당 DB 쿼리 시간 합계 (초)", LATENCY_BUCKETS),
+    "http_response_size_bytes": ("응답 본문 크기 (바이트, 스트리밍 응답 제외)", SIZE_BUCKETS),
+}
+COUNTERS = {
+    "http_requests_total": "뷰/메서드/상태 코드별 요청 수",
+}
+
+
+def component_metrics():
+    """ ✅ 요청 외 구성 요소의 지표 (비밀번호 해시 풀, 폐기 토큰 필터) - 워커별 값을 합산 """
+    from main.password_pool import get_password_pool
+    from main.revocation import revoked_tokens
+
+    values = {f"password_hash_pool_{key}": value for key, value in get_password_pool().metrics().items()}
+    values.update({f"revoked_token_filter_{key}_total": value for key, value in revoked_tokens.metrics().items()})
+    return values
+
+
+class QueryStats:
+    """ ✅ 한 요청 동안 실행된 쿼리 수와 시간 """
+    __slots__ = ('count', 'seconds')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+current_query_stats = ContextVar('current_query_stats', default=None)
+
+
+def query_wrapper(execute, sql, params, many, context):
+    """
+    ✅ connection.execute_wrapper로 모든 DB 연결에 설치
+    - 현재 요청의 QueryStats(contextvar)에 누적. async 뷰의 ORM 호출도 같은 컨텍스트로 실행되므로 함께 집계
+    """
+    stats = current_query_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.count += 1
+        stats.seconds += time.perf_counter() - started
+
+
+def install_query_wrapper(connection, **kwargs):
+    if query_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_wrapper)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {name: {} for name in HISTOGRAMS}
+        self._counters = {name: {} for name in COUNTERS}
+        self._flushed_at = time.monotonic()
+
+    def observe(self, name, labels, value):
+        buckets = HISTOGRAMS[name][1]
+        with self._lock:
+            series = self._histograms[name].get(labels)
+            if series is None:
+                series = self._histograms[name][labels] = {"buckets": [0] * (len(buckets) + 1), "sum": 0.0, "count": 0}
+            series["buckets"][bisect_left(buckets, value)] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def inc(self, name, labels, amount=1):
+        with self._lock:
+            self._counters[name][labels] = self._counters[name].get(labels, 0) + amount
+
+    def snapshot(self):
+        """ ✅ JSON으로 저장할 수 있는 형태 (라벨 튜플 → 리스트) """
+        with self._lock:
+            return {
+                "histograms": {
+                    name: [[list(labels), dict(series, buckets=list(series["buckets"]))] for labels, series in values.items()]
+                    for name, values in self._histograms.items()
+                },
+                "counters": {
+                    name: [[list(labels), value] for labels, value in values.items()]
+                    for name, values in self._counters.items()
+                },
+                "components": component_metrics(),
+            }
+
+    def maybe_flush(self):
+        """ ✅ METRICS_DIR이 설정된 경우 주기적으로 이 프로세스의 집계를 파일로 저장 """
+        directory = getattr(settings, 'METRICS_DIR', None)
+        if not directory or time.monotonic() - self._flushed_at < getattr(settings, 'METRICS_FLUSH_SECONDS', 5):
+            return
+        self._flushed_at = time.monotonic()
+        write_snapshot(directory, self.snapshot())
+
+
+registry = MetricsRegistry()
+
+
+_registered_cleanup = set()
+
+
+def write_snapshot(directory, snapshot):
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{os.getpid()}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(snapshot, f)
+    os.replace(tmp_path, path)  # ✅ 읽는 쪽이 쓰는 중인 파일을 보지 않도록 교체
+    if path not in _registered_cleanup:
+        _registered_cleanup.add(path)
+        atexit.register(_remove_file, path)  # ✅ 워커가 정상 종료하면 자신의 파일 삭제
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # ✅ 권한 없음 등 → 살아 있는 프로세스
+    return True
+
+
+def is_stale_snapshot(path, pid):
+    """
+    ✅ 종료한 워커가 남긴 파일인지
+    - METRICS_FLUSH_SECONDS의 3배 넘게 갱신되지 않았고, 해당 pid의 프로세스도 없으면 종료한 것으로 판단
+    - 요청이 없어 저장하지 않은 워커(pid 살아 있음)의 파일은 계속 합산 (카운터가 줄어들지 않도록)
+    """
+    max_age = getattr(settings, 'METRICS_FLUSH_SECONDS', 5) * 3
+    try:
+        if time.time() - os.path.getmtime(path) < max_age:
+            return False
+    except OSError:
+        return True
+    return not _pid_alive(pid)
+
+
+def collect_snapshots():
+    """ ✅ 이 프로세스 + (METRICS_DIR이 있으면) 다른 프로세스의 집계 """
+    snapshots = [registry.snapshot()]
+    directory = getattr(settings, 'METRICS_DIR', None)
+    if directory and os.path.isdir(directory):
+        own_pid = os.getpid()
+        for filename in os.listdir(directory):
+            pid = filename.removesuffix('.json')
+            if not filename.endswith('.json') or not pid.isdigit() or int(pid) == own_pid:
+                continue
+            path = os.path.join(directory, filename)
+            if is_stale_snapshot(path, int(pid)):
+                _remove_file(path)
+                continue
+            try:
+                with open(path) as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+    return snapshots
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    escaped = (f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"' for key, value in pairs)
+    return "{" + ",".join(escaped) + "}"
+
+
+def render_prometheus():
+    """ ✅ Prometheus 텍스트 형식 (version 0.0.4) """
+    histograms = {name: {} for name in HISTOGRAMS}
+    counters = {name: {} for name in COUNTERS}
+    components = {}
+    for snapshot in collect_snapshots():
+        for name, series_list in snapshot["histograms"].items():
+            for labels, series in series_list:
+                merged = histograms[name].setdefault(tuple(labels), {"buckets": [0] * len(series["buckets"]), "sum": 0.0, "count": 0})
+                merged["buckets"] = [a + b for a, b in zip(merged["buckets"], series["buckets"])]
+                merged["sum"] += series["sum"]
+                merged["count"] += series["count"]
+        for name, series_list in snapshot["counters"].items():
+            for labels, value in series_list:
+                counters[name][tuple(labels)] = counters[name].get(tuple(labels), 0) + value
+        for name, value in snapshot.get("components", {}).items():
+            components[name] = components.get(name, 0) + value
+
+    lines = []
+    for name, (description, buckets) in HISTOGRAMS.items():
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} histogram")
+        for labels, series in sorted(histograms[name].items()):
+            cumulative = 0
+            for bound, count in zip(list(buckets) + ["+Inf"], series["buckets"]):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(('view', 'method'), labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(('view', 'method'), labels)} {series['sum']}")
+            lines.append(f"{name}_count{_format_labels(('view', 'method'), labels)} {series['count']}")
+    for name, description in COUNTERS.items():
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} counter")
+        for labels, value in sorted(counters[name].items()):
+            lines.append(f"{name}{_format_labels(('view', 'method', 'status'), labels)} {value}")
+    for name, value in sorted(components.items()):
+        lines.append(f"# TYPE {name} {'counter' if name.endswith('_total') else 'gauge'}")
+        lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,159 @@
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connection
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+from main.metrics import current_query_stats, install_query_wrapper, registry, QueryStats
+
+try:
+    import brotli
+except ImportError:  # ✅ brotli가 없으면 gzip만 사용
+    brotli = None
+
+
+class RequestMetricsMiddleware:
+    """
+    ✅ 요청마다 응답 시간 / DB 쿼리 수·시간 / 응답 크기를 뷰(url name)별 히스토그램에 기록
+    - sync / async 요청 모두 지원 (async 뷰는 스레드 전환 없이 그대로 실행)
+    - 라벨은 URL 패턴 이름이라 경로 값(urlname, id 등)이 늘어나도 시계열 수가 늘지 않음
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        install_query_wrapper(connection)  # ✅ 시그널 등록 전에 열린 연결 대비
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_query_stats.reset(token)
+        record_request(request, response, time.perf_counter() - started, stats)
+        return response
+
+    async def __acall__(self, request):
+        stats = QueryStats()
+        token = current_query_stats.set(stats)  # ✅ sync_to_async로 실행되는 ORM 호출에도 전달됨
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_query_stats.reset(token)
+        record_request(request, response, time.perf_counter() - started, stats)
+        return response
+
+
+def record_request(request, response, elapsed, stats):
+    match = getattr(request, 'resolver_match', None)
+    view = (match.url_name or match.view_name) if match else 'unmatched'
+    labels = (view or 'unnamed', request.method)
+
+    registry.observe("http_request_duration_seconds", labels, elapsed)
+    registry.observe("http_request_db_queries", labels, stats.count)
+    registry.observe("http_request_db_seconds", labels, stats.seconds)
+    if not response.streaming:
+        registry.observe("http_response_size_bytes", labels, len(response.content))
+    registry.inc("http_requests_total", labels + (str(response.status_code),))
+    registry.maybe_flush()
+
+
+# ✅ 응답 압축
+# - 압축할 만한 형식(JSON, 텍스트)이고 COMPRESSION_MIN_SIZE 이상인 응답만 압축 (작은 응답은 압축 비용이 더 큼)
+# - Accept-Encoding의 q 값을 따라 br(brotli 설치 시) > gzip 순으로 선택
+# - gzip은 Django GZipMiddleware와 같은 방식 (BREACH 완화용 임의 헤더 바이트 포함)
+# - 스트리밍 응답(SSE 등)은 압축하지 않음 (이벤트가 버퍼에 묶이지 않도록)
+COMPRESSIBLE_TYPES = ('text/',)
+COMPRESSIBLE_SUFFIXES = ('json', 'xml', 'javascript')  # ✅ application/json, application/openapi+json, image/svg+xml 등
+BROTLI_QUALITY = 5  # ✅ 0~11, 동적 응답은 속도와 압축률 균형이 맞는 중간 값
+GZIP_MAX_RANDOM_BYTES = 100
+
+
+def negotiate_encoding(accept_encoding):
+    """ ✅ Accept-Encoding 헤더에서 사용할 압축 방식 ('br', 'gzip', 없으면 None) """
+    accepted = {}
+    for item in accept_encoding.split(','):
+        name, _, params = item.partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    wildcard = accepted.get('*', 0.0)
+    encoding, best = None, 0.0
+    for name in (('br', 'gzip') if brotli else ('gzip',)):  # ✅ q 값이 같으면 앞쪽(압축률이 좋은 쪽) 우선
+        quality = accepted.get(name, wildcard)
+        if quality > best:
+            encoding, best = name, quality
+    return encoding
+
+
+def compress(content, encoding):
+    if encoding == 'br':
+        return brotli.compress(content, quality=BROTLI_QUALITY)
+    return compress_string(content, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+
+
+class CompressionMiddleware:
+    """
+    ✅ 일정 크기 이상의 API 응답을 br / gzip으로 압축 (settings.COMPRESSION_MIN_SIZE, 기본 1024바이트)
+    - sync / async 요청 모두 지원
+    - 압축 결과가 원본보다 크거나 같으면 원본 그대로 응답
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if not (content_type.startswith(COMPRESSIBLE_TYPES) or content_type.endswith(COMPRESSIBLE_SUFFIXES)):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if len(response.content) < self.min_size:
+            return response
+
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        compressed = compress(response.content, encoding)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers['Content-Length'] = str(len(compressed))
+        # ✅ 강한 ETag는 약한 ETag로 (압축 전후 바이트가 다름, RFC 9110 8.8.1)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-19 00:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0024_delete_user_alter_customuser_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'parent', 'created_at'], name='comment_thread_idx'),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.1.6 on 2026-10-19 00:38
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_notifications(apps, schema_editor):
+    """ ✅ 기존 댓글/대댓글/좋아요로 내 소식(Notification) 채우기 """
+    Comment = apps.get_model('main', 'Comment')
+    Heart = apps.get_model('main', 'Heart')
+    Notification = apps.get_model('main', 'Notification')
+
+    batch = []
+
+    def flush():
+        Notification.objects.bulk_create(batch, batch_size=1000)
+        batch.clear()
+
+    comments = Comment.objects.values(
+        'id', 'post_id', 'post__author_id', 'author__user_id', 'parent_id', 'parent__author__user_id',
+        'is_read', 'created_at',
+    )
+    for row in comments.iterator(chunk_size=2000):
+        actor_id = row['author__user_id']
+        post_author_id = row['post__author_id']
+        common = dict(actor_id=actor_id, post_id=row['post_id'], comment_id=row['id'],
+                      is_read=row['is_read'], created_at=row['created_at'])
+
+        if post_author_id != actor_id:
+            batch.append(Notification(recipient_id=post_author_id, type='post_comment', **common))
+
+        parent_author_id = row['parent__author__user_id']
+        if row['parent_id'] and parent_author_id not in (actor_id, post_author_id):
+            batch.append(Notification(recipient_id=parent_author_id, type='comment_reply', **common))
+
+        if len(batch) >= 1000:
+            flush()
+
+    hearts = Heart.objects.values('id', 'post_id', 'post__author_id', 'user_id', 'is_read', 'created_at')
+    for row in hearts.iterator(chunk_size=2000):
+        if row['post__author_id'] == row['user_id']:
+            continue
+        batch.append(Notification(
+            recipient_id=row['post__author_id'], actor_id=row['user_id'], type='post_like', post_id=row['post_id'],
+            heart_id=row['id'], is_read=row['is_read'], created_at=row['created_at'],
+        ))
+        if len(batch) >= 1000:
+            flush()
+
+    flush()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0025_comment_thread_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(choices=[('post_comment', '내 게시글에 달린 댓글'), ('comment_reply', '내 댓글에 달린 대댓글'), ('post_like', '내 게시글에 달린 좋아요')], max_length=20)),
+                ('is_read', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('actor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('comment', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='main.comment')),
+                ('heart', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='main.heart')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='main.post')),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['recipient', 'is_read', 'created_at'], name='notification_inbox_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_notifications, migrations.RunPython.noop),
+    ]
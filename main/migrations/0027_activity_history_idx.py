@@ -0,0 +1,28 @@
+# Generated by Django 5.1.6 on 2026-10-19 00:42
+
+from django.db import migrations, models
+
+
+def fix_reply_is_parent(apps, schema_editor):
+    """ ✅ API로 작성된 대댓글의 is_parent가 True로 저장되어 있던 데이터 정리 """
+    Comment = apps.get_model('main', 'Comment')
+    Comment.objects.filter(parent__isnull=False, is_parent=True).update(is_parent=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0026_notification'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['author', 'created_at'], name='comment_author_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='heart',
+            index=models.Index(fields=['user', 'created_at'], name='heart_user_created_idx'),
+        ),
+        migrations.RunPython(fix_reply_is_parent, migrations.RunPython.noop),
+    ]
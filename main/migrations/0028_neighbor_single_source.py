@@ -0,0 +1,47 @@
+from django.db import migrations
+
+
+def consolidate_neighbor_graph(apps, schema_editor):
+    """
+    ✅ 서로이웃 관계를 Profile.neighbors 하나로 통합
+    - 기존에 게시글 공개 범위 판단에 쓰이던 `accepted` 신청 내역을 기준으로 관계 테이블을 맞춤
+      (서로이웃 삭제 시 신청 내역만 지워지고 남아 있던 관계는 제거, 빠진 방향은 추가)
+    - 처리가 끝난 `accepted`/`rejected` 신청 내역은 삭제 (Neighbor에는 대기 중인 신청만 남김)
+    """
+    Neighbor = apps.get_model('main', 'Neighbor')
+    Profile = apps.get_model('main', 'Profile')
+    NeighborEdge = Profile.neighbors.through
+
+    profile_ids = dict(Profile.objects.values_list('user_id', 'id'))
+    expected = set()
+    for from_user_id, to_user_id in Neighbor.objects.filter(status='accepted').values_list('from_user_id', 'to_user_id'):
+        from_profile_id, to_profile_id = profile_ids.get(from_user_id), profile_ids.get(to_user_id)
+        if from_profile_id and to_profile_id and from_profile_id != to_profile_id:
+            expected.add((from_profile_id, to_profile_id))
+            expected.add((to_profile_id, from_profile_id))
+
+    existing = {}
+    for edge_id, from_profile_id, to_profile_id in NeighborEdge.objects.values_list('id', 'from_profile_id', 'to_profile_id'):
+        existing[(from_profile_id, to_profile_id)] = edge_id
+
+    stale_ids = [edge_id for pair, edge_id in existing.items() if pair not in expected]
+    for start in range(0, len(stale_ids), 500):
+        NeighborEdge.objects.filter(id__in=stale_ids[start:start + 500]).delete()
+
+    NeighborEdge.objects.bulk_create(
+        [NeighborEdge(from_profile_id=a, to_profile_id=b) for a, b in expected if (a, b) not in existing],
+        batch_size=500,
+    )
+
+    Neighbor.objects.exclude(status='pending').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0027_activity_history_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(consolidate_neighbor_graph, migrations.RunPython.noop),
+    ]
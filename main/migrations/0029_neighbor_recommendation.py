@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6 on 2026-10-19 00:49
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0028_neighbor_single_source'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NeighborRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('mutual_count', models.PositiveIntegerField(default=0)),
+                ('shared_author_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='main.profile')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='neighbor_recommendations', to='main.profile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['profile', '-score'], name='recommendation_profile_idx')],
+                'unique_together': {('profile', 'candidate')},
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-19 00:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0029_neighbor_recommendation'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='neighbor',
+            index=models.Index(fields=['to_user', 'status', 'created_at'], name='neighbor_inbox_idx'),
+        ),
+    ]
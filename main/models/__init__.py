@@ -4,4 +4,6 @@ from .post import Post,PostText,PostImage
 from .comment import Comment
 from .heart import Heart
 from .commentHeart import CommentHeart
-from .neighbor import Neighbor
\ No newline at end of file
+from .neighbor import Neighbor
+from .notification import Notification
+from .recommendation import NeighborRecommendation
@@ -17,7 +17,8 @@ class Comment(models.Model):
     is_read = models.BooleanField(default=False)  # 읽음 상태 필드 추가
 
     def save(self, *args, **kwargs):
-        """ ✅ 게시글 작성자 여부 자동 설정 """
+        """ ✅ 게시글 작성자 여부, 댓글/대댓글 여부 자동 설정 """
+        self.is_parent = self.parent_id is None  # ✅ 부모 댓글이 있으면 대댓글
         if hasattr(self.post.author, 'profile'):
             self.is_post_author = self.author == self.post.author.profile  # ✅ Profile과 Profile 비교
         else:
@@ -40,6 +41,12 @@ class Comment(models.Model):
     class Meta:
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
+        indexes = [
+            # ✅ 게시글별 부모 댓글 / 부모 댓글별 대댓글을 작성순으로 커서 페이지네이션
+            models.Index(fields=['post', 'parent', 'created_at'], name='comment_thread_idx'),
+            # ✅ 내 활동 (내가 쓴 댓글/대댓글 최신순)
+            models.Index(fields=['author', 'created_at'], name='comment_author_created_idx'),
+        ]
 
 
 
@@ -1,8 +1,9 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from main.models.profile import Profile  # Profile 모델 import
+from main.models.tracker import FieldTrackerMixin
 
-class Neighbor(models.Model):
+class Neighbor(FieldTrackerMixin, models.Model):
     from_user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -27,26 +28,95 @@ class Neighbor(models.Model):
 
     class Meta:
         unique_together = ('from_user', 'to_user')  # ✅ 중복 신청 방지
+        indexes = [
+            # ✅ 받은 서로이웃 신청 목록: to_user + 대기 중 + 최신순
+            models.Index(fields=['to_user', 'status', 'created_at'], name='neighbor_inbox_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         """
-        ✅ 서로이웃 요청이 `accepted`로 변경되면 Profile의 neighbors 관계에 반영.
+        ✅ 서로이웃 요청이 `accepted`로 변경되면 서로이웃 관계(Profile.neighbors)에 추가하고 신청 내역은 삭제.
         ✅ 서로이웃 요청이 `rejected`면 신청 내역을 자동으로 삭제.
+        ✅ status가 바뀐 경우에만 처리 (읽어온 시점의 스냅샷과 비교, 추가 SELECT 없음)
+        - 서로이웃 관계는 Profile.neighbors 하나에만 저장하고, Neighbor는 대기 중인 신청만 보관
         """
+        status_changed = self.has_changed('status')
         super().save(*args, **kwargs)
 
+        if not status_changed:
+            return
+
         if self.status == 'accepted':
             # ✅ Profile이 없는 경우 자동 생성
-            from_profile, _ = Profile.objects.get_or_create(user=self.from_user)
-            to_profile, _ = Profile.objects.get_or_create(user=self.to_user)
-
-            # ✅ 중복 추가 방지
-            if not from_profile.neighbors.filter(id=to_profile.id).exists():
-                from_profile.neighbors.add(to_profile)
-                to_profile.neighbors.add(from_profile)
+            from_profile, _ = Profile.objects.get_or_create(user_id=self.from_user_id)
+            to_profile, _ = Profile.objects.get_or_create(user_id=self.to_user_id)
+            add_neighbor(from_profile, to_profile)
+            self.delete()
 
         elif self.status == 'rejected':  # ✅ 거절된 요청 자동 삭제
             self.delete()
 
     def __str__(self):
-        return f"{self.from_user} → {self.to_user} ({self.status})"
\ No newline at end of file
+        return f"{self.from_user} → {self.to_user} ({self.status})"
+
+
+# ✅ 서로이웃 관계 (Profile.neighbors의 중간 테이블)
+# - 대칭(symmetrical) 관계라 (A, B), (B, A) 두 방향을 모두 저장
+# - (from_profile, to_profile) unique 인덱스 하나로 "A와 B가 서로이웃인가", "A의 서로이웃 목록"을 모두 조회
+NeighborEdge = Profile.neighbors.through
+
+
+def are_neighbors(profile_id, other_profile_id):
+    """ ✅ 두 프로필이 서로이웃인지 (인덱스 한 번 조회) """
+    return NeighborEdge.objects.filter(from_profile_id=profile_id, to_profile_id=other_profile_id).exists()
+
+
+async def aare_neighbors(profile_id, other_profile_id):
+    return await NeighborEdge.objects.filter(from_profile_id=profile_id, to_profile_id=other_profile_id).aexists()
+
+
+def neighbor_user_ids(profile_id):
+    """ ✅ 서로이웃들의 사용자 ID (게시글 author_id 필터에 서브쿼리로 사용) """
+    return NeighborEdge.objects.filter(from_profile_id=profile_id).values('to_profile__user_id')
+
+
+def add_neighbor(profile, other_profile):
+    """ ✅ 서로이웃 관계 추가 (두 방향 모두 저장, 이미 있으면 무시) """
+    profile.neighbors.add(other_profile)
+
+
+def remove_neighbor(profile, other_profile):
+    """ ✅ 서로이웃 관계 삭제 (두 방향 모두 삭제, other_profile은 Profile 또는 profile id) """
+    profile.neighbors.remove(other_profile)
+
+
+def settle_neighbor_requests(user, from_urlnames, accept):
+    """
+    ✅ 받은 서로이웃 신청 여러 건을 한 번에 수락/거절
+    - 한 트랜잭션 안에서 신청 조회 1번 + 관계 INSERT 1번(양방향) + 신청 DELETE로 처리 (신청 수와 무관)
+    - 수락하면 내가 상대에게 보낸 대기 중 신청도 함께 정리
+    - 처리한 신청자의 urlname 목록 반환
+    """
+    with transaction.atomic():
+        requests = list(
+            Neighbor.objects.select_for_update(of=('self',)).filter(
+                to_user=user, status='pending', from_user__profile__urlname__in=from_urlnames
+            ).values_list('id', 'from_user_id', 'from_user__profile__id', 'from_user__profile__urlname')
+        )
+        if not requests:
+            return []
+
+        if accept:
+            my_profile_id = user.profile.id
+            edges = []
+            for _, _, from_profile_id, _ in requests:
+                edges.append(NeighborEdge(from_profile_id=my_profile_id, to_profile_id=from_profile_id))
+                edges.append(NeighborEdge(from_profile_id=from_profile_id, to_profile_id=my_profile_id))
+            NeighborEdge.objects.bulk_create(edges, ignore_conflicts=True)
+            Neighbor.objects.filter(
+                from_user=user, to_user_id__in=[from_user_id for _, from_user_id, _, _ in requests], status='pending'
+            ).delete()
+
+        Neighbor.objects.filter(id__in=[request_id for request_id, _, _, _ in requests]).delete()
+
+    return [urlname for _, _, _, urlname in requests]
@@ -0,0 +1,44 @@
+from django.db import models
+from django.conf import settings
+from django.utils import timezone
+from main.models.post import Post
+from main.models.comment import Comment
+from main.models.heart import Heart
+
+
+class Notification(models.Model):
+    """
+    ✅ 내 소식 (내 게시글에 달린 댓글/좋아요, 내 댓글에 달린 대댓글)
+    - 댓글, 대댓글, 좋아요가 생성될 때 시그널에서 한 행씩 기록
+    - 원본(댓글/좋아요)이 삭제되면 함께 삭제
+    """
+    TYPE_CHOICES = [
+        ('post_comment', '내 게시글에 달린 댓글'),
+        ('comment_reply', '내 댓글에 달린 대댓글'),
+        ('post_like', '내 게시글에 달린 좋아요'),
+    ]
+
+    recipient = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='notifications')  # ✅ 소식을 받는 사용자
+    actor = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')  # ✅ 댓글/좋아요를 남긴 사용자
+    type = models.CharField(max_length=20, choices=TYPE_CHOICES)
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='+')
+    comment = models.ForeignKey(Comment, on_delete=models.CASCADE, null=True, blank=True, related_name='notifications')
+    heart = models.ForeignKey(Heart, on_delete=models.CASCADE, null=True, blank=True, related_name='notifications')
+    is_read = models.BooleanField(default=False)
+    created_at = models.DateTimeField(default=timezone.now)  # ✅ 원본 댓글/좋아요의 생성 시각을 그대로 사용
+
+    class Meta:
+        indexes = [
+            # ✅ 내 소식 목록: recipient + 안 읽음 + 최신순
+            models.Index(fields=['recipient', 'is_read', 'created_at'], name='notification_inbox_idx'),
+        ]
+
+    @property
+    def activity_id(self):
+        """ ✅ 기존 내 소식 API와 동일한 형식의 ID (comment_xx / heart_xx) """
+        if self.comment_id:
+            return f"comment_{self.comment_id}"
+        return f"heart_{self.heart_id}"
+
+    def __str__(self):
+        return f"{self.actor_id} → {self.recipient_id} ({self.type})"
@@ -47,6 +47,15 @@ class Post(models.Model):
         ('false', '임시 저장'),
     ]
 
+    # ✅ subject → keyword 자동 분류
+    KEYWORD_MAPPING = {
+        "엔터테인먼트/예술": ["문학·책", "영화", "미술·디자인", "공연·전시", "음악", "드라마", "스타·연예인", "만화·애니", "방송"],
+        "생활/노하우/쇼핑": ["일상·생각", "육아·결혼", "반려동물", "좋은글·이미지", "패션·미용", "인테리어/DIY", "요리·레시피", "상품리뷰", "원예/재배"],
+        "취미/여가/여행": ["게임", "스포츠", "사진", "자동차", "취미", "국내여행", "세계여행", "맛집"],
+        "지식/동향": ["IT/컴퓨터", "사회/정치", "건강/의학", "비즈니스/경제", "어학/외국어", "교육/학문"],
+        "default": ["주제 선택 안 함"],
+    }
+
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="posts")
     category = models.CharField(max_length=50, default='게시판', null=True)
     subject = models.CharField(max_length=50, choices=SUBJECT_CHOICES, default="주제 선택 안 함")
@@ -74,17 +83,14 @@ class Post(models.Model):
             self.category = '게시판'
 
         """ subject 값에 따라 keyword 자동 설정 """
-        keyword_mapping = {
-            "엔터테인먼트/예술": ["문학·책", "영화", "미술·디자인", "공연·전시", "음악", "드라마", "스타·연예인", "만화·애니", "방송"],
-            "생활/노하우/쇼핑": ["일상·생각", "육아·결혼", "반려동물", "좋은글·이미지", "패션·미용", "인테리어/DIY", "요리·레시피", "상품리뷰", "원예/재배"],
-            "취미/여가/여행": ["게임", "스포츠", "사진", "자동차", "취미", "국내여행", "세계여행", "맛집"],
-            "지식/동향": ["IT/컴퓨터", "사회/정치", "건강/의학", "비즈니스/경제", "어학/외국어", "교육/학문"],
-            "default": ["주제 선택 안 함"],
-        }
-        self.keyword = next((key for key, values in keyword_mapping.items() if self.subject in values),
-                                     "default")
+        self.keyword = self.keyword_for(self.subject)
         super().save(*args, **kwargs)
 
+    @classmethod
+    def keyword_for(cls, subject):
+        """ ✅ subject가 속한 keyword (save()를 거치지 않는 bulk_create에서도 사용) """
+        return next((key for key, values in cls.KEYWORD_MAPPING.items() if subject in values), "default")
+
     def __str__(self):
         return f"{self.category} / {self.title} / {dict(self.COMPLETE_CHOICES).get(self.is_complete)}"
 
@@ -1,6 +1,6 @@
 from django.db import models
 from django.conf import settings
-import os
+from main.models.tracker import FieldTrackerMixin
 
 
 # ✅ 업로드 경로 처리 함수
@@ -12,7 +12,7 @@ def user_pic_upload_path(instance, filename):
     return f"user_pics/{instance.user.id}/{filename}"
 
 
-class Profile(models.Model):
+class Profile(FieldTrackerMixin, models.Model):
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -40,24 +40,24 @@ class Profile(models.Model):
     def save(self, *args, **kwargs):
         """
         ✅ 프로필 사진 변경 시 기존 파일 삭제 (중복 저장 방지)
+        - 변경 전 파일 이름은 읽어올 때 저장한 스냅샷(FieldTrackerMixin)에서 가져오므로 추가 SELECT 없음
         """
-        if self.pk:
-            old_instance = Profile.objects.get(pk=self.pk)
-
+        if not self._state.adding:
             # ✅ 기존 블로그 프로필 사진 삭제
-            if old_instance.blog_pic and old_instance.blog_pic != self.blog_pic:
-                if old_instance.blog_pic.name != 'default/blog_default.jpg':
-                    if os.path.isfile(old_instance.blog_pic.path):
-                        os.remove(old_instance.blog_pic.path)
+            if self.has_changed('blog_pic'):
+                self._remove_old_pic('blog_pic', 'default/blog_default.jpg')
 
             # ✅ 기존 사용자 프로필 사진 삭제
-            if old_instance.user_pic and old_instance.user_pic != self.user_pic:
-                if old_instance.user_pic.name != 'default/user_default.jpg':
-                    if os.path.isfile(old_instance.user_pic.path):
-                        os.remove(old_instance.user_pic.path)
+            if self.has_changed('user_pic'):
+                self._remove_old_pic('user_pic', 'default/user_default.jpg')
 
         super().save(*args, **kwargs)
 
+    def _remove_old_pic(self, field_name, default_name):
+        old_name = self.get_loaded_value(field_name)
+        if old_name and old_name != default_name:
+            getattr(self, field_name).storage.delete(old_name)
+
     def delete(self, *args, **kwargs):
         """
         ✅ Profile 삭제 방지
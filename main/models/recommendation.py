@@ -0,0 +1,27 @@
+from django.db import models
+from django.utils import timezone
+from main.models.profile import Profile
+
+
+class NeighborRecommendation(models.Model):
+    """
+    ✅ 알 수도 있는 이웃 (배치 작업으로 미리 계산한 사용자별 추천 상위 K명)
+    - `python manage.py build_neighbor_recommendations`가 주기적으로 다시 채움
+    - score = 함께 아는 서로이웃 수 + 같은 작성자에게 남긴 공감/댓글 겹침 (가중치는 main/recommendations.py)
+    """
+    profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='neighbor_recommendations')  # ✅ 추천을 받는 사용자
+    candidate = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='+')  # ✅ 추천된 사용자
+    score = models.FloatField()
+    mutual_count = models.PositiveIntegerField(default=0)  # ✅ 함께 아는 서로이웃 수
+    shared_author_count = models.PositiveIntegerField(default=0)  # ✅ 둘 다 공감/댓글을 남긴 작성자 수
+    created_at = models.DateTimeField(default=timezone.now)  # ✅ 계산 시각
+
+    class Meta:
+        unique_together = ('profile', 'candidate')
+        indexes = [
+            # ✅ 내 추천 목록: 점수 높은 순
+            models.Index(fields=['profile', '-score'], name='recommendation_profile_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.profile_id} → {self.candidate_id} ({self.score})"
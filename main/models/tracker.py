@@ -0,0 +1,78 @@
+from django.db.models.fields.files import FieldFile
+
+
+class FieldTrackerMixin:
+    """
+    ✅ DB에서 읽어온 시점의 필드 값을 보관하여, 저장 시 추가 SELECT 없이 변경 여부를 판단하는 Mixin
+    - `from_db()`에서 스냅샷을 만들고, `save()`가 끝나면 현재 값으로 스냅샷을 갱신
+    - post_save 시그널은 `save()` 내부에서 실행되므로 시그널에서도 변경 전 값과 비교할 수 있음
+    - 사용 예: `class Profile(FieldTrackerMixin, models.Model)`
+    """
+    tracked_fields = None  # ✅ None이면 모든 concrete field 추적
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = instance._snapshot_values()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        self._loaded_values = {**self._loaded_values, **self._snapshot_values(update_fields)}
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._loaded_values = {**self._loaded_values, **self._snapshot_values(kwargs.get('fields'))}
+
+    @property
+    def _loaded_values(self):
+        return self.__dict__.get('_tracker_loaded_values', {})
+
+    @_loaded_values.setter
+    def _loaded_values(self, values):
+        self.__dict__['_tracker_loaded_values'] = values
+
+    def _tracked_field_names(self):
+        if self.tracked_fields is not None:
+            return self.tracked_fields
+        return [field.name for field in self._meta.concrete_fields]
+
+    def _snapshot_values(self, field_names=None):
+        """ ✅ 현재 메모리에 로드된 값만 스냅샷 (deferred 필드는 조회하지 않음) """
+        snapshot = {}
+        names = self._tracked_field_names()
+        if field_names is not None:
+            names = [name for name in names if name in field_names]
+
+        for name in names:
+            attname = self._meta.get_field(name).attname
+            if attname in self.__dict__:
+                snapshot[name] = self._normalize(self.__dict__[attname])
+        return snapshot
+
+    @staticmethod
+    def _normalize(value):
+        """ ✅ 파일 필드는 FieldFile 대신 저장된 파일 이름으로 비교 """
+        if isinstance(value, FieldFile):
+            return value.name
+        return value
+
+    def get_loaded_value(self, name, default=None):
+        """ ✅ DB에서 읽어온 시점의 값 (새 인스턴스이거나 로드되지 않은 필드는 default) """
+        return self._loaded_values.get(name, default)
+
+    def has_changed(self, name):
+        """ ✅ 읽어온 뒤 값이 바뀌었는지 여부 (알 수 없는 경우에는 변경된 것으로 간주) """
+        if self._state.adding or name not in self._loaded_values:
+            return True
+        current = self._normalize(getattr(self, self._meta.get_field(name).attname))
+        return current != self._loaded_values[name]
+
+    def get_changed_fields(self):
+        """ ✅ 변경된 필드 이름 → 변경 전 값 """
+        return {
+            name: self._loaded_values.get(name)
+            for name in self._tracked_field_names()
+            if self.has_changed(name)
+        }
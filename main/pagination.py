@@ -0,0 +1,208 @@
+import base64
+import heapq
+import json
+from datetime import datetime
+from itertools import islice
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, CursorPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CommentCursorPagination(CursorPagination):
+    """
+    ✅ 댓글/대댓글 목록용 커서 페이지네이션 (작성순)
+    - OFFSET 없이 (post, parent, created_at) 인덱스를 따라 다음 페이지를 조회
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('created_at', 'id')
+
+
+class NewsCursorPagination(CursorPagination):
+    """
+    ✅ 내 소식 목록용 커서 페이지네이션 (최신순)
+    - (recipient, is_read, created_at) 인덱스를 역순으로 따라 조회
+    """
+    page_size = 5
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+    ordering = ('-created_at', '-id')
+
+
+class NeighborCursorPagination(CursorPagination):
+    """
+    ✅ 서로이웃 목록용 커서 페이지네이션
+    - 인접 리스트(from_profile, to_profile) 인덱스를 프로필 ID 순으로 따라 조회
+    """
+    page_size = 30
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('id',)
+
+
+class NeighborRequestCursorPagination(CursorPagination):
+    """
+    ✅ 받은 서로이웃 신청 목록용 커서 페이지네이션 (최신순)
+    - (to_user, status, created_at) 인덱스를 역순으로 따라 조회
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+
+
+class MergedCursorPagination(BasePagination):
+    """
+    ✅ 여러 테이블의 행을 최신순으로 합쳐 보여주는 목록용 커서 페이지네이션 (k-way merge)
+    - 테이블마다 (created_at, id) keyset 조건 + LIMIT으로 인덱스를 따라 최대 page_size + 1건만 조회
+    - heapq.merge로 합친 뒤 page_size건 반환 (페이지 크기만큼만 읽으므로 오래된 페이지도 비용이 같음)
+    - 커서: (created_at, source, id) 를 base64로 인코딩
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = '유효하지 않은 커서입니다.'
+
+    def paginate_sources(self, request, sources):
+        """ ✅ sources: {source 이름: created_at/id 필드를 가진 queryset} """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        streams = []
+        for source, queryset in sources.items():
+            if position is not None:
+                queryset = queryset.filter(self._after(position, source))
+            rows = queryset.order_by('-created_at', '-id')[:self.page_size + 1]
+            streams.append([(obj.created_at, source, obj.id, obj) for obj in rows])
+
+        merged = list(islice(
+            heapq.merge(*streams, key=lambda row: row[:3], reverse=True), self.page_size + 1
+        ))
+        page = merged[:self.page_size]
+        self.next_position = page[-1][:3] if len(merged) > self.page_size else None
+        return [row[3] for row in page]
+
+    def get_paginated_response(self, data):
+        next_link = None
+        if self.next_position is not None:
+            next_link = replace_query_param(
+                self.request.build_absolute_uri(), self.cursor_query_param, self.encode_cursor(self.next_position)
+            )
+        return Response({'next': next_link, 'results': data})
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size > 0:
+                return min(page_size, self.max_page_size)
+        except (KeyError, ValueError):
+            pass
+        return self.page_size
+
+    @staticmethod
+    def _after(position, source):
+        """ ✅ (created_at, source, id)가 커서보다 뒤(과거)인 행 """
+        created_at, cursor_source, cursor_id = position
+        condition = Q(created_at__lt=created_at)
+        if source < cursor_source:
+            condition |= Q(created_at=created_at)
+        elif source == cursor_source:
+            condition |= Q(created_at=created_at, id__lt=cursor_id)
+        return condition
+
+    def encode_cursor(self, position):
+        created_at, source, obj_id = position
+        raw = json.dumps([created_at.isoformat(), source, obj_id])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            created_at, source, obj_id = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            return datetime.fromisoformat(created_at), str(source), int(obj_id)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class AsyncKeysetPagination:
+    """
+    ✅ async 뷰용 커서 페이지네이션 ((created_at, id) keyset, 다음 페이지 링크만 제공)
+    - DRF 페이지네이션은 동기 조회(list(queryset[...]))라 async 뷰에서 사용할 수 없음
+    - 커서 조건 + LIMIT page_size + 1 한 번으로 인덱스를 따라 조회 (async for)
+    - 커서: (created_at, id) 를 base64로 인코딩
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    descending = True
+    invalid_cursor_message = CursorPagination.invalid_cursor_message  # ✅ DRF와 같은 오류 메시지
+
+    async def apaginate_queryset(self, queryset, request):
+        self.request = request
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+        if position is not None:
+            created_at, obj_id = position
+            if self.descending:
+                queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=obj_id))
+            else:
+                queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=obj_id))
+
+        ordering = ('-created_at', '-id') if self.descending else ('created_at', 'id')
+        rows = [obj async for obj in queryset.order_by(*ordering)[:page_size + 1]]
+        page = rows[:page_size]
+        self.next_position = (page[-1].created_at, page[-1].id) if len(rows) > page_size else None
+        return page
+
+    def get_paginated_data(self, data):
+        next_link = None
+        if self.next_position is not None:
+            next_link = replace_query_param(
+                self.request.build_absolute_uri(), self.cursor_query_param, self.encode_cursor(self.next_position)
+            )
+        return {'next': next_link, 'results': data}
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.GET[self.page_size_query_param])
+            if page_size > 0:
+                return min(page_size, self.max_page_size)
+        except (KeyError, ValueError):
+            pass
+        return self.page_size
+
+    def encode_cursor(self, position):
+        created_at, obj_id = position
+        raw = json.dumps([created_at.isoformat(), obj_id])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.GET.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            created_at, obj_id = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            return datetime.fromisoformat(created_at), int(obj_id)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class AsyncCommentPagination(AsyncKeysetPagination):
+    """ ✅ CommentCursorPagination의 async 버전 (작성순) """
+    page_size = 20
+    max_page_size = 100
+    descending = False
+
+
+class AsyncNewsPagination(AsyncKeysetPagination):
+    """ ✅ NewsCursorPagination의 async 버전 (최신순) """
+    page_size = 5
+    max_page_size = 50
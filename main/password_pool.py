@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, identify_hasher, is_password_usable, make_password
+
+# ✅ 비밀번호 해시 전용 스레드 풀 (ASGI 로그인용)
+# - PBKDF2 한 번에 수십 ms의 CPU를 쓰므로 이벤트 루프에서 직접 돌리지 않고 풀에서 실행
+# - hashlib.pbkdf2_hmac은 계산 중 GIL을 놓기 때문에 스레드 풀로도 여러 코어를 사용
+# - 대기 + 실행 중인 작업이 PASSWORD_HASH_MAX_PENDING을 넘으면 바로 거절 (로그인 폭주가 다른 요청을 밀어내지 않도록)
+# - 큐 길이/처리량/대기 시간은 metrics()로 조회
+
+
+class PasswordPoolBusy(Exception):
+    """ ✅ 해시 대기열이 가득 참 """
+
+
+class PasswordHashPool:
+    def __init__(self, max_workers, max_pending):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = None
+        self._lock = threading.Lock()
+        self.pending = 0  # ✅ 대기 + 실행 중
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0  # ✅ 큐에서 기다린 시간 합계
+        self.run_seconds_total = 0.0  # ✅ 해시 계산에 걸린 시간 합계
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='password-hash')
+            return self._executor
+
+    async def run(self, func, *args):
+        """ ✅ func(*args)를 풀에서 실행하고 결과를 기다림 (대기열이 가득 차면 PasswordPoolBusy) """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordPoolBusy()
+            self.pending += 1
+        submitted = time.monotonic()
+
+        def job():
+            started = time.monotonic()
+            with self._lock:
+                self.running += 1
+                self.wait_seconds_total += started - submitted
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.run_seconds_total += time.monotonic() - started
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), job)
+        finally:
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "queue_depth": self.pending - self.running,
+                "running": self.running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "wait_seconds_total": self.wait_seconds_total,
+                "run_seconds_total": self.run_seconds_total,
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+            }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_password_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            max_workers = getattr(settings, 'PASSWORD_HASH_WORKERS', 4)
+            _pool = PasswordHashPool(max_workers, getattr(settings, 'PASSWORD_HASH_MAX_PENDING', max_workers * 16))
+        return _pool
+
+
+def _verify(raw_password, encoded):
+    """
+    ✅ (비밀번호 일치 여부, 다시 해시해야 하는지) 반환
+    - 사용할 수 없는 해시/없는 사용자(encoded=None)도 해시를 한 번 계산하여 응답 시간 차이를 줄임
+    """
+    if encoded is None or not is_password_usable(encoded):
+        make_password(raw_password)
+        return False, False
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        make_password(raw_password)
+        return False, False
+
+    preferred = get_hasher()
+    must_update = hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+    return hasher.verify(raw_password, encoded), must_update
+
+
+async def averify_password(raw_password, encoded):
+    return await get_password_pool().run(_verify, raw_password, encoded)
+
+
+async def amake_password(raw_password):
+    return await get_password_pool().run(make_password, raw_password)
@@ -0,0 +1,86 @@
+from collections import namedtuple
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.http import Http404
+from main.models.profile import Profile
+
+# ✅ urlname → 프로필 카드 캐시 (read-through)
+# - 공개 API 대부분이 urlname으로 Profile을 조회한 뒤 .user를 다시 읽던 1~2번의 쿼리를 캐시 조회로 대체
+# - 카드는 변경 불가능한 namedtuple (공개 프로필에 필요한 값 + profile_id/user_id)
+# - Profile 저장/삭제 시 시그널에서 변경 전/후 urlname의 캐시를 모두 삭제 (main/signals/signals.py)
+# - 삭제는 같은 캐시를 쓰는 프로세스에만 전달되므로, 프로세스별 캐시(LocMemCache)에서는 다른 워커의 카드가
+#   settings.PROFILE_CARD_TIMEOUT(초) 동안 남음 (neighbor_visibility 변경 등) → 기본값은 짧게, 공유 캐시에서만 늘림
+# - 캐시를 채울 때는 항상 주 DB에서 읽음 (저장 직후 지연된 복제 DB의 이전 값이 다시 캐시되지 않도록)
+
+
+ProfileCard = namedtuple('ProfileCard', [
+    'profile_id', 'user_id', 'urlname', 'username', 'blog_name', 'intro',
+    'user_pic', 'blog_pic', 'neighbor_visibility', 'urlname_edit_count',
+])
+
+
+def _key(urlname):
+    return f"profile:card:{urlname}"
+
+
+def _timeout():
+    return getattr(settings, 'PROFILE_CARD_TIMEOUT', 5)
+
+
+def build_profile_card(profile):
+    return ProfileCard(
+        profile_id=profile.id,
+        user_id=profile.user_id,
+        urlname=profile.urlname,
+        username=profile.username,
+        blog_name=profile.blog_name,
+        intro=profile.intro,
+        user_pic=profile.user_pic.url if profile.user_pic else None,
+        blog_pic=profile.blog_pic.url if profile.blog_pic else None,
+        neighbor_visibility=profile.neighbor_visibility,
+        urlname_edit_count=profile.urlname_edit_count,
+    )
+
+
+def get_profile_card(urlname):
+    """ ✅ urlname의 프로필 카드 (캐시 → 없으면 DB에서 읽어 캐시에 저장, 없는 urlname이면 None) """
+    card = cache.get(_key(urlname))
+    if card is None:
+        profile = Profile.objects.using(DEFAULT_DB_ALIAS).filter(urlname=urlname).first()
+        if profile is None:
+            return None
+        card = build_profile_card(profile)
+        cache.set(_key(urlname), card, _timeout())
+    return ProfileCard(*card)
+
+
+async def aget_profile_card(urlname):
+    """ ✅ get_profile_card()의 async 버전 """
+    card = await cache.aget(_key(urlname))
+    if card is None:
+        profile = await Profile.objects.using(DEFAULT_DB_ALIAS).filter(urlname=urlname).afirst()
+        if profile is None:
+            return None
+        card = build_profile_card(profile)
+        await cache.aset(_key(urlname), card, _timeout())
+    return ProfileCard(*card)
+
+
+def get_profile_card_or_404(urlname):
+    card = get_profile_card(urlname)
+    if card is None:
+        raise Http404("해당 사용자의 프로필을 찾을 수 없습니다.")
+    return card
+
+
+async def aget_profile_card_or_404(urlname):
+    card = await aget_profile_card(urlname)
+    if card is None:
+        raise Http404("해당 사용자의 프로필을 찾을 수 없습니다.")
+    return card
+
+
+def invalidate_profile_card(*urlnames):
+    """ ✅ 캐시된 카드 삭제 (urlname 변경 시 변경 전/후 모두) """
+    cache.delete_many([_key(urlname) for urlname in urlnames if urlname])
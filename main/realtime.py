@@ -0,0 +1,110 @@
+import asyncio
+import threading
+from collections import defaultdict
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+# ✅ 실시간 이벤트(SSE) 허브
+# - 채널 이름: "user:{user_id}" (내 소식), "post:{post_id}" (게시글 새 댓글)
+# - 구독자 하나 = asyncio.Queue 하나 (스레드 없이 코루틴으로 대기하므로 유휴 연결 수천 개도 가벼움)
+# - publish()는 어느 스레드에서 호출해도 안전 (동기 뷰/시그널에서 호출됨)
+
+
+class Subscription:
+    """ ✅ 한 SSE 연결의 구독 정보 (이벤트 루프와 큐) """
+
+    def __init__(self, channels, queue_size):
+        self.channels = tuple(channels)
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0  # ✅ 큐가 가득 차서 버려진 이벤트 수 (느린 클라이언트)
+
+    def deliver(self, event):
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            pass  # ✅ 이벤트 루프가 이미 종료된 연결
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def get(self, timeout):
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+class EventHub:
+    """ ✅ 프로세스 내 pub/sub 허브 """
+
+    def __init__(self, queue_size=100):
+        self.queue_size = queue_size
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channels):
+        """ ✅ 이벤트 루프 안에서 호출 """
+        subscription = Subscription(channels, self.queue_size)
+        with self._lock:
+            for channel in subscription.channels:
+                self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscribers.get(channel)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+    def publish(self, channel, event):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.deliver(event)
+
+    def connection_count(self):
+        with self._lock:
+            return len({sub for subs in self._subscribers.values() for sub in subs})
+
+
+hub = EventHub()
+
+
+class LocalBroker:
+    """
+    ✅ 로컬 브로커 (기본값)
+    - 같은 프로세스의 허브로 바로 전달
+    - 여러 워커로 운영할 때는 `REALTIME_BROKER` 설정으로 Redis pub/sub 등 외부 브로커 구현으로 교체
+      (외부 브로커는 메시지를 받으면 각 워커의 `hub.publish()`를 호출하면 됨)
+    """
+
+    def publish(self, channel, event):
+        hub.publish(channel, event)
+
+
+_broker = None
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        _broker = import_string(getattr(settings, 'REALTIME_BROKER', 'main.realtime.LocalBroker'))()
+    return _broker
+
+
+def publish_event(channel, event_type, data):
+    """ ✅ 채널에 이벤트 발행 (시그널에서 트랜잭션 커밋 후 호출) """
+    get_broker().publish(channel, {"event": event_type, "data": data})
+
+
+def user_channel(user_id):
+    return f"user:{user_id}"
+
+
+def post_channel(post_id):
+    return f"post:{post_id}"
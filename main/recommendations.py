@@ -0,0 +1,120 @@
+import heapq
+from array import array
+from collections import Counter, defaultdict
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from main.models.comment import Comment
+from main.models.heart import Heart
+from main.models.neighbor import Neighbor, NeighborEdge
+from main.models.profile import Profile
+from main.models.recommendation import NeighborRecommendation
+
+# ✅ 알 수도 있는 이웃 배치 계산
+# - 서로이웃 관계 전체를 프로필별 정수 배열(array) 인접 리스트로 한 번에 읽은 뒤
+#   이웃의 이웃을 세어 (인접 행렬의 제곱) 함께 아는 서로이웃 수를 구함
+# - 같은 작성자의 글에 공감/댓글을 남긴 사용자끼리 겹친 작성자 수를 더해 점수 계산
+# - 사용자별 상위 K명만 NeighborRecommendation 테이블에 저장 (요청 시에는 조회만 함)
+MUTUAL_WEIGHT = 1.0
+SHARED_AUTHOR_WEIGHT = 0.5
+MAX_FANS_PER_AUTHOR = 1000  # ✅ 팬이 너무 많은 작성자는 겹침 계산에서 제외 (모두가 모두와 겹치는 것 방지)
+
+
+def load_adjacency():
+    """ ✅ 서로이웃 관계 → {profile_id: array(이웃 profile_id)} """
+    adjacency = defaultdict(lambda: array('l'))
+    edges = NeighborEdge.objects.order_by().values_list('from_profile_id', 'to_profile_id')
+    for from_profile_id, to_profile_id in edges.iterator(chunk_size=10000):
+        adjacency[from_profile_id].append(to_profile_id)
+    return adjacency
+
+
+def load_interactions():
+    """ ✅ 공감/댓글 기록 → ({profile_id: 작성자 profile_id 집합}, {작성자 profile_id: 남긴 사용자 profile_id 집합}) """
+    authors_by_profile = defaultdict(set)
+    fans_by_author = defaultdict(set)
+    hearts = Heart.objects.order_by().values_list('user__profile__id', 'post__author__profile__id').distinct()
+    comments = Comment.objects.order_by().values_list('author_id', 'post__author__profile__id').distinct()
+    for queryset in (hearts, comments):
+        for profile_id, author_id in queryset.iterator(chunk_size=10000):
+            if profile_id is None or author_id is None or profile_id == author_id:
+                continue
+            authors_by_profile[profile_id].add(author_id)
+            fans_by_author[author_id].add(profile_id)
+    return authors_by_profile, fans_by_author
+
+
+def load_pending_pairs():
+    """ ✅ 대기 중인 서로이웃 신청 (양방향) - 이미 신청한 사람은 추천하지 않음 """
+    pairs = set()
+    pending = Neighbor.objects.filter(status='pending').values_list('from_user__profile__id', 'to_user__profile__id')
+    for from_profile_id, to_profile_id in pending.iterator():
+        pairs.add((from_profile_id, to_profile_id))
+        pairs.add((to_profile_id, from_profile_id))
+    return pairs
+
+
+def recommend_for(profile_id, adjacency, authors_by_profile, fans_by_author, pending_pairs, top_k):
+    """ ✅ 한 사용자의 추천 상위 top_k명 [(score, candidate_id, mutual_count, shared_author_count)] """
+    neighbors = adjacency.get(profile_id, ())
+    excluded = set(neighbors)
+    excluded.add(profile_id)
+
+    mutual = Counter()
+    for neighbor_id in neighbors:
+        mutual.update(adjacency.get(neighbor_id, ()))
+
+    shared = Counter()
+    for author_id in authors_by_profile.get(profile_id, ()):
+        fans = fans_by_author[author_id]
+        if len(fans) <= MAX_FANS_PER_AUTHOR:
+            shared.update(fans)
+
+    scored = []
+    for candidate_id in mutual.keys() | shared.keys():
+        if candidate_id in excluded or (profile_id, candidate_id) in pending_pairs:
+            continue
+        score = mutual[candidate_id] * MUTUAL_WEIGHT + shared[candidate_id] * SHARED_AUTHOR_WEIGHT
+        scored.append((score, candidate_id, mutual[candidate_id], shared[candidate_id]))
+    return heapq.nlargest(top_k, scored)
+
+
+def build_neighbor_recommendations(top_k=20, batch_size=500):
+    """
+    ✅ 전체 사용자의 추천 목록을 다시 계산하여 저장
+    - batch_size명씩 기존 추천을 지우고 새 추천을 bulk_create (트랜잭션 단위)
+    - 저장한 추천 수 반환
+    """
+    adjacency = load_adjacency()
+    authors_by_profile, fans_by_author = load_interactions()
+    pending_pairs = load_pending_pairs()
+    computed_at = timezone.now()
+
+    written = 0
+    profile_ids = Profile.objects.order_by('id').values_list('id', flat=True)
+    batch = []
+    for profile_id in profile_ids.iterator(chunk_size=batch_size):
+        batch.append(profile_id)
+        if len(batch) >= batch_size:
+            written += _write_batch(batch, adjacency, authors_by_profile, fans_by_author, pending_pairs, top_k, computed_at)
+            batch = []
+    if batch:
+        written += _write_batch(batch, adjacency, authors_by_profile, fans_by_author, pending_pairs, top_k, computed_at)
+    return written
+
+
+def _write_batch(profile_ids, adjacency, authors_by_profile, fans_by_author, pending_pairs, top_k, computed_at):
+    rows = [
+        NeighborRecommendation(
+            profile_id=profile_id, candidate_id=candidate_id, score=score,
+            mutual_count=mutual_count, shared_author_count=shared_author_count, created_at=computed_at,
+        )
+        for profile_id in profile_ids
+        for score, candidate_id, mutual_count, shared_author_count in recommend_for(
+            profile_id, adjacency, authors_by_profile, fans_by_author, pending_pairs, top_k
+        )
+    ]
+    with transaction.atomic():
+        NeighborRecommendation.objects.filter(profile_id__in=profile_ids).delete()
+        NeighborRecommendation.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
@@ -0,0 +1,46 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # ✅ orjson이 없으면 DRF 기본 JSON 렌더링 사용
+    orjson = None
+
+# ✅ 빠른 JSON 렌더러
+# - DRF JSONRenderer(표준 json)는 게시글 목록처럼 큰 응답에서 CPU 대부분을 차지함
+# - orjson으로 바로 UTF-8 바이트를 만들고, 결과는 DRF JSONRenderer와 같게 맞춤
+#   (한글 그대로, 공백 없음, datetime은 ISO 8601이고 UTC면 'Z', U+2028/U+2029는 이스케이프)
+# - orjson이 직접 처리하지 못하는 값(Decimal, 지연 번역 문자열, QuerySet 등)은 DRF JSONEncoder로 변환
+
+_encoder = JSONEncoder()
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z if orjson else 0
+
+
+def dumps(data):
+    """ ✅ DRF JSONRenderer와 같은 JSON 바이트 (orjson이 없거나 처리할 수 없는 값이면 None) """
+    if orjson is None:
+        return None
+    try:
+        content = orjson.dumps(data, default=_encoder.default, option=_OPTIONS)
+    except orjson.JSONEncodeError:
+        return None  # ✅ 64비트를 넘는 정수 등
+    # ✅ DRF와 같이 JavaScript 문자열에서 줄바꿈으로 해석되는 문자 이스케이프
+    if b'\xe2\x80' in content:
+        content = content.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+    return content
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    ✅ settings.REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES']에 등록
+    - 들여쓰기를 요청한 경우(Accept: application/json; indent=4, Browsable API)는 DRF 렌더링 사용
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not self.get_indent(accepted_media_type, renderer_context or {}):
+            content = dumps(data)
+            if content is not None:
+                return content
+        return super().render(data, accepted_media_type, renderer_context)
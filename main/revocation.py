@@ -0,0 +1,166 @@
+import hashlib
+import math
+import threading
+import time
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models import Max
+from django.utils import timezone
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# ✅ 폐기된 리프레시 토큰(JTI) 블룸 필터
+# - 블랙리스트 테이블 조회(BlacklistedToken) 전에 프로세스 메모리의 블룸 필터를 먼저 확인
+# - 필터에 있으면(오탐 포함) DB에서 확인
+# - 공유 캐시(Redis 등)에서만 사용: 다른 프로세스가 폐기하면 세대(generation) 값이 바뀌므로 바로 새 폐기분을 반영하고,
+#   세대가 같아도 REVOKED_FILTER_SYNC_SECONDS마다 마지막으로 읽은 ID 이후의 폐기분(PK 범위 조회)을 반영
+# - 프로세스별 캐시(LocMemCache 등)에서는 세대 값이 다른 워커에 전달되지 않아 "필터에 없음"을 믿을 수 없으므로
+#   필터를 쓰지 않고 항상 블랙리스트를 조회 (jti 인덱스 조회 1번, 필터 동기화 쿼리보다 가벼움)
+# - REVOKED_FILTER_REBUILD_SECONDS마다 만료되지 않은 폐기 토큰으로 전체를 다시 만듦 (만료된 항목 정리)
+GENERATION_KEY = "auth:revoked:generation"
+FALSE_POSITIVE_RATE = 0.01
+MIN_CAPACITY = 1024
+PER_PROCESS_CACHES = (LocMemCache, DummyCache)
+SYNC_ID_LOOKBACK = 100  # ✅ ID 순서와 커밋 순서가 다를 수 있으므로 마지막 ID 앞쪽도 다시 읽음 (중복 추가는 무해)
+
+
+class BloomFilter:
+    def __init__(self, capacity, false_positive_rate=FALSE_POSITIVE_RATE):
+        capacity = max(capacity, MIN_CAPACITY)
+        self.size = int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        # ✅ 해시 하나(blake2b)에서 두 값을 얻어 k개의 위치를 만듦 (double hashing)
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class RevokedTokenFilter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._built_at = 0.0
+        self._synced_at = 0.0
+        self._last_id = 0  # ✅ 필터에 반영한 마지막 BlacklistedToken ID
+        self._generation = None
+        self.db_checks = 0  # ✅ DB를 조회한 횟수 (블랙리스트 확인 또는 필터 동기화)
+        self.skipped = 0  # ✅ DB 조회 없이 필터만으로 판단한 횟수
+
+    def might_be_revoked(self, jti):
+        if not self.is_active():
+            self._count(queried=True)  # ✅ 블랙리스트 조회로 바로 확인
+            return True
+        queried = self._refresh()
+        hit = self._contains(jti)
+        if not hit and time.monotonic() - self._synced_at > getattr(settings, 'REVOKED_FILTER_SYNC_SECONDS', 1):
+            self._sync()  # ✅ 주기적으로 세대 값 변경 없이 들어온 폐기분도 반영
+            queried = True
+            hit = self._contains(jti)
+        self._count(queried or hit)
+        return hit
+
+    @staticmethod
+    def is_active():
+        """ ✅ 세대 값을 모든 프로세스가 공유하는 캐시에서만 필터 사용 """
+        return not isinstance(caches['default'], PER_PROCESS_CACHES)
+
+    def _count(self, queried):
+        with self._lock:
+            if queried:
+                self.db_checks += 1
+            else:
+                self.skipped += 1
+
+    def mark_revoked(self, jti):
+        """ ✅ 이 프로세스에서 폐기한 토큰은 바로 추가하고, 다른 프로세스가 알 수 있도록 세대 값 증가 """
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(jti)
+        try:
+            cache.incr(GENERATION_KEY)
+        except ValueError:
+            cache.add(GENERATION_KEY, 1, None)
+
+    def _contains(self, jti):
+        with self._lock:
+            return jti in self._bloom
+
+    def _refresh(self):
+        """ ✅ 필터 생성/재생성 또는 다른 프로세스의 폐기 반영 (DB를 조회했으면 True) """
+        rebuild_seconds = getattr(settings, 'REVOKED_FILTER_REBUILD_SECONDS', 600)
+        if self._bloom is None or time.monotonic() - self._built_at > rebuild_seconds:
+            self._rebuild()
+            return True
+        generation = cache.get(GENERATION_KEY)
+        if generation != self._generation:
+            self._sync(generation)
+            return True
+        return False
+
+    def _rebuild(self):
+        generation = cache.get(GENERATION_KEY)
+        # ✅ 최대 ID를 먼저 읽어, 아래 조회 중에 추가된 폐기분은 다음 _sync()에서 반영
+        last_id = BlacklistedToken.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+        live = BlacklistedToken.objects.filter(id__lte=last_id, token__expires_at__gt=timezone.now())
+        bloom = BloomFilter(live.count() * 2)
+        for jti in live.values_list('token__jti', flat=True).iterator(chunk_size=5000):
+            bloom.add(jti)
+        now = time.monotonic()
+        with self._lock:
+            self._bloom, self._built_at, self._synced_at = bloom, now, now
+            self._last_id, self._generation = last_id, generation
+
+    def _sync(self, generation=None):
+        """ ✅ 마지막으로 읽은 ID 이후에 폐기된 토큰만 추가 (PK 범위 조회) """
+        if generation is None:
+            generation = cache.get(GENERATION_KEY)
+        recent = BlacklistedToken.objects.filter(id__gt=max(0, self._last_id - SYNC_ID_LOOKBACK))
+        rows = list(recent.values_list('id', 'token__jti'))
+        with self._lock:
+            for row_id, jti in rows:
+                self._bloom.add(jti)
+                self._last_id = max(self._last_id, row_id)
+            self._synced_at, self._generation = time.monotonic(), generation
+
+    def metrics(self):
+        with self._lock:
+            return {"db_checks": self.db_checks, "skipped": self.skipped}
+
+
+revoked_tokens = RevokedTokenFilter()
+
+
+class FilteredRefreshToken(RefreshToken):
+    """
+    ✅ 블랙리스트 확인 전에 블룸 필터를 먼저 보는 RefreshToken
+    - 로그인/로그아웃/토큰 재발급에서 사용
+    """
+
+    def check_blacklist(self):
+        if revoked_tokens.might_be_revoked(self.payload[api_settings.JTI_CLAIM]):
+            super().check_blacklist()
+
+    def blacklist(self):
+        result = super().blacklist()
+        revoked_tokens.mark_revoked(self.payload[api_settings.JTI_CLAIM])
+        return result
+
+
+class FilteredTokenRefreshSerializer(TokenRefreshSerializer):
+    """ ✅ 토큰 재발급 (회전 시 이전 리프레시 토큰 폐기도 필터에 반영) """
+    token_class = FilteredRefreshToken
@@ -4,7 +4,7 @@ from .post import PostSerializer,PostImageSerializer,PostTextSerializer
 from .comment import CommentSerializer
 from .heart import HeartSerializer
 from .commentHeart import CommentHeartSerializer
-from .neighbor import NeighborSerializer
+from .neighbor import NeighborSerializer,NeighborProfileSerializer,NeighborRecommendationSerializer,NeighborBulkActionSerializer
 from .activity import ActivitySerializer
-from .news import NewsSerializer
+from .news import NewsSerializer,NewsReadSerializer,NewsDigestSerializer
 from .account import PasswordUpdateSerializer
\ No newline at end of file
@@ -1,15 +1,43 @@
+from collections import defaultdict
 from rest_framework import serializers
 from main.models.comment import Comment
 
+SECRET_COMMENT_TEXT = "비밀 댓글입니다."
+
+
+def build_comment_tree(comments):
+    """
+    ✅ 한 번의 쿼리로 가져온 댓글 목록을 부모 → 대댓글 트리로 조립
+    - 반환값: (부모 댓글 리스트, {부모 id: [대댓글, ...]})
+    - 대댓글의 `parent`는 메모리의 부모 객체로 연결하여 추가 쿼리를 막음
+    """
+    comments = list(comments)
+    by_id = {comment.id: comment for comment in comments}
+    replies_map = defaultdict(list)
+    roots = []
+
+    for comment in comments:
+        if comment.parent_id is None:
+            roots.append(comment)
+            continue
+        parent = by_id.get(comment.parent_id)
+        if parent is not None:
+            comment.parent = parent  # ✅ FK 캐시 채우기 (instance.parent.author 조회 시 쿼리 없음)
+        replies_map[comment.parent_id].append(comment)
+
+    return roots, replies_map
+
+
 class CommentSerializer(serializers.ModelSerializer):
     author_name = serializers.SerializerMethodField()
     is_post_author = serializers.SerializerMethodField()
     parent = serializers.PrimaryKeyRelatedField(queryset=Comment.objects.all(), required=False, allow_null=True)
     replies = serializers.SerializerMethodField()  # 대댓글을 포함시키기 위한 필드 추가
+    reply_count = serializers.SerializerMethodField()  # ✅ 전체 대댓글 수 (replies에는 일부만 포함될 수 있음)
 
     class Meta:
         model = Comment
-        fields = ['id', 'author_name', 'content', 'is_private', 'is_parent', 'is_post_author', 'parent', 'created_at', 'replies']
+        fields = ['id', 'author_name', 'content', 'is_private', 'is_parent', 'is_post_author', 'parent', 'created_at', 'replies', 'reply_count']
         read_only_fields = ['id', 'created_at', 'is_parent', 'is_post_author', 'author_name']
 
     def get_author_name(self, obj):
@@ -18,40 +46,55 @@ class CommentSerializer(serializers.ModelSerializer):
         return None
 
     def get_is_post_author(self, obj):
-        return obj.author == obj.post.author.profile
+        return obj.author_id == obj.post.author.profile.id
 
     def get_replies(self, obj):
         """
         대댓글을 가져오기 위한 메소드
+        - `replies_map` context가 있으면 (목록 조회) 메모리에서 조립된 트리를 사용
+        - 없으면 (단건 조회/생성) 기존처럼 DB에서 조회
+        """
+        if not obj.is_parent:  # 부모 댓글이 아니면 대댓글이 없으므로 빈 리스트를 반환
+            return []
+
+        replies_map = self.context.get('replies_map')
+        if replies_map is not None:
+            replies = replies_map.get(obj.id, [])
+        else:
+            replies = Comment.objects.filter(parent=obj).select_related('author', 'post__author__profile')
+        return CommentSerializer(replies, many=True, context=self.context).data
+
+    def get_reply_count(self, obj):
         """
-        if obj.is_parent:  # 부모 댓글인 경우에만 대댓글을 가져옵니다
-            replies = Comment.objects.filter(parent=obj)
-            return CommentSerializer(replies, many=True, context=self.context).data
-        return []  # 부모 댓글이 아니면 대댓글이 없으므로 빈 리스트를 반환
+        ✅ 대댓글 수
+        - `reply_counts` context가 있으면 (목록 조회) 윈도우 함수로 함께 계산된 값을 사용
+        """
+        if obj.parent_id is not None:
+            return 0
+
+        reply_counts = self.context.get('reply_counts')
+        if reply_counts is not None:
+            return reply_counts.get(obj.id, 0)
+        return obj.replies.count()
 
     def to_representation(self, instance):
-        user = self.context['request'].user
         data = super().to_representation(instance)
 
-        is_authenticated = user.is_authenticated
-        is_author = is_authenticated and user.profile == instance.author
-        is_post_author = is_authenticated and user.profile == instance.post.author.profile
-        is_parent_author = is_authenticated and instance.parent and user.profile == instance.parent.author
-
-        # ✅ 비밀 댓글 필터링
-        if instance.is_private and not (is_author or is_post_author or is_parent_author):
-            data['content'] = "비밀 댓글입니다."
+        # ✅ 비밀 댓글 필터링 (대댓글은 중첩 직렬화 시 각자 이 단계를 거침)
+        if instance.is_private and not self._can_read_private(instance):
+            data['content'] = SECRET_COMMENT_TEXT
 
-        # 대댓글이 있을 경우 포함시키기
-        if instance.is_parent:
-            serialized_replies = data.get('replies', [])
-            for reply in serialized_replies:
-                reply_obj = Comment.objects.get(id=reply['id'])  # 대댓글 객체를 가져옴
-                is_reply_author = is_authenticated and user.profile == reply_obj.author
-                is_reply_post_author = is_authenticated and user.profile == reply_obj.post.author.profile
-                is_reply_parent_author = is_authenticated and user.profile == instance.author
+        return data
 
-                if reply_obj.is_private and not (is_reply_author or is_reply_post_author or is_reply_parent_author):
-                    reply['content'] = "비밀 댓글입니다."
+    def _can_read_private(self, instance):
+        """ ✅ 비밀 댓글 열람 가능 여부 (댓글 작성자, 게시글 작성자, 부모 댓글 작성자) """
+        user = self.context['request'].user
+        if not user.is_authenticated:
+            return False
 
-        return data
\ No newline at end of file
+        profile_id = user.profile.id
+        if instance.author_id == profile_id:
+            return True
+        if instance.post.author.profile.id == profile_id:
+            return True
+        return instance.parent_id is not None and instance.parent.author_id == profile_id
@@ -1,6 +1,7 @@
 from rest_framework import serializers
-from ..models.neighbor import Neighbor
+from ..models.neighbor import Neighbor, are_neighbors
 from ..models.profile import Profile
+from ..models.recommendation import NeighborRecommendation
 
 class NeighborSerializer(serializers.ModelSerializer):
     """
@@ -50,7 +51,8 @@ class NeighborSerializer(serializers.ModelSerializer):
         to_urlname = self.initial_data.get("to_urlname")  # 클라이언트에서 `to_urlname`을 입력받음
 
         try:
-            to_user = Profile.objects.get(urlname=to_urlname).user
+            to_profile = Profile.objects.select_related('user').get(urlname=to_urlname)
+            to_user = to_profile.user
         except Profile.DoesNotExist:
             raise serializers.ValidationError("해당 URL 이름을 가진 사용자를 찾을 수 없습니다.")
 
@@ -62,7 +64,7 @@ class NeighborSerializer(serializers.ModelSerializer):
         if Neighbor.objects.filter(from_user=from_user, to_user=to_user, status='pending').exists():
             raise serializers.ValidationError("이미 보낸 서로이웃 요청이 있습니다.")
 
-        if Neighbor.objects.filter(from_user=from_user, to_user=to_user, status='accepted').exists():
+        if are_neighbors(from_user.profile.id, to_profile.id):
             raise serializers.ValidationError("이미 서로이웃 관계입니다.")
 
         return data
@@ -82,18 +84,51 @@ class NeighborSerializer(serializers.ModelSerializer):
 
     def update(self, instance, validated_data):
         """
-        ✅ 서로이웃 요청을 `accepted`로 변경하면 Profile 관계에도 반영
+        ✅ 서로이웃 요청 상태 변경 (`accepted`이면 Neighbor.save()에서 서로이웃 관계에 추가)
         """
         instance.status = validated_data.get("status", instance.status)
         instance.save()
+        return instance
 
-        if instance.status == "accepted":
-            from_profile, _ = Profile.objects.get_or_create(user=instance.from_user)
-            to_profile, _ = Profile.objects.get_or_create(user=instance.to_user)
 
-            # ✅ 중복 추가 방지
-            if not from_profile.neighbors.filter(id=to_profile.id).exists():
-                from_profile.neighbors.add(to_profile)
-                to_profile.neighbors.add(from_profile)
+class NeighborProfileSerializer(serializers.ModelSerializer):
+    """
+    ✅ 서로이웃 목록의 프로필 카드 (URL 이름, 닉네임, 프로필 사진)
+    """
+    user_pic = serializers.SerializerMethodField()
 
-        return instance
+    class Meta:
+        model = Profile
+        fields = ['urlname', 'username', 'user_pic']
+
+    def get_user_pic(self, obj):
+        return obj.user_pic.url if obj.user_pic else None
+
+
+class NeighborRecommendationSerializer(serializers.ModelSerializer):
+    """
+    ✅ 알 수도 있는 이웃 (추천된 사용자의 프로필 카드 + 추천 근거)
+    """
+    urlname = serializers.CharField(source="candidate.urlname", read_only=True)
+    username = serializers.CharField(source="candidate.username", read_only=True)
+    user_pic = serializers.SerializerMethodField()
+
+    class Meta:
+        model = NeighborRecommendation
+        fields = ['urlname', 'username', 'user_pic', 'mutual_count', 'shared_author_count']
+
+    def get_user_pic(self, obj):
+        return obj.candidate.user_pic.url if obj.candidate.user_pic else None
+
+
+class NeighborBulkActionSerializer(serializers.Serializer):
+    """
+    ✅ 받은 서로이웃 신청 일괄 처리 요청
+    - `action`: accept(수락) 또는 reject(거절)
+    - `urlnames`: 처리할 신청자들의 URL 이름 (최대 100명)
+    """
+    action = serializers.ChoiceField(choices=["accept", "reject"])
+    urlnames = serializers.ListField(child=serializers.CharField(max_length=30), min_length=1, max_length=100)
+
+    def validate_urlnames(self, value):
+        return list(dict.fromkeys(value))  # ✅ 중복 제거 (순서 유지)
@@ -1,7 +1,6 @@
 from rest_framework import serializers
-from main.models.post import Post
-from main.models.comment import Comment
-from main.models.heart import Heart  # ✅ 게시글 좋아요 추가
+from main.models.notification import Notification
+
 
 class NewsSerializer(serializers.Serializer):
     activity_id = serializers.CharField(read_only=True)  # ✅ `activity_id` 추가
@@ -11,37 +10,94 @@ class NewsSerializer(serializers.Serializer):
     is_read = serializers.BooleanField(default=False)
     is_parent = serializers.BooleanField(read_only=True)  # ✅ 댓글/대댓글 여부 추가
 
-    def to_representation(self, instance):
-        user = self.context['request'].user  # ✅ 현재 로그인된 사용자
-        activity_id = None
-        activity_type = None
-        content = None
-        is_parent = None
-
-        if isinstance(instance, Comment):
-            if instance.post.author == user:  # ✅ 내가 작성한 게시글에 달린 댓글
-                activity_id = f"comment_{instance.id}"
-                activity_type = "post_comment"
-                content = f"{instance.author.username}님이 '{instance.post.title}' 글에 댓글을 남겼습니다."
-                is_parent = instance.is_parent  # ✅ 댓글/대댓글 여부 저장
-
-            elif instance.parent and instance.parent.author == user.profile:  # ✅ 내가 작성한 댓글에 달린 대댓글
-                activity_id = f"comment_{instance.id}"
-                activity_type = "comment_reply"
-                content = f"{instance.author.username}님이 '{instance.post.title}' 글에 대댓글을 남겼습니다."
-                is_parent = instance.is_parent
-
-        elif isinstance(instance, Heart):
-            if instance.post.author == user:  # ✅ 내가 작성한 게시글에 달린 좋아요
-                activity_id = f"heart_{instance.id}"
-                activity_type = "post_like"
-                content = f"{instance.user.username}님이 '{instance.post.title}' 글을 좋아합니다."
+    # ✅ 소식 종류별 문구 (actor: 활동한 사용자 닉네임, title: 게시글 제목)
+    CONTENT_TEMPLATES = {
+        "post_comment": "{actor}님이 '{title}' 글에 댓글을 남겼습니다.",
+        "comment_reply": "{actor}님이 '{title}' 글에 대댓글을 남겼습니다.",
+        "post_like": "{actor}님이 '{title}' 글을 좋아합니다.",
+    }
+
+    def to_representation(self, instance: Notification):
+        """
+        ✅ Notification 한 행을 내 소식 항목으로 변환
+        - 소식 종류는 기록 시점에 저장된 `type`을 그대로 사용 (게시글 작성자 비교 없음)
+        - actor.profile, post, comment는 뷰에서 select_related로 함께 조회
+        """
+        content = self.CONTENT_TEMPLATES[instance.type].format(
+            actor=instance.actor.profile.username,
+            title=instance.post.title,
+        )
 
         return {
-            "activity_id": activity_id,
-            "type": activity_type,
+            "activity_id": instance.activity_id,
+            "type": instance.type,
             "content": content,
             "created_at": instance.created_at,
             "is_read": instance.is_read,
-            "is_parent": is_parent,  # ✅ 추가
+            "is_parent": instance.comment.is_parent if instance.comment_id else None,  # ✅ 좋아요는 None
+        }
+
+
+class NewsReadSerializer(serializers.Serializer):
+    """
+    ✅ 내 소식 읽음 처리 요청
+    - `activity_ids`: 읽음 처리할 소식 ID 목록 (예: ["comment_3", "heart_7"])
+    - `until`: 이 시각까지의 소식을 모두 읽음 처리
+    - 둘 중 하나만 입력
+    """
+    activity_ids = serializers.ListField(child=serializers.CharField(), required=False, max_length=500)
+    until = serializers.DateTimeField(required=False)
+
+    SOURCE_PREFIXES = ("comment", "heart")
+
+    def validate_activity_ids(self, value):
+        """ ✅ "comment_3" → {"comment": [3]} 처럼 원본 종류별 ID로 분리 """
+        ids_by_source = {prefix: [] for prefix in self.SOURCE_PREFIXES}
+        for activity_id in value:
+            prefix, _, raw_id = activity_id.partition("_")
+            if prefix not in ids_by_source or not raw_id.isdigit():
+                raise serializers.ValidationError(f"'{activity_id}'은(는) 유효하지 않은 activity_id입니다.")
+            ids_by_source[prefix].append(int(raw_id))
+        return ids_by_source
+
+    def validate(self, data):
+        if ("activity_ids" in data) == ("until" in data):
+            raise serializers.ValidationError("activity_ids 또는 until 중 하나만 입력해야 합니다.")
+        return data
+
+
+class NewsDigestSerializer(serializers.Serializer):
+    """
+    ✅ 게시글별로 묶은 내 소식 ("A님 외 12명이 '글'을 좋아합니다.")
+    - 뷰에서 (post, type) 기준 GROUP BY로 계산한 dict를 받아 변환
+    """
+    post_id = serializers.IntegerField()
+    type = serializers.CharField()
+    count = serializers.IntegerField()  # ✅ 묶인 소식 개수
+    actor_count = serializers.IntegerField()  # ✅ 활동한 사용자 수 (중복 제외)
+    actors = serializers.ListField(child=serializers.CharField())  # ✅ 최근 활동한 사용자 닉네임 (대표 몇 명)
+    content = serializers.CharField(read_only=True)
+    latest_at = serializers.DateTimeField()
+
+    CONTENT_TEMPLATES = {
+        "post_comment": "'{title}' 글에 댓글을 남겼습니다.",
+        "comment_reply": "'{title}' 글에 대댓글을 남겼습니다.",
+        "post_like": "'{title}' 글을 좋아합니다.",
+    }
+
+    def to_representation(self, group):
+        actors = group["actors"]
+        others = group["actor_count"] - 1
+        subject = f"{actors[0]}님" if actors else "누군가"
+        if others > 0:
+            subject += f" 외 {others}명"
+
+        return {
+            "post_id": group["post_id"],
+            "type": group["type"],
+            "count": group["count"],
+            "actor_count": group["actor_count"],
+            "actors": actors,
+            "content": f"{subject}이 " + self.CONTENT_TEMPLATES[group["type"]].format(title=group["post_title"]),
+            "latest_at": group["latest_at"],
         }
@@ -78,6 +78,38 @@ class ProfileSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError("프로필 사진은 JPEG 또는 PNG 형식만 지원됩니다.")
         return value
 
+class ProfileCardSerializer(serializers.Serializer):
+    """
+    ✅ 캐시된 프로필 카드(profile_cards.ProfileCard)를 ProfileSerializer와 같은 형식으로 직렬화 (타인의 프로필 조회)
+    - 이미지는 ProfileSerializer처럼 요청 기준 절대 URL
+    - is_neighbor: 현재 로그인한 사용자가 서로이웃인지 여부 (context['is_neighbor'])
+    """
+    blog_name = serializers.CharField()
+    blog_pic = serializers.SerializerMethodField()
+    username = serializers.CharField()
+    user_pic = serializers.SerializerMethodField()
+    intro = serializers.CharField()
+    neighbor_visibility = serializers.BooleanField()
+    urlname = serializers.CharField()
+    urlname_edit_count = serializers.IntegerField()
+    is_neighbor = serializers.SerializerMethodField()
+
+    def get_blog_pic(self, card):
+        return self._absolute_url(card.blog_pic)
+
+    def get_user_pic(self, card):
+        return self._absolute_url(card.user_pic)
+
+    def get_is_neighbor(self, card):
+        return self.context.get('is_neighbor', False)
+
+    def _absolute_url(self, url):
+        if not url:
+            return None
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+
 class UrlnameUpdateSerializer(serializers.Serializer):
     """ ✅ `urlname`만 변경할 수 있도록 별도 시리얼라이저 생성 """
     urlname = serializers.CharField(max_length=30, required=True)
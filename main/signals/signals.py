@@ -1,9 +1,16 @@
-from django.db.models.signals import post_save, post_delete, pre_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from django.db import transaction
+from django.db.models import F
 from django.conf import settings
 from main.models.profile import Profile
 from main.models.comment import Comment
 from main.models.post import Post
+from main.models.heart import Heart
+from main.models.notification import Notification
+from main.unread_counter import add_unread_count
+from main.realtime import publish_event, user_channel, post_channel
+from main.profile_cards import invalidate_profile_card
 
 
 # 🛠 새로운 사용자가 생성될 때 자동으로 Profile 생성
@@ -18,43 +25,126 @@ def create_profile(sender, instance, created, **kwargs):
         )
 
 
-# ✅ 프로필 변경 전에 기존 값을 저장하는 딕셔너리
-old_usernames = {}
-
-@receiver(pre_save, sender=Profile)
-def store_old_username(sender, instance, **kwargs):
-    """ ✅ 프로필이 변경되기 전에 기존 username 저장 """
-    try:
-        old_instance = Profile.objects.get(pk=instance.pk)
-        old_usernames[instance.pk] = old_instance.username  # ✅ 기존 username 저장
-    except Profile.DoesNotExist:
-        old_usernames[instance.pk] = None  # 새 프로필인 경우
-
 @receiver(post_save, sender=Profile)
-def update_comment_author_name(sender, instance, **kwargs):
-    """ ✅ 프로필의 username이 변경되었을 경우, 기존 댓글의 author_name을 업데이트 """
-    old_username = old_usernames.get(instance.pk)
+def update_comment_author_name(sender, instance, created, **kwargs):
+    """
+    ✅ 프로필의 username이 변경되었을 경우, 기존 댓글의 author_name을 한 번의 UPDATE로 갱신
+    - 변경 여부는 DB에서 읽어온 시점의 스냅샷(FieldTrackerMixin)과 비교하므로 추가 SELECT 없음
+    """
+    if created or not instance.has_changed('username'):
+        return
 
-    if old_username and old_username != instance.username:
-        # ✅ 기존 댓글을 찾아 author_name을 업데이트
-        comments = Comment.objects.filter(author=instance)
-        for comment in comments:
-            comment.author_name = instance.username
-            comment.save()  # ✅ 개별 저장
+    Comment.objects.filter(author=instance).update(author_name=instance.username)
 
-        # ✅ 업데이트 후 기존 데이터 삭제
-        del old_usernames[instance.pk]
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_profile_card_cache(sender, instance, **kwargs):
+    """
+    ✅ 프로필이 저장/삭제되면 urlname → 프로필 카드 캐시 삭제 (urlname이 바뀐 경우 변경 전 urlname도)
+    - 커밋 전에 다른 요청이 옛 값을 다시 캐시에 넣을 수 있으므로 커밋 후에 한 번 더 삭제
+    """
+    urlnames = (instance.urlname, instance.get_loaded_value('urlname'))
+    invalidate_profile_card(*urlnames)
+    transaction.on_commit(lambda: invalidate_profile_card(*urlnames))
 
 @receiver(post_save, sender=Comment)
-def update_comment_count_on_save(sender, instance, **kwargs):
-    """ ✅ 댓글이 추가될 때 comment_count 증가 """
-    post = instance.post
-    post.comment_count = Comment.objects.filter(post=post).count()
-    post.save(update_fields=["comment_count"])
+def update_comment_count_on_save(sender, instance, created, **kwargs):
+    """ ✅ 댓글이 새로 추가될 때만 comment_count 증가 (수정/소프트 삭제는 개수 변화 없음) """
+    if not created:
+        return
+    Post.objects.filter(pk=instance.post_id).update(comment_count=F("comment_count") + 1)
 
 @receiver(post_delete, sender=Comment)
 def update_comment_count_on_delete(sender, instance, **kwargs):
-    """ ✅ 댓글이 삭제될 때 comment_count 감소 """
-    post = instance.post
-    post.comment_count = Comment.objects.filter(post=post).count()
-    post.save(update_fields=["comment_count"])
\ No newline at end of file
+    """
+    ✅ 댓글이 삭제될 때 comment_count 감소
+    - 부모 댓글 삭제로 CASCADE 삭제되는 대댓글도 각각 post_delete가 발생하므로 한 건씩 감소
+    - 게시글과 함께 삭제되는 경우 게시글 행이 먼저 사라져도 UPDATE는 0건으로 끝남
+    """
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(comment_count=F("comment_count") - 1)
+
+
+@receiver(post_save, sender=Comment)
+def create_comment_notifications(sender, instance, created, **kwargs):
+    """
+    ✅ 댓글/대댓글이 추가될 때 내 소식 기록
+    - 게시글 작성자에게 `post_comment`
+    - 대댓글이면 부모 댓글 작성자에게 `comment_reply` (게시글 작성자와 같으면 중복 기록하지 않음)
+    - 자기 자신의 활동은 기록하지 않음
+    """
+    if not created:
+        return
+
+    actor_id = instance.author.user_id
+    post_author_id = instance.post.author_id
+    common = dict(actor_id=actor_id, post_id=instance.post_id, comment=instance, created_at=instance.created_at)
+
+    notifications = []
+    if post_author_id != actor_id:
+        notifications.append(Notification(recipient_id=post_author_id, type='post_comment', **common))
+
+    if instance.parent_id:
+        parent_author_id = instance.parent.author.user_id
+        if parent_author_id not in (actor_id, post_author_id):
+            notifications.append(Notification(recipient_id=parent_author_id, type='comment_reply', **common))
+
+    if notifications:
+        Notification.objects.bulk_create(notifications)
+        for notification in notifications:
+            _count_unread_on_commit(notification.recipient_id, 1)
+            _publish_news_on_commit(notification)
+
+@receiver(post_save, sender=Heart)
+def create_heart_notification(sender, instance, created, **kwargs):
+    """ ✅ 게시글에 좋아요가 추가될 때 게시글 작성자에게 `post_like` 기록 (자기 게시글 제외) """
+    if not created:
+        return
+
+    post_author_id = instance.post.author_id
+    if post_author_id == instance.user_id:
+        return
+
+    notification = Notification.objects.create(
+        recipient_id=post_author_id, actor_id=instance.user_id, type='post_like',
+        post_id=instance.post_id, heart=instance, created_at=instance.created_at,
+    )
+    _count_unread_on_commit(post_author_id, 1)
+    _publish_news_on_commit(notification)
+
+@receiver(post_delete, sender=Notification)
+def discount_deleted_notification(sender, instance, **kwargs):
+    """ ✅ 읽지 않은 소식이 삭제되면 (좋아요 취소, 댓글 삭제 등) 배지 개수 감소 """
+    if not instance.is_read:
+        _count_unread_on_commit(instance.recipient_id, -1)
+
+@receiver(post_save, sender=Comment)
+def publish_new_comment(sender, instance, created, **kwargs):
+    """
+    ✅ 새 댓글/대댓글을 게시글 채널로 발행 (SSE)
+    - 비밀 댓글 내용이 새지 않도록 ID만 보내고, 클라이언트가 댓글 API로 다시 조회
+    """
+    if not created:
+        return
+
+    data = {
+        "comment_id": instance.id,
+        "parent_id": instance.parent_id,
+        "post_id": instance.post_id,
+        "created_at": instance.created_at.isoformat(),
+    }
+    transaction.on_commit(lambda: publish_event(post_channel(instance.post_id), "comment", data))
+
+def _publish_news_on_commit(notification):
+    """ ✅ 새 소식을 받는 사용자 채널로 발행 (SSE) """
+    data = {
+        "activity_id": notification.activity_id,
+        "type": notification.type,
+        "post_id": notification.post_id,
+        "created_at": notification.created_at.isoformat(),
+    }
+    transaction.on_commit(lambda: publish_event(user_channel(notification.recipient_id), "news", data))
+
+def _count_unread_on_commit(user_id, delta):
+    """ ✅ 트랜잭션이 커밋된 뒤에만 배지 개수 반영 (롤백된 소식은 세지 않음) """
+    transaction.on_commit(lambda: add_unread_count(user_id, delta))
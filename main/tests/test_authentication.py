@@ -0,0 +1,38 @@
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+from main.authentication import ProfileJWTAuthentication
+from main.models import CustomUser, Profile
+
+
+class ProfileJWTAuthenticationTests(TestCase):
+    """ ✅ JWT 인증 + 사용자/프로필 한 번에 로드 """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='member', password='pw12345!')
+
+    def authenticate(self):
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        return ProfileJWTAuthentication().authenticate(request)
+
+    def test_user_and_profile_are_loaded_in_one_query(self):
+        with self.assertNumQueries(1):
+            user, _ = self.authenticate()
+            self.assertEqual(user.profile.urlname, 'member')
+
+    def test_deactivated_user_is_rejected_on_next_request(self):
+        self.authenticate()
+        CustomUser.objects.filter(id=self.user.id).update(is_active=False)  # ✅ 시그널 없이 (다른 워커에서 변경한 경우와 같음)
+
+        response = self.client.get('/news/unread-count/', HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_profile_is_read_fresh_on_every_request(self):
+        self.authenticate()
+        Profile.objects.filter(user=self.user).update(blog_name='새 블로그')
+
+        user, _ = self.authenticate()
+
+        self.assertEqual(user.profile.blog_name, '새 블로그')
@@ -0,0 +1,171 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from main.models import Comment, CustomUser, Post
+from main.serializers.comment import SECRET_COMMENT_TEXT, build_comment_tree
+
+
+class CommentTreeTests(TestCase):
+    """ ✅ 댓글 목록 (GET /posts/{post_id}/comments/) - 부모 댓글 한 페이지 + 대댓글 미리보기를 메모리에서 조립 """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = CustomUser.objects.create_user(id='author', password='pw12345!')
+        cls.reader = CustomUser.objects.create_user(id='reader', password='pw12345!')
+        cls.other = CustomUser.objects.create_user(id='other', password='pw12345!')
+        cls.post = Post.objects.create(author=cls.author, title='글', is_complete=True)
+        cls.parent = cls.comment(cls.reader, '부모')
+        cls.replies = [cls.comment(cls.other, f'답글{i}', parent=cls.parent) for i in range(5)]
+
+    @classmethod
+    def comment(cls, user, content, parent=None, is_private=False):
+        return Comment.objects.create(
+            post=cls.post, author=user.profile, author_name=user.id, content=content, parent=parent, is_private=is_private
+        )
+
+    def fetch(self, user=None):
+        client = APIClient()
+        if user:
+            client.force_authenticate(user)
+        response = client.get(f'/posts/{self.post.id}/comments/')
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    def test_build_comment_tree_links_replies_to_parents_in_memory(self):
+        comments = list(Comment.objects.filter(post=self.post).order_by('id'))
+
+        roots, replies_map = build_comment_tree(comments)
+
+        self.assertEqual(roots, [self.parent])
+        self.assertEqual([reply.id for reply in replies_map[self.parent.id]], [reply.id for reply in self.replies])
+        with self.assertNumQueries(0):
+            self.assertEqual(replies_map[self.parent.id][0].parent.content, '부모')
+
+    def test_parent_includes_reply_preview_and_total_count(self):
+        results = self.fetch()
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual([reply['content'] for reply in results[0]['replies']], ['답글0', '답글1', '답글2'])
+        self.assertEqual(results[0]['reply_count'], 5)
+
+    def test_query_count_does_not_grow_with_comments(self):
+        with CaptureQueriesContext(connection) as small:
+            self.fetch(self.reader)
+
+        for i in range(5):
+            parent = self.comment(self.reader, f'부모{i}')
+            for j in range(4):
+                self.comment(self.other, f'답글{i}-{j}', parent=parent)
+
+        with CaptureQueriesContext(connection) as large:
+            self.fetch(self.reader)
+
+        self.assertEqual(len(large), len(small))
+
+    def test_private_reply_is_masked_except_for_allowed_readers(self):
+        self.comment(self.other, '비밀', parent=self.parent, is_private=True)
+        Comment.objects.filter(parent=self.parent).exclude(content='비밀').delete()
+
+        def reply_content(user):
+            return self.fetch(user)[0]['replies'][0]['content']
+
+        self.assertEqual(reply_content(None), SECRET_COMMENT_TEXT)
+        self.assertEqual(reply_content(self.other), '비밀')   # ✅ 댓글 작성자
+        self.assertEqual(reply_content(self.author), '비밀')  # ✅ 게시글 작성자
+        self.assertEqual(reply_content(self.reader), '비밀')  # ✅ 부모 댓글 작성자
+        outsider = CustomUser.objects.create_user(id='outsider', password='pw12345!')
+        self.assertEqual(reply_content(outsider), SECRET_COMMENT_TEXT)
+
+
+class CommentCountTests(TestCase):
+    """ ✅ Post.comment_count (댓글 추가/삭제 시 F() 증감) """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = CustomUser.objects.create_user(id='author', password='pw12345!')
+        cls.post = Post.objects.create(author=cls.author, title='글', is_complete=True)
+
+    def comment(self, parent=None):
+        return Comment.objects.create(
+            post=self.post, author=self.author.profile, author_name='author', content='댓글', parent=parent
+        )
+
+    def comment_count(self):
+        return Post.objects.values_list('comment_count', flat=True).get(pk=self.post.pk)
+
+    def test_count_follows_create_and_delete(self):
+        parent = self.comment()
+        self.comment(parent=parent)
+        self.comment(parent=parent)
+        self.assertEqual(self.comment_count(), 3)
+
+        parent.content = '수정'
+        parent.save()
+        self.assertEqual(self.comment_count(), 3)
+
+        parent.delete()  # ✅ 대댓글도 CASCADE로 함께 삭제
+        self.assertEqual(self.comment_count(), 0)
+
+    def test_count_does_not_go_below_zero(self):
+        comment = self.comment()
+        Post.objects.filter(pk=self.post.pk).update(comment_count=0)
+
+        comment.delete()
+
+        self.assertEqual(self.comment_count(), 0)
+
+    def test_username_change_updates_author_name_of_existing_comments(self):
+        comment = self.comment()
+        profile = self.author.profile
+        profile.username = '새이름'
+        profile.save()
+
+        comment.refresh_from_db()
+        self.assertEqual(comment.author_name, '새이름')
+
+
+class CommentReplyCursorTests(TestCase):
+    """ ✅ 대댓글 목록 (GET /posts/{post_id}/comments/{comment_id}/replies/) """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = CustomUser.objects.create_user(id='author', password='pw12345!')
+        cls.reader = CustomUser.objects.create_user(id='reader', password='pw12345!')
+        cls.post = Post.objects.create(author=cls.author, title='글', is_complete=True)
+        cls.parent = Comment.objects.create(post=cls.post, author=cls.reader.profile, author_name='reader', content='부모')
+        cls.replies = [
+            Comment.objects.create(post=cls.post, author=cls.reader.profile, author_name='reader', content=f'답글{i}', parent=cls.parent)
+            for i in range(5)
+        ]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.reader)
+        self.url = f'/posts/{self.post.id}/comments/{self.parent.id}/replies/'
+
+    def test_after_returns_replies_written_later(self):
+        response = self.client.get(self.url, {'after': self.replies[1].id})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([reply['content'] for reply in response.json()['results']], ['답글2', '답글3', '답글4'])
+
+    def test_after_with_same_created_at_uses_id_as_tiebreaker(self):
+        Comment.objects.filter(parent=self.parent).update(created_at=self.replies[0].created_at)
+
+        response = self.client.get(self.url, {'after': self.replies[2].id})
+
+        self.assertEqual([reply['content'] for reply in response.json()['results']], ['답글3', '답글4'])
+
+    def test_non_numeric_after_is_rejected(self):
+        response = self.client.get(self.url, {'after': 'abc'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('after', response.json())
+
+    def test_after_from_another_thread_is_rejected(self):
+        other = Comment.objects.create(post=self.post, author=self.reader.profile, author_name='reader', content='다른 부모')
+
+        response = self.client.get(self.url, {'after': other.id})
+
+        self.assertEqual(response.status_code, 400)
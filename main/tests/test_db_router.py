@@ -0,0 +1,175 @@
+from unittest import mock, skipUnless
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+from main.authentication import ProfileJWTAuthentication
+from main.db_router import PIN_COOKIE, PrimaryReplicaRouter, ReplicaRoutingMiddleware, _pin_key, pin_recent_writer
+from main.models import CustomUser, Notification, Post
+from main.profile_cards import get_profile_card
+from main.unread_counter import rebuild_unread_count
+
+router = PrimaryReplicaRouter()
+
+
+class AuthenticatedUser:
+    pk = 'member'
+    is_authenticated = True
+
+
+def route(request, action=None):
+    """ ✅ 미들웨어를 거친 요청 안에서 (action 실행 후) 조회가 어느 DB로 가는지 → (DB 별칭, 응답) """
+    seen = {}
+
+    def view(request):
+        if action:
+            action(request)
+        seen['read'] = router.db_for_read(Post)
+        return HttpResponse()
+
+    response = ReplicaRoutingMiddleware(view)(request)
+    return seen['read'], response
+
+
+def write(request):
+    router.db_for_write(Post)
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRoutingMiddlewareTests(SimpleTestCase):
+    """ ✅ 읽기 전용 요청만 복제 DB로, 쓰기 이후에는 주 DB에 고정 """
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def test_get_reads_from_replica(self):
+        self.assertEqual(route(self.factory.get('/'))[0], 'replica')
+
+    def test_post_reads_from_primary(self):
+        self.assertEqual(route(self.factory.post('/'))[0], DEFAULT_DB_ALIAS)
+
+    def test_reads_after_write_in_same_request_use_primary(self):
+        self.assertEqual(route(self.factory.get('/'), write)[0], DEFAULT_DB_ALIAS)
+
+    def test_outside_request_reads_from_primary(self):
+        self.assertEqual(router.db_for_read(Post), DEFAULT_DB_ALIAS)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas_reads_from_primary(self):
+        self.assertEqual(route(self.factory.get('/'))[0], DEFAULT_DB_ALIAS)
+
+    def test_pin_cookie_sends_next_get_to_primary(self):
+        _, response = route(self.factory.post('/'), write)
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+        request = self.factory.get('/')
+        request.COOKIES[PIN_COOKIE] = response.cookies[PIN_COOKIE].value
+        self.assertEqual(route(request)[0], DEFAULT_DB_ALIAS)
+
+    def test_request_without_write_does_not_pin(self):
+        _, response = route(self.factory.post('/'))
+
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_pin_cache_sends_writers_next_get_to_primary(self):
+        request = self.factory.post('/')
+        request.user = AuthenticatedUser()
+        route(request, write)
+        self.assertTrue(cache.get(_pin_key('member')))
+
+        # ✅ 쿠키 없이 (JWT 클라이언트) 같은 사용자가 조회 → 인증 클래스가 pin_recent_writer 호출
+        self.assertEqual(route(self.factory.get('/'), lambda request: pin_recent_writer('member'))[0], DEFAULT_DB_ALIAS)
+        self.assertEqual(route(self.factory.get('/'), lambda request: pin_recent_writer('other'))[0], 'replica')
+
+    async def test_async_get_reads_from_replica(self):
+        seen = {}
+
+        async def view(request):
+            seen['read'] = router.db_for_read(Post)
+            return HttpResponse()
+
+        await ReplicaRoutingMiddleware(view)(self.factory.get('/'))
+
+        self.assertEqual(seen['read'], 'replica')
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRoutingAtomicTests(TransactionTestCase):
+    """ ✅ 트랜잭션 안의 조회는 읽기 요청이어도 주 DB (TestCase는 테스트 전체가 트랜잭션이므로 TransactionTestCase) """
+
+    def test_reads_inside_atomic_block_use_primary(self):
+        def action(request):
+            self.assertEqual(router.db_for_read(Post), 'replica')
+            with transaction.atomic():
+                self.assertEqual(router.db_for_read(Post), DEFAULT_DB_ALIAS)
+
+        self.assertEqual(route(RequestFactory().get('/'), action)[0], 'replica')
+
+
+@mock.patch.object(PrimaryReplicaRouter, 'db_for_read', return_value='replica')
+class CacheFillReadsPrimaryTests(TestCase):
+    """ ✅ 캐시를 채우는 조회 / 인증 사용자 조회는 라우터가 복제 DB를 고르더라도 주 DB에서 """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='member', password='pw12345!')
+        cls.actor = CustomUser.objects.create_user(id='actor', password='pw12345!')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_profile_card_is_filled_from_primary(self, db_for_read):
+        self.assertEqual(get_profile_card('member').user_id, 'member')
+
+    def test_unread_count_is_rebuilt_from_primary(self, db_for_read):
+        post = Post.objects.create(author=self.user, title='글', is_complete=True)
+        Notification.objects.create(recipient=self.user, actor=self.actor, type='post_like', post=post)
+
+        self.assertEqual(rebuild_unread_count('member'), 1)
+
+    def test_authenticated_user_is_loaded_from_primary(self, db_for_read):
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+
+        user, _ = ProfileJWTAuthentication().authenticate(request)
+
+        self.assertEqual(user.profile.urlname, 'member')
+
+
+@skipUnless('replica' in settings.DATABASES, "복제 DB 별칭이 있는 설정에서만 (naver_blog.settings_replica)")
+class ReplicaRoutingIntegrationTests(TransactionTestCase):
+    """ ✅ 실제 요청에서 쿼리가 어느 연결로 가는지 (DJANGO_SETTINGS_MODULE=naver_blog.settings_replica) """
+    databases = '__all__'
+
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(id='member', password='pw12345!')
+        self.post = Post.objects.create(author=self.user, title='글', is_complete=True)
+        self.auth = {'HTTP_AUTHORIZATION': f'Bearer {AccessToken.for_user(self.user)}'}
+
+    def queries(self, method, path):
+        client = APIClient()
+        with CaptureQueriesContext(connections['replica']) as replica, \
+                CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary:
+            response = getattr(client, method)(path, **self.auth)
+        return response, len(replica), len(primary)
+
+    def test_get_queries_replica_and_write_pins_following_get(self):
+        path = f'/posts/{self.post.id}/heart/'
+
+        _, replica_queries, _ = self.queries('get', f'{path}count/')
+        self.assertGreater(replica_queries, 0)
+
+        response, replica_queries, primary_queries = self.queries('post', path)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(replica_queries, 0)
+        self.assertGreater(primary_queries, 0)
+
+        # ✅ 새 클라이언트(쿠키 없음) → 사용자별 고정 캐시로 주 DB
+        _, replica_queries, _ = self.queries('get', f'{path}count/')
+        self.assertEqual(replica_queries, 0)
@@ -0,0 +1,31 @@
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+from main.apps import check_password_hash_iterations
+from main.hashers import ConfigurablePBKDF2PasswordHasher
+
+
+class ConfigurablePBKDF2PasswordHasherTests(SimpleTestCase):
+    """ ✅ PASSWORD_HASH_ITERATIONS 설정 (Django 기본값 이상만 허용) """
+
+    @override_settings(PASSWORD_HASH_ITERATIONS=None)
+    def test_defaults_to_django_iterations(self):
+        self.assertEqual(ConfigurablePBKDF2PasswordHasher().iterations, PBKDF2PasswordHasher.iterations)
+
+    @override_settings(PASSWORD_HASH_ITERATIONS=PBKDF2PasswordHasher.iterations + 1)
+    def test_uses_higher_configured_iterations(self):
+        self.assertEqual(ConfigurablePBKDF2PasswordHasher().iterations, PBKDF2PasswordHasher.iterations + 1)
+
+    @override_settings(PASSWORD_HASH_ITERATIONS=PBKDF2PasswordHasher.iterations - 1)
+    def test_rejects_iterations_below_django_default(self):
+        with self.assertRaises(ImproperlyConfigured):
+            ConfigurablePBKDF2PasswordHasher()
+        self.assertEqual([error.id for error in check_password_hash_iterations(None)], ['main.E001'])
+
+    @override_settings(PASSWORD_HASH_ITERATIONS=PBKDF2PasswordHasher.iterations + 1)
+    def test_hash_with_lower_cost_must_be_updated(self):
+        hasher = ConfigurablePBKDF2PasswordHasher()
+        encoded = PBKDF2PasswordHasher().encode('pw12345!', hasher.salt())
+
+        self.assertTrue(hasher.must_update(encoded))
+        self.assertFalse(hasher.must_update(hasher.encode('pw12345!', hasher.salt())))
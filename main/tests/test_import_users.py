@@ -0,0 +1,72 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from main.models import CustomUser, Profile
+
+
+class ImportUsersCommandTests(TestCase):
+    """ ✅ 사용자 일괄 가져오기 (python manage.py import_users) - 잘못된 행은 건너뛰고 오류로 보고 """
+
+    def run_import(self, lines, suffix='.jsonl'):
+        with tempfile.NamedTemporaryFile('w', suffix=suffix, encoding='utf-8', delete=False) as f:
+            f.write('\n'.join(lines) + '\n')
+        self.addCleanup(os.remove, f.name)
+        stdout, stderr = StringIO(), StringIO()
+        call_command('import_users', f.name, '--workers', '1', stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_valid_rows_create_users_and_profiles(self):
+        self.run_import([
+            json.dumps({'id': 'alice', 'password': 'pw12345!', 'blog_name': '앨리스 블로그'}),
+            json.dumps({'id': 12345, 'password': 'pw12345!'}),
+        ])
+
+        self.assertEqual(Profile.objects.get(user_id='alice').blog_name, '앨리스 블로그')
+        self.assertEqual(Profile.objects.get(user_id='12345').urlname, '12345')
+        self.assertTrue(CustomUser.objects.get(id='alice').check_password('pw12345!'))
+
+    def test_malformed_json_line_is_reported_without_aborting(self):
+        stdout, stderr = self.run_import([
+            '{"id": "broken", "password": ',
+            '["not", "an", "object"]',
+            json.dumps({'id': 'alice', 'password': 'pw12345!'}),
+        ])
+
+        self.assertIn('1번째 줄', stderr)
+        self.assertIn('2번째 줄', stderr)
+        self.assertIn('잘못된 행 2건', stdout)
+        self.assertTrue(CustomUser.objects.filter(id='alice').exists())
+
+    def test_too_long_values_are_reported_per_row(self):
+        stdout, stderr = self.run_import([
+            json.dumps({'id': 'longblog', 'password': 'pw12345!', 'blog_name': '가' * 21}),
+            json.dumps({'id': 'longintro', 'password': 'pw12345!', 'intro': '가' * 101}),
+            json.dumps({'id': 'alice', 'password': 'pw12345!'}),
+        ])
+
+        self.assertIn('blog_name', stderr)
+        self.assertIn('intro', stderr)
+        self.assertEqual(list(CustomUser.objects.values_list('id', flat=True)), ['alice'])
+
+    def test_default_blog_name_fits_for_long_id(self):
+        user_id = 'a' * 40
+        self.run_import([json.dumps({'id': user_id, 'password': 'pw12345!'})])
+
+        blog_name = Profile.objects.get(user_id=user_id).blog_name
+        self.assertEqual(len(blog_name), Profile._meta.get_field('blog_name').max_length)
+        self.assertTrue(blog_name.startswith('a'))
+
+    def test_blank_urlname_is_reported(self):
+        stdout, stderr = self.run_import([
+            'id,password,urlname',
+            'blank,pw12345!,"   "',
+            'alice,pw12345!,',
+        ], suffix='.csv')
+
+        self.assertIn('2번째 줄', stderr)
+        self.assertIn('urlname', stderr)
+        self.assertFalse(CustomUser.objects.filter(id='blank').exists())
+        self.assertEqual(Profile.objects.get(user_id='alice').urlname, 'alice')
@@ -0,0 +1,29 @@
+from django.test import TestCase
+from main.models import CustomUser
+
+
+class AsyncLoginViewTests(TestCase):
+    """ ✅ 비동기 로그인 (POST /login/async/) """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='member', password='pw12345!')
+
+    def login(self, body):
+        return self.client.post('/login/async/', body, content_type='application/json')
+
+    def test_valid_credentials_return_tokens(self):
+        response = self.login({'id': 'member', 'password': 'pw12345!'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('access', response.json())
+
+    def test_wrong_password_is_rejected(self):
+        self.assertEqual(self.login({'id': 'member', 'password': 'wrong'}).status_code, 401)
+
+    def test_non_object_json_body_is_rejected(self):
+        for body in ('[]', '"member"', '1', 'null', '{broken'):
+            with self.subTest(body=body):
+                response = self.login(body)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {'error': '요청 본문이 올바른 JSON이 아닙니다.'})
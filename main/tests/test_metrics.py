@@ -0,0 +1,77 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from django.test import SimpleTestCase, override_settings
+from main.metrics import collect_snapshots, write_snapshot
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return process.pid
+
+
+class MetricsSnapshotTests(SimpleTestCase):
+    """ ✅ 워커별 집계 파일 합산 (METRICS_DIR) """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        overridden = override_settings(METRICS_DIR=self.directory, METRICS_FLUSH_SECONDS=5)
+        overridden.enable()
+        self.addCleanup(overridden.disable)
+
+    def write(self, pid, age):
+        path = os.path.join(self.directory, f"{pid}.json")
+        with open(path, 'w') as f:
+            json.dump({"histograms": {}, "counters": {}, "components": {"password_hash_pool_queued": 7}}, f)
+        modified = time.time() - age
+        os.utime(path, (modified, modified))
+        return path
+
+    def components(self):
+        return [snapshot["components"].get("password_hash_pool_queued") for snapshot in collect_snapshots()[1:]]
+
+    def test_recent_snapshot_from_another_worker_is_merged(self):
+        self.write(dead_pid(), age=1)
+
+        self.assertEqual(self.components(), [7])
+
+    def test_stale_snapshot_of_exited_worker_is_skipped_and_removed(self):
+        path = self.write(dead_pid(), age=60)
+
+        self.assertEqual(self.components(), [])
+        self.assertFalse(os.path.exists(path))
+
+    def test_idle_worker_snapshot_is_still_merged(self):
+        path = self.write(os.getppid(), age=60)  # ✅ 오래 저장하지 않았지만 살아 있는 프로세스
+
+        self.assertEqual(self.components(), [7])
+        self.assertTrue(os.path.exists(path))
+
+    def test_own_snapshot_is_not_merged_twice(self):
+        write_snapshot(self.directory, {"histograms": {}, "counters": {}, "components": {}})
+
+        self.assertEqual(len(collect_snapshots()), 1)
+
+
+class MetricsViewTests(SimpleTestCase):
+    """ ✅ GET /metrics 접근 제한 """
+
+    @override_settings(METRICS_TOKEN=None, DEBUG=False)
+    def test_without_token_is_forbidden_outside_debug(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+
+    @override_settings(METRICS_TOKEN=None, DEBUG=True)
+    def test_without_token_is_open_in_debug(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 200)
+
+    @override_settings(METRICS_TOKEN='secret', DEBUG=False)
+    def test_token_is_required(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', headers={'Authorization': 'Bearer wrong'}).status_code, 403)
+        self.assertEqual(self.client.get('/metrics', headers={'Authorization': 'Bearer secret'}).status_code, 200)
@@ -0,0 +1,111 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from main.models import CustomUser, Neighbor
+from main.models.neighbor import NeighborEdge, add_neighbor, are_neighbors, remove_neighbor
+
+
+class NeighborGraphTests(TestCase):
+    """ ✅ 서로이웃 신청/수락/거절/삭제 - 관계는 NeighborEdge(Profile.neighbors) 양방향 행으로만 저장 """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = CustomUser.objects.create_user(id='alice', password='pw12345!')
+        cls.bob = CustomUser.objects.create_user(id='bob', password='pw12345!')
+        cls.carol = CustomUser.objects.create_user(id='carol', password='pw12345!')
+
+    def setUp(self):
+        cache.clear()
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def linked(self, user, other):
+        return (are_neighbors(user.profile.id, other.profile.id), are_neighbors(other.profile.id, user.profile.id))
+
+    def test_request_then_accept_creates_edges_in_both_directions(self):
+        self.assertEqual(self.client_for(self.alice).post('/neighbors/bob/', {'request_message': '안녕'}).status_code, 201)
+        self.assertTrue(Neighbor.objects.filter(from_user=self.alice, to_user=self.bob, status='pending').exists())
+
+        response = self.client_for(self.bob).put('/neighbors/accept/alice/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.linked(self.alice, self.bob), (True, True))
+        self.assertFalse(Neighbor.objects.exists())  # ✅ 처리된 신청은 삭제
+        self.assertEqual(self.client_for(self.alice).post('/neighbors/bob/').status_code, 400)  # ✅ 이미 서로이웃
+
+    def test_reject_deletes_request_without_edges(self):
+        self.client_for(self.alice).post('/neighbors/bob/')
+
+        response = self.client_for(self.bob).delete('/neighbors/reject/alice/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.linked(self.alice, self.bob), (False, False))
+        self.assertFalse(Neighbor.objects.exists())
+
+    def test_accept_without_pending_request_returns_404(self):
+        self.assertEqual(self.client_for(self.bob).put('/neighbors/accept/alice/').status_code, 404)
+
+    def test_bulk_accept_also_clears_my_pending_request_to_them(self):
+        self.client_for(self.alice).post('/neighbors/carol/')
+        self.client_for(self.bob).post('/neighbors/carol/')
+        Neighbor.objects.create(from_user=self.carol, to_user=self.alice)  # ✅ 서로 신청한 상태
+
+        response = self.client_for(self.carol).post(
+            '/neighbors/requests/bulk/', {'urlnames': ['alice', 'bob', 'nobody'], 'action': 'accept'}, format='json'
+        )
+
+        self.assertEqual(sorted(response.json()['processed']), ['alice', 'bob'])
+        self.assertEqual(response.json()['not_found'], ['nobody'])
+        self.assertEqual(self.linked(self.carol, self.alice), (True, True))
+        self.assertEqual(self.linked(self.carol, self.bob), (True, True))
+        self.assertFalse(Neighbor.objects.exists())
+
+    def test_status_change_on_model_save_updates_graph(self):
+        request = Neighbor.objects.create(from_user=self.alice, to_user=self.bob)
+
+        request.status = 'accepted'
+        request.save()
+
+        self.assertEqual(self.linked(self.alice, self.bob), (True, True))
+        self.assertFalse(Neighbor.objects.exists())
+
+    def test_remove_deletes_both_directions(self):
+        add_neighbor(self.alice.profile, self.bob.profile)
+        add_neighbor(self.alice.profile, self.carol.profile)
+
+        remove_neighbor(self.bob.profile, self.alice.profile.id)
+
+        self.assertEqual(self.linked(self.alice, self.bob), (False, False))
+        self.assertEqual(self.linked(self.alice, self.carol), (True, True))
+        self.assertEqual(NeighborEdge.objects.count(), 2)
+
+
+class NeighborRouteTests(TestCase):
+    """ ✅ 고정 경로가 neighbors/<urlname>/ (서로이웃 신청)과 겹치지 않는지 """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='member', password='pw12345!')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_my_neighbor_list(self):
+        self.assertEqual(self.client.get('/neighbors/list/me/').status_code, 200)
+
+    def test_my_neighbor_recommendations(self):
+        self.assertEqual(self.client.get('/neighbors/recommendations/me/').status_code, 200)
+
+    def test_user_with_reserved_looking_urlname_can_receive_request(self):
+        for urlname in ('me', 'recommendations'):
+            with self.subTest(urlname=urlname):
+                CustomUser.objects.create_user(id=urlname, password='pw12345!')
+
+                response = self.client.post(f'/neighbors/{urlname}/')
+
+                self.assertEqual(response.status_code, 201)
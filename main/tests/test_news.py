@@ -0,0 +1,144 @@
+from datetime import timedelta
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from main.models import Comment, CustomUser, Heart, Notification, Post
+from main.unread_counter import get_unread_count
+from main.views.news import MyNewsDigestView
+
+
+class NewsDigestPaginationTests(TestCase):
+    """ ✅ 내 소식 묶음 (GET /news/digest/) """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUser.objects.create_user(id='owner', password='pw12345!')
+        cls.actor = CustomUser.objects.create_user(id='actor', password='pw12345!')
+        cls.latest_at = timezone.now() - timedelta(hours=1)
+        cls.posts = [Post.objects.create(author=cls.owner, title=f'글{i}', is_complete=True) for i in range(4)]
+        # ✅ 게시글 4개 × 종류 2개 = 8묶음, 모두 같은 시각에 끝남
+        for post in cls.posts:
+            for type_ in ('post_comment', 'post_like'):
+                Notification.objects.create(
+                    recipient=cls.owner, actor=cls.actor, type=type_, post=post, created_at=cls.latest_at
+                )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def fetch_all(self, page_size):
+        keys, params = [], {}
+        with mock.patch.object(MyNewsDigestView, 'page_size', page_size):
+            while True:
+                response = self.client.get('/news/digest/', params)
+                self.assertEqual(response.status_code, 200)
+                data = response.json()
+                keys += [(group['post_id'], group['type']) for group in data['results']]
+                if data['next_before'] is None:
+                    return keys
+                params = {'before': data['next_before']}
+
+    def test_groups_with_same_latest_at_are_not_skipped_at_page_boundary(self):
+        for page_size in (1, 3, 5):
+            with self.subTest(page_size=page_size):
+                keys = self.fetch_all(page_size)
+                self.assertEqual(len(keys), 8)
+                self.assertEqual(len(set(keys)), 8)
+
+    def test_pages_follow_latest_post_type_order(self):
+        keys = self.fetch_all(3)
+
+        expected = [(post.id, type_) for post in sorted(self.posts, key=lambda post: -post.id)
+                    for type_ in ('post_comment', 'post_like')]
+        self.assertEqual(keys, expected)
+
+    def test_iso_before_returns_groups_ending_earlier(self):
+        older = Post.objects.create(author=self.owner, title='예전 글', is_complete=True)
+        Notification.objects.create(
+            recipient=self.owner, actor=self.actor, type='post_like', post=older,
+            created_at=self.latest_at - timedelta(minutes=5),
+        )
+
+        response = self.client.get('/news/digest/', {'before': self.latest_at.isoformat()})
+
+        self.assertEqual([group['post_id'] for group in response.json()['results']], [older.id])
+
+    def test_invalid_before_is_rejected(self):
+        response = self.client.get('/news/digest/', {'before': 'not-a-cursor'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('before', response.json())
+
+
+class NotificationSignalTests(TestCase):
+    """ ✅ 댓글/대댓글/좋아요 → 내 소식(Notification) 기록 + 읽지 않은 개수 캐시 """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUser.objects.create_user(id='owner', password='pw12345!')
+        cls.commenter = CustomUser.objects.create_user(id='commenter', password='pw12345!')
+        cls.replier = CustomUser.objects.create_user(id='replier', password='pw12345!')
+        cls.post = Post.objects.create(author=cls.owner, title='글', is_complete=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def comment(self, user, parent=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Comment.objects.create(
+                post=self.post, author=user.profile, author_name=user.id, content='댓글', parent=parent
+            )
+
+    def received(self, user):
+        return sorted(Notification.objects.filter(recipient=user).values_list('type', flat=True))
+
+    def test_comment_and_reply_notify_post_and_parent_authors(self):
+        parent = self.comment(self.commenter)
+        self.comment(self.replier, parent=parent)
+
+        self.assertEqual(self.received(self.owner), ['post_comment', 'post_comment'])
+        self.assertEqual(self.received(self.commenter), ['comment_reply'])
+        self.assertEqual(self.received(self.replier), [])
+
+    def test_own_activity_is_not_recorded(self):
+        parent = self.comment(self.owner)
+        self.comment(self.owner, parent=parent)
+        Heart.objects.create(post=self.post, user=self.owner)
+
+        self.assertFalse(Notification.objects.exists())
+
+    def test_heart_notifies_post_author(self):
+        Heart.objects.create(post=self.post, user=self.commenter)
+
+        self.assertEqual(self.received(self.owner), ['post_like'])
+
+    def test_unread_count_follows_new_and_deleted_notifications(self):
+        self.assertEqual(get_unread_count(self.owner.id), 0)  # ✅ 캐시 채우기
+
+        comment = self.comment(self.commenter)
+        with self.captureOnCommitCallbacks(execute=True):
+            heart = Heart.objects.create(post=self.post, user=self.commenter)
+        self.assertEqual(get_unread_count(self.owner.id), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            heart.delete()  # ✅ 좋아요 취소 → 소식도 삭제
+        self.assertEqual(get_unread_count(self.owner.id), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            comment.delete()
+        self.assertEqual(get_unread_count(self.owner.id), 0)
+
+    def test_read_endpoint_and_badge_use_the_same_count(self):
+        self.comment(self.commenter)
+        self.comment(self.replier)
+        client = APIClient()
+        client.force_authenticate(self.owner)
+        self.assertEqual(client.get('/news/unread-count/').json(), {'unread_count': 2})
+
+        response = client.post('/news/read/', {'until': timezone.now().isoformat()}, format='json')
+
+        self.assertEqual(response.json(), {'updated': 2, 'unread_count': 0})
+        self.assertEqual(client.get('/news/unread-count/').json(), {'unread_count': 0})
@@ -0,0 +1,49 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient, APIRequestFactory
+from main.models import CustomUser
+from main.serializers.profile import ProfileCardSerializer, ProfileSerializer
+
+
+class ProfilePublicViewTests(TestCase):
+    """ ✅ 타인의 프로필 조회 (GET /profile/{urlname}/) - 캐시된 프로필 카드로 응답 """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUser.objects.create_user(id='owner', password='pw12345!')
+        cls.viewer = CustomUser.objects.create_user(id='viewer', password='pw12345!')
+        profile = cls.owner.profile
+        profile.intro = '안녕하세요'
+        profile.user_pic.name = 'profile_pics/owner.png'
+        profile.save()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_card_serializer_covers_profile_serializer_fields(self):
+        self.assertEqual(
+            list(ProfileCardSerializer().fields),
+            list(ProfileSerializer.Meta.fields) + ['is_neighbor'],
+        )
+
+    def test_response_matches_profile_serializer(self):
+        response = APIClient().get('/profile/owner/')
+
+        request = APIRequestFactory().get('/profile/owner/')
+        expected = dict(ProfileSerializer(self.owner.profile, context={'request': request}).data, is_neighbor=False)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), expected)
+
+    def test_profile_change_is_visible_after_save(self):
+        client = APIClient()
+        client.force_authenticate(self.viewer)
+        client.get('/profile/owner/')  # ✅ 카드 캐시 채우기
+
+        profile = self.owner.profile
+        profile.neighbor_visibility = False
+        profile.save()
+
+        self.assertEqual(client.get('/profile/owner/').json()['neighbor_visibility'], False)
+
+    def test_unknown_urlname_returns_404(self):
+        self.assertEqual(APIClient().get('/profile/nobody/').status_code, 404)
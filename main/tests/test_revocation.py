@@ -0,0 +1,132 @@
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from main.models import CustomUser
+from main.revocation import BloomFilter, FilteredRefreshToken, RevokedTokenFilter, revoked_tokens
+
+
+def blacklist_elsewhere(token):
+    """ ✅ 다른 워커에서 폐기한 경우와 같이, 이 프로세스의 필터/세대 값을 건드리지 않고 블랙리스트에만 추가 """
+    outstanding = OutstandingToken.objects.get(jti=token[api_settings.JTI_CLAIM])
+    BlacklistedToken.objects.create(token=outstanding)
+
+
+class BloomFilterTests(TestCase):
+
+    def test_added_values_are_always_found(self):
+        bloom = BloomFilter(100)
+        values = [f'jti-{i}' for i in range(100)]
+        for value in values:
+            bloom.add(value)
+
+        self.assertTrue(all(value in bloom for value in values))
+        self.assertLess(sum(f'other-{i}' in bloom for i in range(1000)), 50)
+
+
+class RevokedTokenFilterTests(TestCase):
+    """ ✅ 폐기 토큰 블룸 필터 (필터에 없다는 판단이 다른 워커의 폐기를 놓치지 않는지) """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='member', password='pw12345!')
+
+    def setUp(self):
+        cache.clear()
+        self.filter = RevokedTokenFilter()
+
+    def test_per_process_cache_sees_revocation_from_another_process(self):
+        token = FilteredRefreshToken.for_user(self.user)
+        token.check_blacklist()
+
+        blacklist_elsewhere(token)
+
+        with self.assertRaises(TokenError):
+            token.check_blacklist()
+
+    def test_per_process_cache_falls_back_to_blacklist_lookup(self):
+        token = FilteredRefreshToken.for_user(self.user)
+
+        with self.assertNumQueries(0):  # ✅ 필터 동기화 쿼리 없음 (check_blacklist의 jti 조회 1번만)
+            self.assertTrue(self.filter.might_be_revoked(token[api_settings.JTI_CLAIM]))
+
+        self.assertEqual(self.filter.metrics(), {"db_checks": 1, "skipped": 0})
+
+    def test_sync_query_is_counted_as_db_check(self):
+        token = FilteredRefreshToken.for_user(self.user)
+        jti = token[api_settings.JTI_CLAIM]
+        with mock.patch('main.revocation.PER_PROCESS_CACHES', ()):
+            self.filter.might_be_revoked(jti)  # ✅ 필터 생성 (DB 조회)
+            self.filter.might_be_revoked(jti)  # ✅ 필터만으로 판단
+            with self.settings(REVOKED_FILTER_SYNC_SECONDS=0):
+                self.filter.might_be_revoked(jti)  # ✅ 주기 동기화 (DB 조회)
+
+        self.assertEqual(self.filter.metrics(), {"db_checks": 2, "skipped": 1})
+
+    def test_shared_cache_trusts_negatives_until_generation_changes(self):
+        token = FilteredRefreshToken.for_user(self.user)
+        jti = token[api_settings.JTI_CLAIM]
+        with mock.patch('main.revocation.PER_PROCESS_CACHES', ()):
+            self.assertFalse(self.filter.might_be_revoked(jti))
+            blacklist_elsewhere(token)
+            with self.assertNumQueries(0):
+                self.assertFalse(self.filter.might_be_revoked(jti))  # ✅ 동기화 주기 안에서는 DB 조회 없음
+
+            RevokedTokenFilter().mark_revoked('unrelated')  # ✅ 다른 프로세스가 세대 값 증가
+
+            self.assertTrue(self.filter.might_be_revoked(jti))
+
+    def test_shared_cache_rechecks_after_sync_interval(self):
+        token = FilteredRefreshToken.for_user(self.user)
+        jti = token[api_settings.JTI_CLAIM]
+        with mock.patch('main.revocation.PER_PROCESS_CACHES', ()), self.settings(REVOKED_FILTER_SYNC_SECONDS=0):
+            self.assertFalse(self.filter.might_be_revoked(jti))
+            blacklist_elsewhere(token)
+
+            self.assertTrue(self.filter.might_be_revoked(jti))
+
+
+class RefreshTokenRotationTests(TestCase):
+    """ ✅ 토큰 재발급 / 로그아웃 후 이전 리프레시 토큰 재사용 차단 """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='member', password='pw12345!')
+
+    def setUp(self):
+        cache.clear()
+        revoked_tokens._bloom = None  # ✅ 테스트마다 필터를 DB 기준으로 다시 생성
+
+    def test_rotated_refresh_token_cannot_be_reused(self):
+        refresh = str(FilteredRefreshToken.for_user(self.user))
+        client = APIClient()
+
+        first = client.post('/token/refresh/', {'refresh': refresh}, format='json')
+        reused = client.post('/token/refresh/', {'refresh': refresh}, format='json')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(reused.status_code, 401)
+
+    def test_token_revoked_by_another_worker_cannot_be_used(self):
+        token = FilteredRefreshToken.for_user(self.user)
+        client = APIClient()
+        client.post('/token/refresh/', {'refresh': str(FilteredRefreshToken.for_user(self.user))}, format='json')
+
+        blacklist_elsewhere(token)
+        response = client.post('/token/refresh/', {'refresh': str(token)}, format='json')
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_logged_out_refresh_token_cannot_be_reused(self):
+        token = FilteredRefreshToken.for_user(self.user)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        logout = client.post('/logout/', {'refresh': str(token)}, format='json')
+        reused = APIClient().post('/token/refresh/', {'refresh': str(token)}, format='json')
+
+        self.assertEqual(logout.status_code, 200)
+        self.assertEqual(reused.status_code, 401)
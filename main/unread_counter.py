@@ -0,0 +1,50 @@
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from main.models.notification import Notification
+
+# ✅ 읽지 않은 내 소식 개수 캐시 (배지 표시용)
+# - 소식이 생기면 +1, 읽음 처리/삭제되면 -1
+# - 캐시에 없으면 (recipient, is_read, created_at) 인덱스로 다시 세어 채움
+# - TTL이 지나면 DB 기준으로 다시 계산되므로 캐시가 어긋나도 스스로 복구됨
+# - 다시 셀 때는 항상 주 DB에서 (지연된 복제 DB의 값을 캐시에 채우면 TTL 동안 어긋난 값이 남음)
+UNREAD_COUNT_TIMEOUT = 60 * 10
+
+
+def _key(user_id):
+    return f"news:unread:{user_id}"
+
+
+def get_unread_count(user_id):
+    """ ✅ 읽지 않은 소식 개수 (캐시 → 없으면 DB에서 다시 계산) """
+    count = cache.get(_key(user_id))
+    if count is None:
+        count = rebuild_unread_count(user_id)
+    return count
+
+
+def rebuild_unread_count(user_id):
+    """ ✅ DB 기준으로 개수를 다시 계산하여 캐시에 저장 """
+    count = Notification.objects.using(DEFAULT_DB_ALIAS).filter(recipient_id=user_id, is_read=False).count()
+    cache.set(_key(user_id), count, UNREAD_COUNT_TIMEOUT)
+    return count
+
+
+def add_unread_count(user_id, delta):
+    """
+    ✅ 캐시된 개수를 delta만큼 증감
+    - 캐시에 값이 없으면 아무것도 하지 않음 (다음 조회 때 DB에서 다시 계산)
+    - 0 아래로 내려가면 어긋난 것이므로 캐시를 비움
+    """
+    if not delta:
+        return
+    try:
+        count = cache.incr(_key(user_id), delta)
+    except ValueError:
+        return
+    if count < 0:
+        cache.delete(_key(user_id))
+
+
+def reset_unread_count(user_id):
+    """ ✅ 캐시를 비워 다음 조회 때 DB에서 다시 계산하도록 함 """
+    cache.delete(_key(user_id))
@@ -1,11 +1,13 @@
 from .signup import SignupView
-from .profile import ProfileDetailView,ProfilePublicView,ProfileUrlnameUpdateView
-from .login import LoginView
+from .profile import ProfileDetailView,ProfilePublicView,ProfileUrlnameUpdateView,AsyncProfilePublicView
+from .login import LoginView,AsyncLoginView
 from .logout import LogoutView
-from .post import PostListView,PostCreateView,PostMyView,PostMyDetailView,PostMutualView,PostDetailView,PostManageView,DraftPostListView,DraftPostDetailView
-from .comment import CommentListView,CommentDetailView
+from .post import PostListView,PostCreateView,PostMyView,PostMyDetailView,PostMutualView,PostDetailView,PostManageView,DraftPostListView,DraftPostDetailView,AsyncPostListView,AsyncPostDetailView
+from .comment import CommentListView,CommentDetailView,CommentReplyListView,AsyncCommentListView
 from .heart import ToggleHeartView, PostHeartUsersView,PostHeartCountView
 from .commentHeart import ToggleCommentHeartView,CommentHeartCountView
-from .neighbor import NeighborView,NeighborAcceptView,NeighborRejectView,NeighborRequestListView,PublicNeighborListView
-from .activity import MyActivityListView
-from .news import MyNewsListView
\ No newline at end of file
+from .neighbor import NeighborView,NeighborAcceptView,NeighborRejectView,NeighborRequestListView,NeighborRequestBulkView,PublicNeighborListView,MyNeighborListView,MyNeighborRecommendationView
+from .activity import MyActivityListView,MyActivityHistoryView
+from .news import MyNewsListView,MyNewsReadView,MyNewsUnreadCountView,MyNewsDigestView,AsyncMyNewsListView
+from .events import EventStreamView
+from .metrics import MetricsView
@@ -10,6 +10,9 @@ from main.models.heart import Heart
 from main.serializers.activity import ActivitySerializer
 from django.db.models import Q
 from django.shortcuts import redirect
+from drf_yasg import openapi
+from rest_framework.exceptions import ValidationError
+from main.pagination import MergedCursorPagination
 
 
 class MyActivityListView(ListAPIView):
@@ -36,12 +39,12 @@ class MyActivityListView(ListAPIView):
         # ✅ 내가 작성한 댓글 (Comment에서 Profile 기준으로 필터링)
         my_comments = list(Comment.objects.filter(
             author=profile, is_read=False, is_parent=True
-        ).select_related('author').order_by('-created_at'))
+        ).select_related('author', 'post').order_by('-created_at'))
 
         # ✅ 내가 작성한 대댓글 (Comment에서 Profile 기준으로 필터링)
         my_replies = list(Comment.objects.filter(
             author=profile, is_read=False, is_parent=False
-        ).select_related('author').order_by('-created_at'))
+        ).select_related('author', 'post').order_by('-created_at'))
 
         # ✅ 최신순 정렬 후 최대 5개 반환
         combined_activity = sorted(
@@ -52,3 +55,63 @@ class MyActivityListView(ListAPIView):
 
         return combined_activity
 
+
+class MyActivityHistoryView(ListAPIView):
+    """
+    ✅ 내 활동 전체 기록 (GET /activity/history/)
+    - 내가 누른 좋아요, 내가 쓴 댓글/대댓글을 최신순으로 커서 페이지네이션
+    - 좋아요/댓글 테이블을 각각 인덱스 순서대로 페이지 크기만큼만 읽어 병합 (k-way merge)
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = ActivitySerializer
+    pagination_class = MergedCursorPagination
+
+    ACTIVITY_TYPES = ("liked_post", "written_comment", "written_reply")
+
+    @swagger_auto_schema(
+        operation_summary="내 활동 기록 조회",
+        operation_description="내가 누른 좋아요, 내가 작성한 댓글/대댓글 전체 기록을 최신순으로 커서 페이지네이션하여 조회합니다. "
+                              "`type`으로 활동 종류를 필터링할 수 있습니다 (쉼표로 여러 개 지정).",
+        manual_parameters=[
+            openapi.Parameter('type', openapi.IN_QUERY, description="liked_post, written_comment, written_reply (쉼표 구분)",
+                              type=openapi.TYPE_STRING, required=False),
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="다음 페이지 커서", type=openapi.TYPE_STRING, required=False),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="페이지 크기 (최대 100)", type=openapi.TYPE_INTEGER, required=False),
+        ],
+        responses={200: ActivitySerializer(many=True)}
+    )
+    def list(self, request, *args, **kwargs):
+        page = self.paginator.paginate_sources(request, self.get_sources())
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    def get_activity_types(self):
+        raw = self.request.query_params.get('type')
+        if not raw:
+            return set(self.ACTIVITY_TYPES)
+
+        types = {value.strip() for value in raw.split(',') if value.strip()}
+        invalid = types - set(self.ACTIVITY_TYPES)
+        if invalid:
+            raise ValidationError({"type": f"유효하지 않은 활동 종류입니다: {', '.join(sorted(invalid))}"})
+        return types
+
+    def get_sources(self):
+        """ ✅ 활동 종류별 원본 queryset (게시글 join) """
+        user = self.request.user
+        types = self.get_activity_types()
+        sources = {}
+
+        if "liked_post" in types:
+            sources["heart"] = Heart.objects.filter(user=user).select_related('post')
+
+        comment_types = types & {"written_comment", "written_reply"}
+        if comment_types:
+            comments = Comment.objects.filter(author=user.profile).select_related('post')
+            if comment_types == {"written_comment"}:
+                comments = comments.filter(is_parent=True)
+            elif comment_types == {"written_reply"}:
+                comments = comments.filter(is_parent=False)
+            sources["comment"] = comments
+
+        return sources
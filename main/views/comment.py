@@ -1,7 +1,8 @@
 import re
 from rest_framework import generics, status
-from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
-from django.db.models import Q
+from rest_framework.generics import ListAPIView, ListCreateAPIView, RetrieveUpdateDestroyAPIView
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
 from django.shortcuts import get_object_or_404
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.exceptions import ValidationError
@@ -9,7 +10,10 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from main.models.comment import Comment
 from main.models.post import Post
-from main.serializers.comment import CommentSerializer
+from main.models.neighbor import aare_neighbors, are_neighbors
+from main.serializers.comment import CommentSerializer, build_comment_tree
+from main.pagination import AsyncCommentPagination, CommentCursorPagination
+from main.async_api import AsyncAPIView, api_response
 from main.models.profile import Profile  # ✅ Profile 모델 임포트
 from django.contrib.auth import get_user_model
 from rest_framework.response import Response
@@ -18,30 +22,104 @@ from django.http import Http404
 User = get_user_model()
 
 
+def get_readable_post(post_id, user):
+    """
+    ✅ 댓글을 조회할 수 있는 게시글 반환 (없거나 권한이 없으면 None)
+    - '나만 보기' 게시글은 작성자 본인만, '서로 이웃 공개' 게시글은 서로 이웃만 조회 가능
+    """
+    post = Post.objects.filter(id=post_id).select_related('author__profile').first()
+    if not post:
+        return None
+
+    if post.visibility == 'me' and (not user.is_authenticated or post.author.profile != user.profile):
+        return None
+
+    if post.visibility == 'mutual' and (
+            not user.is_authenticated or not are_neighbors(post.author.profile.id, user.profile.id)):
+        return None
+
+    return post
+
+
+async def aget_readable_post(post_id, user):
+    """ ✅ get_readable_post()의 async 버전 """
+    post = await Post.objects.filter(id=post_id).select_related('author__profile').afirst()
+    if not post:
+        return None
+
+    if post.visibility == 'me' and (not user.is_authenticated or post.author.profile != user.profile):
+        return None
+
+    if post.visibility == 'mutual' and (
+            not user.is_authenticated or not await aare_neighbors(post.author.profile.id, user.profile.id)):
+        return None
+
+    return post
+
+
+def parent_comments_queryset(post_id):
+    """ ✅ 게시글의 부모 댓글 (작성자, 게시글 작성자 프로필 join) """
+    return Comment.objects.filter(post_id=post_id, parent__isnull=True).select_related(
+        'author', 'post__author__profile'
+    )
+
+
+def reply_preview_queryset(post_id, parent_ids, size):
+    """
+    ✅ 부모 댓글별 앞쪽 대댓글 `size`개 + 전체 대댓글 수(`reply_total`)
+    """
+    if not parent_ids:
+        return Comment.objects.none()
+
+    return Comment.objects.filter(
+        post_id=post_id, parent_id__in=parent_ids
+    ).select_related('author', 'post__author__profile').annotate(
+        reply_rank=Window(RowNumber(), partition_by=[F('parent_id')], order_by=[F('created_at').asc(), F('id').asc()]),
+        reply_total=Window(Count('id'), partition_by=[F('parent_id')]),
+    ).filter(reply_rank__lte=size).order_by('created_at', 'id')
+
+
 class CommentListView(ListCreateAPIView):
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = CommentCursorPagination
+    reply_preview_size = 3  # ✅ 부모 댓글마다 함께 내려주는 대댓글 수 (나머지는 대댓글 목록 API로 조회)
 
     @swagger_auto_schema(
         operation_summary="댓글 목록 조회",
-        operation_description="게시글의 댓글 및 대댓글을 조회합니다. 비밀 댓글은 작성자 또는 게시글 작성자만 볼 수 있습니다.",
+        operation_description="게시글의 부모 댓글을 커서 페이지네이션으로 조회합니다. "
+                              "각 댓글에는 대댓글이 최대 3개까지 포함되며, 전체 대댓글 수는 `reply_count`로 반환됩니다. "
+                              "비밀 댓글은 작성자 또는 게시글 작성자만 볼 수 있습니다.",
+        manual_parameters=[
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="다음/이전 페이지 커서", type=openapi.TYPE_STRING, required=False),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="페이지 크기 (최대 100)", type=openapi.TYPE_INTEGER, required=False),
+        ],
         responses={
             200: openapi.Response(description="조회 성공", schema=CommentSerializer(many=True)),
             403: openapi.Response(description="조회 권한이 없습니다.")
         }
     )
     def get(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
+        page = self.paginate_queryset(self.get_queryset())  # ✅ 부모 댓글 한 페이지만 조회
 
-        if not queryset.exists():
+        if not page and not request.query_params.get(self.paginator.cursor_query_param):
             return Response({"error": "이 게시글의 댓글을 조회할 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        self.queryset = queryset
-        return super().get(request, *args, **kwargs)
+        # ✅ 페이지에 속한 부모 댓글들의 앞쪽 대댓글 K개와 전체 대댓글 수를 한 번의 쿼리로 조회
+        replies = list(self.get_reply_preview([comment.id for comment in page]))
+        reply_counts = {reply.parent_id: reply.reply_total for reply in replies}
+
+        # ✅ 메모리에서 부모 → 대댓글 트리 조립 (대댓글별 추가 쿼리 없음)
+        roots, replies_map = build_comment_tree(page + replies)
+        context = self.get_serializer_context()
+        context['replies_map'] = replies_map
+        context['reply_counts'] = reply_counts
+        serializer = CommentSerializer(roots, many=True, context=context)
+        return self.get_paginated_response(serializer.data)
 
     def get_queryset(self):
         """
-        ✅ 특정 댓글 조회 (비밀 댓글 및 'mutual' 게시글 제한)
+        ✅ 게시글의 부모 댓글 조회 (비밀 댓글 및 'mutual' 게시글 제한)
         """
         if getattr(self, 'swagger_fake_view', False):
             return Comment.objects.none()
@@ -50,21 +128,15 @@ class CommentListView(ListCreateAPIView):
         if post_id is None:
             return Comment.objects.none()
 
-        post = Post.objects.filter(id=post_id).first()
+        post = get_readable_post(post_id, self.request.user)
         if not post:
             return Comment.objects.none()
 
-        user = self.request.user
-        if post.visibility == 'me' and (not user.is_authenticated or post.author.profile != user.profile):
-            return Comment.objects.none()
-
-        if post.visibility == 'mutual' and not post.author.profile.neighbors.filter(id=user.profile.id).exists():
-            return Comment.objects.none()
-
-        # ✅ 댓글과 대댓글을 계층적으로 가져오기
-        comments = Comment.objects.filter(post_id=post_id, parent__isnull=True).prefetch_related('replies')  # 댓글만 필터링하고 대댓글은 replies로 가져옴
+        # ✅ 부모 댓글을 작성자, 게시글 작성자 프로필과 함께 가져오기 (대댓글은 get_reply_preview()에서 조회)
+        return parent_comments_queryset(post_id)
 
-        return comments
+    def get_reply_preview(self, parent_ids):
+        return reply_preview_queryset(self.kwargs.get('post_id'), parent_ids, self.reply_preview_size)
 
     @swagger_auto_schema(
         operation_summary="댓글 생성",
@@ -96,7 +168,7 @@ class CommentListView(ListCreateAPIView):
             return Response({"error": "이 게시글에는 작성자 본인만 댓글을 작성할 수 있습니다."}, status=403)
 
         # ✅ '서로 이웃 공개' 게시글 → 서로 이웃인지 체크
-        if post.visibility == 'mutual' and not post.author.profile.neighbors.filter(id=user.profile.id).exists():
+        if post.visibility == 'mutual' and not are_neighbors(post.author.profile.id, user.profile.id):
             return Response({"error": "서로 이웃 관계인 사용자만 댓글을 작성할 수 있습니다."}, status=403)
 
         # ✅ 댓글 저장
@@ -108,6 +180,73 @@ class CommentListView(ListCreateAPIView):
 
         return Response(serializer.errors, status=400)
 
+class CommentReplyListView(ListAPIView):
+    """
+    ✅ 특정 댓글의 대댓글 목록 (GET /posts/{post_id}/comments/{comment_id}/replies/)
+    - 댓글 목록에 포함되지 않은 나머지 대댓글을 커서 페이지네이션으로 조회
+    """
+    serializer_class = CommentSerializer
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = CommentCursorPagination
+
+    @swagger_auto_schema(
+        operation_summary="대댓글 목록 조회",
+        operation_description="특정 댓글의 대댓글을 작성순으로 커서 페이지네이션하여 조회합니다. "
+                              "`after`에 댓글 목록에서 마지막으로 받은 대댓글 ID를 넘기면 그 이후의 대댓글부터 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter('after', openapi.IN_QUERY, description="이미 받은 마지막 대댓글 ID", type=openapi.TYPE_INTEGER, required=False),
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="다음/이전 페이지 커서", type=openapi.TYPE_STRING, required=False),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="페이지 크기 (최대 100)", type=openapi.TYPE_INTEGER, required=False),
+        ],
+        responses={
+            200: openapi.Response(description="조회 성공", schema=CommentSerializer(many=True)),
+            404: openapi.Response(description="댓글을 찾을 수 없습니다."),
+        }
+    )
+    def get(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_queryset())
+        for reply in page:
+            reply.parent = self.parent_comment  # ✅ 비밀 댓글 판단 시 부모 댓글 추가 조회 방지
+
+        context = self.get_serializer_context()
+        context['replies_map'] = {}  # ✅ 대댓글의 대댓글은 없으므로 추가 조회 생략
+        serializer = CommentSerializer(page, many=True, context=context)
+        return self.get_paginated_response(serializer.data)
+
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return Comment.objects.none()
+
+        post = get_readable_post(self.kwargs.get('post_id'), self.request.user)
+        if not post:
+            raise Http404
+
+        parent = get_object_or_404(
+            Comment.objects.select_related('author'),
+            id=self.kwargs.get('comment_id'), post_id=post.id, parent__isnull=True
+        )
+        replies = Comment.objects.filter(post_id=post.id, parent=parent).select_related(
+            'author', 'post__author__profile'
+        )
+
+        after = self.request.query_params.get('after')
+        if after:
+            try:
+                after = int(after)
+            except ValueError:
+                raise ValidationError({"after": "after는 숫자여야 합니다."})
+            last_seen = Comment.objects.filter(id=after, parent=parent).values('created_at', 'id').first()
+            if last_seen is None:
+                raise ValidationError({"after": "해당 대댓글을 찾을 수 없습니다."})
+            replies = replies.filter(
+                Q(created_at__gt=last_seen['created_at']) |
+                Q(created_at=last_seen['created_at'], id__gt=last_seen['id'])
+            )
+
+        self.parent_comment = parent
+        return replies
+
+
 class CommentDetailView(RetrieveUpdateDestroyAPIView):
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -135,18 +274,11 @@ class CommentDetailView(RetrieveUpdateDestroyAPIView):
         if post_id is None:
             return Comment.objects.none()
 
-        post = Post.objects.filter(id=post_id).first()
+        post = get_readable_post(post_id, self.request.user)
         if not post:
             return Comment.objects.none()
 
-        user = self.request.user
-        if post.visibility == 'me' and (not user.is_authenticated or post.author.profile != user.profile):
-            return Comment.objects.none()
-
-        if post.visibility == 'mutual' and not post.author.profile.neighbors.filter(id=user.profile.id).exists():
-            return Comment.objects.none()
-
-        return Comment.objects.filter(post_id=post_id)
+        return Comment.objects.filter(post_id=post_id).select_related('author', 'post__author__profile')
 
     @swagger_auto_schema(
         operation_summary="댓글 수정 (전체 업데이트, PUT)",
@@ -229,3 +361,31 @@ class CommentDetailView(RetrieveUpdateDestroyAPIView):
             comment.delete()
 
         return Response({"message": "댓글이 삭제되었습니다."}, status=204)
+
+
+class AsyncCommentListView(AsyncAPIView):
+    """
+    ✅ CommentListView 조회의 async 버전 (GET /posts/{post_id}/comments/async/) - ASGI 환경 전용
+    - 부모 댓글 한 페이지 + 부모 댓글별 앞쪽 대댓글, 권한/비밀 댓글 처리는 CommentListView와 같음
+    - 응답: {"next": 다음 페이지 링크, "results": [...]} (async 커서 페이지네이션은 다음 페이지 링크만 제공)
+    """
+    authentication_required = False  # ✅ 로그인하지 않아도 조회 가능 (IsAuthenticatedOrReadOnly)
+
+    async def get(self, request, post_id):
+        paginator = AsyncCommentPagination()
+        post = await aget_readable_post(post_id, request.user)
+        queryset = parent_comments_queryset(post_id) if post else Comment.objects.none()
+        page = await paginator.apaginate_queryset(queryset, request)
+
+        if not page and not request.GET.get(paginator.cursor_query_param):
+            return api_response({"error": "이 게시글의 댓글을 조회할 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
+
+        replies = [reply async for reply in reply_preview_queryset(
+            post_id, [comment.id for comment in page], CommentListView.reply_preview_size
+        )]
+        reply_counts = {reply.parent_id: reply.reply_total for reply in replies}
+
+        roots, replies_map = build_comment_tree(page + replies)
+        context = {'request': request, 'replies_map': replies_map, 'reply_counts': reply_counts}
+        serializer = CommentSerializer(roots, many=True, context=context)
+        return api_response(paginator.get_paginated_data(serializer.data))
@@ -0,0 +1,80 @@
+import asyncio
+import json
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from main.authentication import ProfileJWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
+from main.realtime import hub, user_channel, post_channel
+from main.views.comment import get_readable_post
+
+
+def authenticate_stream(request):
+    """
+    ✅ SSE 요청 인증
+    - 브라우저 EventSource는 헤더를 보낼 수 없으므로 `?token=<access token>`도 허용
+    """
+    auth = ProfileJWTAuthentication()
+    try:
+        result = auth.authenticate(request)
+        if result is not None:
+            return result[0]
+
+        raw_token = request.GET.get('token')
+        if raw_token:
+            return auth.get_user(auth.get_validated_token(raw_token))
+    except (InvalidToken, AuthenticationFailed):
+        return None
+    return None
+
+
+def format_sse(event):
+    """ ✅ SSE 전송 형식 (event: ..., data: ...) """
+    data = json.dumps(event["data"], ensure_ascii=False)
+    return f"event: {event['event']}\ndata: {data}\n\n"
+
+
+class EventStreamView(View):
+    """
+    ✅ 실시간 이벤트 스트림 (GET /events/stream/?post=<post_id>)
+    - ASGI 환경 전용 (async view). 연결 하나 = 코루틴 하나이므로 스레드를 점유하지 않음
+    - `news`: 내 소식 (새 댓글/대댓글/좋아요)
+    - `comment`: `post`로 지정한 게시글의 새 댓글/대댓글 (ID만 전달)
+    - 연결 유지를 위해 `keepalive_interval`초마다 주석 라인 전송
+    """
+    keepalive_interval = 15
+
+    async def get(self, request, *args, **kwargs):
+        user = await sync_to_async(authenticate_stream)(request)
+        if user is None:
+            return JsonResponse({"error": "인증이 필요합니다."}, status=401)
+
+        channels = [user_channel(user.id)]
+
+        post_id = request.GET.get('post')
+        if post_id:
+            if not post_id.isdigit():
+                return JsonResponse({"error": "post는 게시글 ID여야 합니다."}, status=400)
+            post = await sync_to_async(get_readable_post)(int(post_id), user)
+            if post is None:
+                return JsonResponse({"error": "이 게시글의 댓글을 조회할 권한이 없습니다."}, status=403)
+            channels.append(post_channel(post.id))
+
+        response = StreamingHttpResponse(self.stream(channels), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # ✅ nginx 버퍼링 비활성화
+        return response
+
+    async def stream(self, channels):
+        subscription = hub.subscribe(channels)
+        try:
+            yield "retry: 5000\n\n"  # ✅ 연결이 끊기면 5초 후 재연결
+            while True:
+                try:
+                    event = await subscription.get(self.keepalive_interval)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event)
+        finally:
+            hub.unsubscribe(subscription)  # ✅ 클라이언트 연결 종료 시 구독 해제
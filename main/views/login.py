@@ -1,11 +1,16 @@
+import json
+from asgiref.sync import sync_to_async
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.views import APIView
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from ..models.profile import Profile
 from django.contrib.auth import authenticate, get_user_model
 from django.http import JsonResponse
-from rest_framework_simplejwt.tokens import RefreshToken
+from main.revocation import FilteredRefreshToken
 from rest_framework.permissions import AllowAny  # 인증 없이 접근 가능하게 하기 위한 permission
+from main.password_pool import PasswordPoolBusy, averify_password, amake_password
 
 User = get_user_model()
 
@@ -67,7 +72,7 @@ class LoginView(APIView):
             user = authenticate(request, username=id, password=password) #Django의 인증 시스템을 사용해 사용자를 인증
             if user is not None:
                 # JWT 토큰 생성
-                refresh = RefreshToken.for_user(user)
+                refresh = FilteredRefreshToken.for_user(user)
 
                 # 프로필 존재 여부 확인
                 profile_created = Profile.objects.filter(user=user).exists()
@@ -83,3 +88,57 @@ class LoginView(APIView):
                 return JsonResponse({'error': '로그인 실패. 아이디 또는 비밀번호를 확인하세요.'}, status=401)
         except Exception as e:
             return JsonResponse({'error': f'오류가 발생했습니다: {str(e)}'}, status=500)
+
+
+class AsyncLoginView(View):
+    """
+    ✅ 비동기 로그인 (POST /login/async/) - ASGI 환경 전용
+    - LoginView와 같은 요청/응답 형식
+    - 비밀번호 해시는 전용 스레드 풀에서 계산하므로 로그인이 몰려도 이벤트 루프와 다른 요청을 막지 않음
+    - 해시 대기열이 가득 차면 503 반환
+    - 저장된 해시의 cost가 설정(PASSWORD_HASH_ITERATIONS)과 다르면 새 cost로 다시 해시하여 저장
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # ✅ 토큰 기반 API이므로 DRF APIView와 같이 CSRF 검사 제외
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def post(self, request, *args, **kwargs):
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):  # ✅ 배열/문자열/숫자 등 JSON 객체가 아닌 본문도 거부
+            return JsonResponse({'error': '요청 본문이 올바른 JSON이 아닙니다.'}, status=400)
+        id = data.get('id')
+        password = data.get('password')
+        if not id or not password:
+            return JsonResponse({'error': '로그인 실패. 아이디 또는 비밀번호를 확인하세요.'}, status=401)
+
+        user = await User.objects.filter(id=id).afirst()
+
+        try:
+            # ✅ 없는 사용자도 해시를 한 번 계산하여 응답 시간으로 아이디 존재 여부를 알 수 없게 함
+            is_correct, must_update = await averify_password(password, user.password if user else None)
+            if not (user and is_correct and user.is_active):
+                return JsonResponse({'error': '로그인 실패. 아이디 또는 비밀번호를 확인하세요.'}, status=401)
+
+            if must_update:  # ✅ 다시 해시 (rehash-on-login)
+                user.password = await amake_password(password)
+                await user.asave(update_fields=['password'])
+        except PasswordPoolBusy:
+            response = JsonResponse({'error': '로그인 요청이 많습니다. 잠시 후 다시 시도하세요.'}, status=503)
+            response['Retry-After'] = '1'
+            return response
+
+        refresh = await sync_to_async(FilteredRefreshToken.for_user)(user)  # ✅ 블랙리스트용 OutstandingToken 저장 포함
+        profile_created = await Profile.objects.filter(user=user).aexists()
+
+        return JsonResponse({
+            'message': '로그인 성공!',
+            'id': user.id,
+            'profile_created': profile_created,
+            'refresh': str(refresh),
+            'access': str(refresh.access_token),
+        }, status=200)
@@ -1,7 +1,7 @@
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated  # 인증된 사용자만 접근 가능
-from rest_framework_simplejwt.authentication import JWTAuthentication  # JWT 인증
-from rest_framework_simplejwt.tokens import RefreshToken
+from main.authentication import ProfileJWTAuthentication  # JWT 인증
+from main.revocation import FilteredRefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
@@ -33,7 +33,7 @@ logout_error_schema = openapi.Schema(
 
 class LogoutView(APIView):
     permission_classes = [IsAuthenticated]  # 인증된 사용자만 로그아웃 가능
-    authentication_classes = [JWTAuthentication]  # JWT 토큰을 통한 인증
+    authentication_classes = [ProfileJWTAuthentication]  # JWT 토큰을 통한 인증
 
     @swagger_auto_schema(
         operation_summary="로그아웃",
@@ -58,7 +58,7 @@ class LogoutView(APIView):
                 return JsonResponse({'error': '리프레시 토큰이 필요합니다.'}, status=400)
 
             # RefreshToken 인스턴스를 생성하고 블랙리스트에 추가
-            token = RefreshToken(refresh_token)
+            token = FilteredRefreshToken(refresh_token)
             token.blacklist()
 
             return JsonResponse({'message': '로그아웃 성공!'}, status=200)
@@ -0,0 +1,23 @@
+import hmac
+from django.conf import settings
+from django.http import HttpResponse
+from django.views import View
+from main.metrics import render_prometheus
+
+
+class MetricsView(View):
+    """
+    ✅ Prometheus 스크레이프용 지표 (GET /metrics)
+    - DRF 뷰가 아니므로 JWT 인증/스웨거 문서 대상이 아님
+    - `Authorization: Bearer <METRICS_TOKEN>` 헤더가 있어야 조회 가능
+    - METRICS_TOKEN이 없으면 DEBUG일 때만 공개, 운영(DEBUG=False)에서는 항상 403
+    """
+    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def get(self, request):
+        token = getattr(settings, 'METRICS_TOKEN', None)
+        if not token and not settings.DEBUG:
+            return HttpResponse(status=403)
+        if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f"Bearer {token}"):
+            return HttpResponse(status=403)
+        return HttpResponse(render_prometheus(), content_type=self.content_type)
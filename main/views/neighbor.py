@@ -5,13 +5,32 @@ from rest_framework.generics import ListAPIView
 from rest_framework.generics import DestroyAPIView
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
-from ..models.neighbor import Neighbor
+from ..models.neighbor import Neighbor, NeighborEdge, are_neighbors, remove_neighbor, settle_neighbor_requests
 from ..models.profile import Profile
-from ..serializers.neighbor import NeighborSerializer
+from ..models.recommendation import NeighborRecommendation
+from ..serializers.neighbor import NeighborSerializer, NeighborProfileSerializer, NeighborRecommendationSerializer, NeighborBulkActionSerializer
+from ..pagination import NeighborCursorPagination, NeighborRequestCursorPagination
+from ..profile_cards import get_profile_card_or_404
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from django.db import models
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
+
+
+def get_neighbor_count(profile_id):
+    """ ✅ 서로이웃 수 (인접 리스트 인덱스 범위만 세므로 이웃이 많아도 빠름) """
+    return NeighborEdge.objects.filter(from_profile_id=profile_id).count()
+
+
+def paginate_neighbors(view, request, profile_id):
+    """
+    ✅ 서로이웃 프로필 카드 한 페이지
+    - (from_profile, to_profile) 인접 리스트를 프로필과 JOIN하여 한 번의 쿼리로 조회
+    - 프로필 ID 순 커서 페이지네이션
+    """
+    paginator = NeighborCursorPagination()
+    page = paginator.paginate_queryset(Profile.objects.filter(neighbors=profile_id), request, view=view)
+    return NeighborProfileSerializer(page, many=True).data, paginator.get_next_link()
 
 
 class NeighborView(APIView):
@@ -49,18 +68,17 @@ class NeighborView(APIView):
         ✅ 서로이웃 신청 (POST /api/neighbors/{to_urlname}/)
         """
         from_user = request.user
-        to_user_profile = get_object_or_404(Profile, urlname=to_urlname)
-        to_user = to_user_profile.user
+        to_card = get_profile_card_or_404(to_urlname)  # ✅ 캐시된 프로필 카드 (Profile/User 조회 없음)
 
         # ✅ 자기 자신에게 신청 불가
-        if from_user == to_user:
+        if from_user.id == to_card.user_id:
             return Response({"message": "자기 자신에게 서로이웃 신청할 수 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         # ✅ 기존 신청 확인 (중복 신청 방지)
-        if Neighbor.objects.filter(from_user=from_user, to_user=to_user, status='pending').exists():
+        if Neighbor.objects.filter(from_user=from_user, to_user_id=to_card.user_id, status='pending').exists():
             return Response({"message": "이미 보낸 서로이웃 요청이 있습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        if Neighbor.objects.filter(from_user=from_user, to_user=to_user, status='accepted').exists():
+        if are_neighbors(from_user.profile.id, to_card.profile_id):
             return Response({"message": "이미 서로이웃 관계입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         # ✅ 요청 메시지 처리
@@ -69,7 +87,7 @@ class NeighborView(APIView):
         # ✅ 서로이웃 신청 생성
         neighbor_request = Neighbor.objects.create(
             from_user=from_user,
-            to_user=to_user,
+            to_user_id=to_card.user_id,
             request_message=request_message,
             status="pending"
         )
@@ -82,18 +100,28 @@ class NeighborView(APIView):
 
 
 class NeighborRequestListView(ListAPIView):
+    """
+    ✅ 받은 서로이웃 요청 목록 (최신순, 커서 페이지네이션)
+    """
     permission_classes = [IsAuthenticated]
     serializer_class = NeighborSerializer
+    pagination_class = NeighborRequestCursorPagination
 
     @swagger_auto_schema(
         operation_summary="받은 서로이웃 요청 목록 조회",
-        operation_description="현재 로그인한 사용자가 받은 서로이웃 요청 목록을 조회합니다.",
+        operation_description="현재 로그인한 사용자가 받은 서로이웃 요청 목록을 최신순으로 조회합니다. "
+                              "다음 페이지는 응답의 `next` 링크로 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="다음 페이지 커서 (응답의 next 링크에 포함)", type=openapi.TYPE_STRING, required=False),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="페이지 크기 (기본 20, 최대 100)", type=openapi.TYPE_INTEGER, required=False),
+        ],
         responses={
             200: openapi.Response(
                 description="서로이웃 요청 목록 반환",
                 schema=openapi.Schema(
                     type=openapi.TYPE_OBJECT,
                     properties={
+                        "next": openapi.Schema(type=openapi.TYPE_STRING, format="url", description="다음 페이지 링크 (없으면 null)"),
                         "requests": openapi.Schema(
                             type=openapi.TYPE_ARRAY,
                             items=openapi.Schema(
@@ -118,9 +146,9 @@ class NeighborRequestListView(ListAPIView):
         """
         ✅ 받은 서로이웃 요청이 없는 경우 적절한 메시지를 반환
         """
-        queryset = self.get_queryset()
+        page = self.paginate_queryset(self.get_queryset())
 
-        if not queryset.exists():
+        if not page and not request.query_params.get(self.paginator.cursor_query_param):
             return Response({"message": "받은 서로이웃 요청이 없습니다.", "requests": []}, status=200)
 
         request_list = [
@@ -130,10 +158,10 @@ class NeighborRequestListView(ListAPIView):
                 "from_user_pic": neighbor.from_user.profile.user_pic.url if neighbor.from_user.profile.user_pic else None,
                 "request_message": neighbor.request_message  # ✅ 신청 메시지 추가
             }
-            for neighbor in queryset
+            for neighbor in page
         ]
 
-        return Response({"requests": request_list}, status=200)
+        return Response({"next": self.paginator.get_next_link(), "requests": request_list}, status=200)
 
     def get_queryset(self):
         """
@@ -161,21 +189,9 @@ class NeighborAcceptView(APIView):
         """
         ✅ 서로이웃 요청을 보낸 사용자의 URL 이름 (`from_urlname`)을 기반으로 수락
         """
-        to_user = request.user  # 현재 로그인한 사용자
-        from_user_profile = get_object_or_404(Profile, urlname=from_urlname)
-        from_user = from_user_profile.user
-
-        # ✅ 서로이웃 요청 찾기
-        neighbor_request = get_object_or_404(
-            Neighbor, from_user=from_user, to_user=to_user, status="pending"
-        )
-
-        if neighbor_request.status == "accepted":
-            return Response({"message": "이미 서로이웃 상태입니다."}, status=status.HTTP_400_BAD_REQUEST)
-
-        # ✅ 서로이웃 요청 수락
-        neighbor_request.status = "accepted"
-        neighbor_request.save()
+        # ✅ 서로이웃 요청 수락 (일괄 처리와 같은 경로: 신청 조회 + 관계 추가 + 신청 삭제)
+        if not settle_neighbor_requests(request.user, [from_urlname], accept=True):
+            return Response({"message": "서로이웃 요청을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
         return Response({"message": "서로이웃 요청이 수락되었습니다."}, status=status.HTTP_200_OK)
 
@@ -199,22 +215,53 @@ class NeighborRejectView(APIView):
         """
         ✅ 서로이웃 요청을 보낸 사용자의 `urlname`을 기반으로 거절
         """
-        to_user = request.user  # 현재 로그인한 사용자
-        from_user_profile = get_object_or_404(Profile, urlname=from_urlname)
-        from_user = from_user_profile.user
+        # ✅ 서로이웃 요청 거절 (삭제)
+        if not settle_neighbor_requests(request.user, [from_urlname], accept=False):
+            return Response({"message": "서로이웃 요청을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        # ✅ 서로이웃 요청 찾기
-        neighbor_request = get_object_or_404(
-            Neighbor, from_user=from_user, to_user=to_user, status="pending"
-        )
+        return Response({"message": "서로이웃 요청이 거절되었습니다."}, status=status.HTTP_200_OK)
 
-        if neighbor_request.status == "accepted":
-            return Response({"message": "이미 수락된 요청은 거절할 수 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # ✅ 서로이웃 요청 거절 (삭제)
-        neighbor_request.delete()
+class NeighborRequestBulkView(APIView):
+    """
+    ✅ 받은 서로이웃 요청 일괄 수락/거절 (POST /neighbors/requests/bulk/)
+    - 한 트랜잭션에서 집합 단위로 처리 (신청 수와 무관하게 쿼리 수 일정)
+    """
+    permission_classes = [IsAuthenticated]
 
-        return Response({"message": "서로이웃 요청이 거절되었습니다."}, status=status.HTTP_200_OK)
+    @swagger_auto_schema(
+        operation_summary="받은 서로이웃 요청 일괄 처리",
+        operation_description="`urlnames`로 지정한 사용자들이 보낸 서로이웃 요청을 한 번에 수락(`accept`)하거나 거절(`reject`)합니다.",
+        request_body=NeighborBulkActionSerializer,
+        responses={
+            200: openapi.Response(
+                description="처리 결과",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "message": openapi.Schema(type=openapi.TYPE_STRING),
+                        "processed": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_STRING), description="처리된 신청자 urlname"),
+                        "not_found": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_STRING), description="대기 중인 신청이 없는 urlname"),
+                    }
+                )
+            ),
+            400: openapi.Response(description="잘못된 요청"),
+        }
+    )
+    def post(self, request):
+        serializer = NeighborBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        urlnames = serializer.validated_data["urlnames"]
+        accept = serializer.validated_data["action"] == "accept"
+
+        processed = settle_neighbor_requests(request.user, urlnames, accept=accept)
+        processed_set = set(processed)
+
+        return Response({
+            "message": f"서로이웃 요청 {len(processed)}건을 {'수락' if accept else '거절'}했습니다.",
+            "processed": processed,
+            "not_found": [urlname for urlname in urlnames if urlname not in processed_set],
+        }, status=status.HTTP_200_OK)
 
 
 class PublicNeighborListView(APIView):
@@ -232,7 +279,9 @@ class PublicNeighborListView(APIView):
             openapi.Parameter(
                 'urlname', openapi.IN_PATH, description="조회할 사용자의 URL 이름",
                 type=openapi.TYPE_STRING, required=True
-            )
+            ),
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="다음 페이지 커서 (응답의 next 링크에 포함)", type=openapi.TYPE_STRING, required=False),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="페이지 크기 (기본 30, 최대 100)", type=openapi.TYPE_INTEGER, required=False),
         ],
         responses={
             200: openapi.Response(
@@ -241,12 +290,15 @@ class PublicNeighborListView(APIView):
                     type=openapi.TYPE_OBJECT,
                     properties={
                         "urlname": openapi.Schema(type=openapi.TYPE_STRING, description="사용자의 URL 이름"),
+                        "neighbor_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="서로이웃 수"),
+                        "next": openapi.Schema(type=openapi.TYPE_STRING, format="url", description="다음 페이지 링크 (없으면 null)"),
                         "neighbors": openapi.Schema(
                             type=openapi.TYPE_ARRAY,
                             items=openapi.Schema(
                                 type=openapi.TYPE_OBJECT,
                                 properties={
                                     "urlname": openapi.Schema(type=openapi.TYPE_STRING, description="서로이웃 사용자의 URL 이름"),
+                                    "username": openapi.Schema(type=openapi.TYPE_STRING, description="서로이웃 사용자의 닉네임"),
                                     "user_pic": openapi.Schema(type=openapi.TYPE_STRING, format="url", description="프로필 이미지 URL"),
                                 }
                             )
@@ -259,47 +311,43 @@ class PublicNeighborListView(APIView):
         }
     )
     def get(self, request, urlname):
-        profile = get_object_or_404(Profile, urlname=urlname)
+        card = get_profile_card_or_404(urlname)  # ✅ 캐시된 프로필 카드 (Profile 조회 없음)
 
         # ✅ 서로이웃 목록이 비공개인 경우
-        if not profile.neighbor_visibility:
+        if not card.neighbor_visibility:
             return Response({"message": "비공개입니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ `Neighbor` 모델을 사용하여 서로이웃 관계 조회
-        neighbors = Neighbor.objects.filter(
-            Q(from_user=profile.user) | Q(to_user=profile.user),
-            status="accepted"
-        ).select_related("from_user__profile", "to_user__profile")
-
-        neighbor_list = [
-            {
-                "urlname": (neighbor.to_user.profile if neighbor.from_user == profile.user else neighbor.from_user.profile).urlname,
-                "user_pic": (neighbor.to_user.profile if neighbor.from_user == profile.user else neighbor.from_user.profile).user_pic.url if (neighbor.to_user.profile if neighbor.from_user == profile.user else neighbor.from_user.profile).user_pic else None
-            }
-            for neighbor in neighbors
-        ]
+        neighbor_list, next_link = paginate_neighbors(self, request, card.profile_id)
 
         return Response({
-            "urlname": profile.urlname,
+            "urlname": card.urlname,
+            "neighbor_count": get_neighbor_count(card.profile_id),
+            "next": next_link,
             "neighbors": neighbor_list
         }, status=status.HTTP_200_OK)
 
 
 class MyNeighborListView(ListAPIView):
     """
-    ✅ 로그인한 사용자의 서로이웃 목록 조회
+    ✅ 로그인한 사용자의 서로이웃 목록 조회 (GET /neighbors/list/me/)
     """
     permission_classes = [IsAuthenticated]
 
     @swagger_auto_schema(
         operation_summary="내 서로이웃 목록 조회",
         operation_description="로그인한 사용자의 서로이웃 목록을 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="다음 페이지 커서 (응답의 next 링크에 포함)", type=openapi.TYPE_STRING, required=False),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="페이지 크기 (기본 30, 최대 100)", type=openapi.TYPE_INTEGER, required=False),
+        ],
         responses={
             200: openapi.Response(
                 description="서로이웃 목록 반환",
                 schema=openapi.Schema(
                     type=openapi.TYPE_OBJECT,
                     properties={
+                        "neighbor_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="서로이웃 수"),
+                        "next": openapi.Schema(type=openapi.TYPE_STRING, format="url", description="다음 페이지 링크 (없으면 null)"),
                         "neighbors": openapi.Schema(
                             type=openapi.TYPE_ARRAY,
                             items=openapi.Schema(
@@ -322,29 +370,16 @@ class MyNeighborListView(ListAPIView):
         """
         ✅ 로그인한 사용자의 서로이웃 목록을 조회합니다.
         """
-        profile = get_object_or_404(Profile, user=request.user)
+        profile_id = request.user.profile.id
+
+        neighbor_list, next_link = paginate_neighbors(self, request, profile_id)
 
-        # ✅ `Neighbor` 모델을 사용하여 서로이웃 관계 조회
-        neighbors = Neighbor.objects.filter(
-            Q(from_user=request.user) | Q(to_user=request.user),
-            status="accepted"
-        ).select_related("from_user__profile", "to_user__profile")
-
-        neighbor_list = []
-        for neighbor in neighbors:
-            if neighbor.from_user == request.user:
-                neighbor_profile = neighbor.to_user.profile  # ✅ `to_user`의 Profile 가져오기
-            else:
-                neighbor_profile = neighbor.from_user.profile  # ✅ `from_user`의 Profile 가져오기
-
-            neighbor_list.append({
-                "urlname": neighbor_profile.urlname,  # ✅ 반환 값에 `urlname` 포함
-                "username": neighbor_profile.username,  # ✅ 사용자가 볼 수 있도록 `username` 포함
-                "user_pic": neighbor_profile.user_pic.url if neighbor_profile.user_pic else None
-            })
-
-        response_data = {"neighbors": neighbor_list}
-        if not neighbor_list:
+        response_data = {
+            "neighbor_count": get_neighbor_count(profile_id),
+            "next": next_link,
+            "neighbors": neighbor_list
+        }
+        if not neighbor_list and not request.query_params.get('cursor'):
             response_data["message"] = "서로이웃이 없습니다."
 
         return Response(response_data, status=status.HTTP_200_OK)
@@ -393,20 +428,56 @@ class MyNeighborDeleteView(DestroyAPIView):
         """
         ✅ 로그인한 사용자의 서로이웃 관계를 삭제합니다.
         """
-        profile = get_object_or_404(Profile, user=request.user)
-        neighbor_profile = get_object_or_404(Profile, urlname=neighbor_urlname)
+        profile = request.user.profile
+        neighbor_card = get_profile_card_or_404(neighbor_urlname)  # ✅ 캐시된 프로필 카드 (Profile 조회 없음)
 
         # ✅ 서로이웃 관계 확인
-        neighbor_relation = Neighbor.objects.filter(
-            Q(from_user=request.user, to_user=neighbor_profile.user) |
-            Q(from_user=neighbor_profile.user, to_user=request.user),
-            status="accepted"
-        ).first()
-
-        if not neighbor_relation:
+        if not are_neighbors(profile.id, neighbor_card.profile_id):
             return Response({"message": "서로이웃 관계가 존재하지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        # ✅ 서로이웃 관계 삭제
-        neighbor_relation.delete()
+        # ✅ 서로이웃 관계 삭제 (양방향 모두)
+        remove_neighbor(profile, neighbor_card.profile_id)
 
         return Response({"message": "서로이웃 관계가 삭제되었습니다."}, status=status.HTTP_200_OK)
+
+
+class MyNeighborRecommendationView(APIView):
+    """
+    ✅ 알 수도 있는 이웃 (GET /neighbors/recommendations/me/)
+    - 배치 작업(build_neighbor_recommendations)이 미리 계산해 둔 추천을 점수순으로 조회
+    - 계산 이후 서로이웃이 되었거나 신청이 오간 사용자는 제외
+    """
+    permission_classes = [IsAuthenticated]
+    default_limit = 10
+    max_limit = 50
+
+    @swagger_auto_schema(
+        operation_summary="알 수도 있는 이웃 조회",
+        operation_description="함께 아는 서로이웃 수와 같은 작성자에게 남긴 공감/댓글 겹침으로 계산한 추천 이웃 목록을 반환합니다.",
+        manual_parameters=[
+            openapi.Parameter('limit', openapi.IN_QUERY, description="추천 수 (기본 10, 최대 50)", type=openapi.TYPE_INTEGER, required=False),
+        ],
+        responses={200: NeighborRecommendationSerializer(many=True)}
+    )
+    def get(self, request):
+        profile = get_object_or_404(Profile, user=request.user)
+
+        recommendations = NeighborRecommendation.objects.filter(profile=profile).exclude(
+            Exists(NeighborEdge.objects.filter(from_profile_id=profile.id, to_profile_id=OuterRef('candidate_id')))
+        ).exclude(
+            Exists(Neighbor.objects.filter(
+                Q(from_user=request.user, to_user__profile=OuterRef('candidate_id')) |
+                Q(from_user__profile=OuterRef('candidate_id'), to_user=request.user)
+            ))
+        ).select_related('candidate').order_by('-score')[:self.get_limit()]
+
+        return Response({
+            "recommendations": NeighborRecommendationSerializer(recommendations, many=True).data
+        }, status=status.HTTP_200_OK)
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            return self.default_limit
+        return min(max(limit, 1), self.max_limit)
@@ -1,15 +1,30 @@
-from rest_framework import serializers
-from main.models.post import Post
-from main.models.comment import Comment
-from main.models.heart import Heart
-from rest_framework.views import APIView
+import base64
+import json
 from rest_framework.generics import ListAPIView
+from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from django.db.models import Count, F, Max, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from datetime import timedelta
 from drf_yasg.utils import swagger_auto_schema
-from django.db.models import Q
-from main.serializers import NewsSerializer
+from drf_yasg import openapi
+from main.models.notification import Notification
+from main.pagination import AsyncNewsPagination, NewsCursorPagination
+from main.async_api import AsyncAPIView, api_response
+from main.unread_counter import add_unread_count, get_unread_count
+from main.serializers import NewsSerializer, NewsReadSerializer, NewsDigestSerializer
+
+
+def unread_news_queryset(user):
+    """ ✅ 읽지 않은 내 소식 (활동한 사용자 프로필, 게시글, 댓글 join) """
+    return Notification.objects.filter(
+        recipient=user, is_read=False
+    ).select_related('actor__profile', 'post', 'comment')
 
 
 class MyNewsListView(ListAPIView):
@@ -18,37 +33,220 @@ class MyNewsListView(ListAPIView):
     """
     permission_classes = [IsAuthenticated]
     serializer_class = NewsSerializer
+    pagination_class = NewsCursorPagination
 
     @swagger_auto_schema(
         operation_summary="내 소식 조회",
-        operation_description="내 게시물에 달린 댓글, 좋아요 및 내 댓글에 달린 대댓글을 최신순으로 조회",
+        operation_description="내 게시물에 달린 댓글, 좋아요 및 내 댓글에 달린 대댓글 중 읽지 않은 소식을 최신순으로 조회합니다. "
+                              "커서 페이지네이션으로 5개씩 반환합니다.",
+        manual_parameters=[
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="다음/이전 페이지 커서", type=openapi.TYPE_STRING, required=False),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="페이지 크기 (최대 50)", type=openapi.TYPE_INTEGER, required=False),
+        ],
         responses={200: NewsSerializer(many=True)}
     )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
     def get_queryset(self):
-        user = self.request.user
-        profile = user.profile
+        """
+        ✅ 읽지 않은 내 소식을 한 번의 인덱스 쿼리로 조회 (활동한 사용자 프로필, 게시글, 댓글 join)
+        """
+        if getattr(self, 'swagger_fake_view', False):
+            return Notification.objects.none()
+
+        return unread_news_queryset(self.request.user)
+
+
+class AsyncMyNewsListView(AsyncAPIView):
+    """
+    ✅ MyNewsListView의 async 버전 (GET /news/list/async/) - ASGI 환경 전용
+    - 응답: {"next": 다음 페이지 링크, "results": [...]} (async 커서 페이지네이션은 다음 페이지 링크만 제공)
+    """
+
+    async def get(self, request):
+        paginator = AsyncNewsPagination()
+        page = await paginator.apaginate_queryset(unread_news_queryset(request.user), request)
+        serializer = NewsSerializer(page, many=True, context={'request': request})
+        return api_response(paginator.get_paginated_data(serializer.data))
+
+
+class MyNewsReadView(APIView):
+    """
+    ✅ 내 소식 읽음 처리 (POST /news/read/)
+    - 선택한 소식(activity_ids) 또는 특정 시각까지의 소식(until)을 한 번에 읽음 처리
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="내 소식 읽음 처리",
+        operation_description="`activity_ids` 목록 또는 `until` 시각까지의 내 소식을 읽음 처리하고, 남은 읽지 않은 소식 개수를 반환합니다.",
+        request_body=NewsReadSerializer,
+        responses={
+            200: openapi.Response(description="읽음 처리 성공", schema=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "updated": openapi.Schema(type=openapi.TYPE_INTEGER, description="읽음 처리된 소식 개수"),
+                    "unread_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="남은 읽지 않은 소식 개수"),
+                }
+            )),
+            400: openapi.Response(description="잘못된 요청"),
+        }
+    )
+    def post(self, request):
+        serializer = NewsReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        unread = Notification.objects.filter(recipient=request.user, is_read=False)
+        updated = 0
+
+        if "until" in serializer.validated_data:
+            # ✅ 시각 기준: (recipient, is_read, created_at) 인덱스 범위 UPDATE 한 번
+            updated = unread.filter(created_at__lte=serializer.validated_data["until"]).update(is_read=True)
+        else:
+            # ✅ 원본 종류(댓글/좋아요)별로 UPDATE 한 번씩
+            ids_by_source = serializer.validated_data["activity_ids"]
+            if ids_by_source["comment"]:
+                updated += unread.filter(comment_id__in=ids_by_source["comment"]).update(is_read=True)
+            if ids_by_source["heart"]:
+                updated += unread.filter(heart_id__in=ids_by_source["heart"]).update(is_read=True)
+
+        add_unread_count(request.user.id, -updated)  # ✅ 배지 개수 캐시 감소
+        return Response({"updated": updated, "unread_count": get_unread_count(request.user.id)}, status=status.HTTP_200_OK)
+
+
+class MyNewsUnreadCountView(APIView):
+    """
+    ✅ 읽지 않은 내 소식 개수 (GET /news/unread-count/)
+    - 배지 표시용, 캐시된 카운터를 읽으므로 목록 조회 없이 가볍게 폴링 가능
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="읽지 않은 내 소식 개수 조회",
+        operation_description="읽지 않은 내 소식 개수를 반환합니다. 배지 표시용으로 캐시된 값을 사용합니다.",
+        responses={
+            200: openapi.Response(description="조회 성공", schema=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "unread_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="읽지 않은 소식 개수"),
+                }
+            )),
+        }
+    )
+    def get(self, request):
+        return Response({"unread_count": get_unread_count(request.user.id)}, status=status.HTTP_200_OK)
+
+
+class MyNewsDigestView(APIView):
+    """
+    ✅ 게시글별로 묶은 내 소식 (GET /news/digest/)
+    - 최근 `days`일 동안의 읽지 않은 소식을 (게시글, 소식 종류) 기준으로 묶어 개수와 대표 사용자 닉네임을 반환
+    - 원본 소식 수가 아니라 게시글 수에 비례하는 응답 크기
+    """
+    permission_classes = [IsAuthenticated]
+    default_days = 7
+    max_days = 30
+    page_size = 20
+    actors_per_group = 3  # ✅ 묶음마다 보여줄 대표 사용자 수
+
+    @swagger_auto_schema(
+        operation_summary="내 소식 묶음 조회",
+        operation_description="최근 `days`일 동안의 읽지 않은 내 소식을 게시글별로 묶어 최신순으로 반환합니다. "
+                              "다음 페이지는 응답의 `next_before` 값을 `before`로 넘겨 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter('days', openapi.IN_QUERY, description="조회 기간 (일, 기본 7, 최대 30)", type=openapi.TYPE_INTEGER, required=False),
+            openapi.Parameter('before', openapi.IN_QUERY, description="이전 응답의 `next_before` 값 (또는 ISO 8601 시각: 이 시각 이전에 마지막 소식이 있는 묶음만 조회)", type=openapi.TYPE_STRING, required=False),
+        ],
+        responses={200: NewsDigestSerializer(many=True)}
+    )
+    def get(self, request):
+        since = timezone.now() - timedelta(days=self.get_days())
+        unread = Notification.objects.filter(recipient=request.user, is_read=False, created_at__gte=since)
+
+        # ✅ (recipient, is_read, created_at) 인덱스 범위를 (게시글, 종류)로 GROUP BY
+        groups = unread.values('post_id', 'type').annotate(
+            count=Count('id'),
+            actor_count=Count('actor_id', distinct=True),
+            latest_at=Max('created_at'),
+        )
+        groups = self.filter_before(groups, self.get_before())
+        groups = list(groups.order_by('-latest_at', '-post_id', 'type')[:self.page_size + 1])
+
+        has_next = len(groups) > self.page_size
+        groups = groups[:self.page_size]
+        self.attach_actors(unread, groups)
+
+        return Response({
+            "next_before": self.encode_before(groups[-1]) if has_next else None,
+            "results": NewsDigestSerializer(groups, many=True).data,
+        }, status=status.HTTP_200_OK)
+
+    def attach_actors(self, unread, groups):
+        """
+        ✅ 묶음별 최근 소식 몇 건에서 대표 사용자 닉네임과 게시글 제목을 한 번의 쿼리로 채움
+        """
+        for group in groups:
+            group["actors"] = []
+            group["post_title"] = ""
+        if not groups:
+            return
 
-        # ✅ 내가 작성한 게시글에 달린 댓글
-        post_comment_news = list(Comment.objects.filter(
-            post__author=user, is_read=False
-        ).select_related('post', 'author').order_by('-created_at'))
+        by_key = {(group["post_id"], group["type"]): group for group in groups}
+        recent = unread.filter(post_id__in={group["post_id"] for group in groups}).annotate(
+            rank=Window(RowNumber(), partition_by=[F('post_id'), F('type')], order_by=[F('created_at').desc(), F('id').desc()]),
+        ).filter(rank__lte=self.actors_per_group * 3).select_related('actor__profile', 'post').order_by('-created_at', '-id')
 
-        # ✅ 내가 작성한 게시글에 달린 좋아요
-        post_like_news = list(Heart.objects.filter(
-            post__author=user, is_read=False
-        ).select_related('post', 'user').order_by('-created_at'))
+        for notification in recent:
+            group = by_key.get((notification.post_id, notification.type))
+            if group is None:
+                continue
+            group["post_title"] = notification.post.title
+            name = notification.actor.profile.username
+            if name not in group["actors"] and len(group["actors"]) < self.actors_per_group:
+                group["actors"].append(name)
 
-        # ✅ 내가 작성한 댓글에 달린 대댓글
-        comment_reply_news = list(Comment.objects.filter(
-            parent__author=profile, is_read=False
-        ).select_related('post', 'author').order_by('-created_at'))
+    def get_days(self):
+        try:
+            days = int(self.request.query_params.get('days', self.default_days))
+        except ValueError:
+            raise ValidationError({"days": "days는 숫자여야 합니다."})
+        return min(max(days, 1), self.max_days)
 
-        # ✅ `activity_id`를 조합하여 중복을 방지하면서 최신순 정렬
-        combined_news = sorted(
-            post_comment_news + post_like_news + comment_reply_news,
-            key=lambda obj: obj.created_at,
-            reverse=True
-        )[:5]
+    def get_before(self):
+        """
+        ✅ (latest_at, post_id, type) 또는 latest_at만 (None이면 첫 페이지)
+        - next_before 값: 정렬 순서와 같은 복합 키라, 같은 시각에 끝나는 묶음이 페이지 경계에 걸려도 빠지지 않음
+        - ISO 8601 시각만 넘기면 그 시각 이전의 묶음부터 조회
+        """
+        raw = self.request.query_params.get('before')
+        if not raw:
+            return None
+        try:
+            before = parse_datetime(raw)
+            if before is not None:
+                return before, None, None
+            latest_at, post_id, type_ = json.loads(base64.urlsafe_b64decode(raw.encode()).decode())
+            latest_at = parse_datetime(latest_at)
+            if latest_at is None:
+                raise ValueError
+            return latest_at, int(post_id), str(type_)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise ValidationError({"before": "before는 next_before 값이나 ISO 8601 형식의 시각이어야 합니다."})
 
-        return combined_news
+    def filter_before(self, groups, before):
+        """ ✅ 정렬 순서(-latest_at, -post_id, type)상 before 다음 묶음만 """
+        if before is None:
+            return groups
+        latest_at, post_id, type_ = before
+        if post_id is None:
+            return groups.filter(latest_at__lt=latest_at)
+        return groups.filter(
+            Q(latest_at__lt=latest_at) |
+            Q(latest_at=latest_at, post_id__lt=post_id) |
+            Q(latest_at=latest_at, post_id=post_id, type__gt=type_)
+        )
 
+    def encode_before(self, group):
+        raw = json.dumps([group["latest_at"].isoformat(), group["post_id"], group["type"]])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
@@ -6,14 +6,16 @@ from rest_framework import status
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from ..models import Post, PostText, PostImage,CustomUser,Profile
-from ..models.neighbor import Neighbor
+from ..models.neighbor import neighbor_user_ids
+from ..profile_cards import aget_profile_card, get_profile_card
+from ..async_api import AsyncAPIView, api_response
 from django.db.models import Q
 from ..serializers import PostSerializer
 import json
 import os
 import shutil
 from rest_framework.exceptions import MethodNotAllowed, ValidationError
-from django.shortcuts import get_object_or_404
+from django.shortcuts import aget_object_or_404, get_object_or_404
 from django.utils.timezone import now, timedelta
 from pickle import FALSE
 
@@ -31,58 +33,50 @@ def to_boolean(value):
 
 
 
-class PostListView(ListAPIView):
-    permission_classes = [IsAuthenticated]
-    parser_classes = [JSONParser]
-    queryset = Post.objects.all()
-    serializer_class = PostSerializer
+def validate_post_list_params(query_params):
+    """ ✅ 게시물 목록 쿼리 파라미터 검증 (DB 조회 없음) → (urlname, category, pk, keyword) """
+    urlname = query_params.get('urlname', None)
+    category = query_params.get('category', None)
+    pk = query_params.get('pk', None)
+    keyword = query_params.get('keyword', None)
 
-    def get_queryset(self):
-        urlname = self.request.query_params.get('urlname', None)
-        category = self.request.query_params.get('category', None)
-        pk = self.request.query_params.get('pk', None)
-        keyword = self.request.query_params.get('keyword', None)
+    # ✅ category만 존재할 경우 에러 처리
+    if category and not (urlname or pk):
+        raise ValidationError("카테고리만 입력된 경우는 허용하지 않습니다.")
 
-        # ✅ category만 존재할 경우 에러 처리
-        if category and not (urlname or pk):
-            raise ValidationError("카테고리만 입력된 경우는 허용하지 않습니다.")
+    # ✅ keyword는 단독으로 사용해야 함
+    if keyword and (urlname or category or pk):
+        raise ValidationError("keyword는 단독으로 사용해야 합니다.")
 
-        # ✅ keyword는 단독으로 사용해야 함
-        if keyword and (urlname or category or pk):
-            raise ValidationError("keyword는 단독으로 사용해야 합니다.")
+    if keyword and keyword not in dict(Post.KEYWORD_CHOICES):
+        raise ValidationError(f"'{keyword}'은(는) 유효하지 않은 keyword 값입니다.")
 
-        user = self.request.user
+    return urlname, category, pk, keyword
 
-        if urlname:
-            try:
-                profile = Profile.objects.get(urlname=urlname)
-                user = profile.user
-            except Profile.DoesNotExist:
-                return Post.objects.none()
 
-        # ✅ keyword가 주어진 경우, 해당 카테고리의 게시물만 필터링
-        if keyword:
-            if keyword not in dict(Post.KEYWORD_CHOICES):
-                raise ValidationError(f"'{keyword}'은(는) 유효하지 않은 keyword 값입니다.")
-            return Post.objects.filter(keyword=keyword, is_complete=True).exclude(
-                author=user)  # ❌ 본인 게시물 제외
+def post_list_queryset(user, card, category, pk, keyword):
+    """
+    ✅ 게시물 목록 queryset (PostListView / AsyncPostListView 공용)
+    - card: urlname으로 조회한 프로필 카드 (없으면 로그인한 사용자 기준)
+    - 작성자 프로필, 본문, 이미지를 함께 조회하여 직렬화 중 추가 쿼리가 없도록 함
+    """
+    user_id = card.user_id if card else user.id
 
+    # ✅ keyword가 주어진 경우, 해당 카테고리의 게시물만 필터링
+    if keyword:
+        queryset = Post.objects.filter(keyword=keyword, is_complete=True).exclude(
+            author_id=user_id)  # ❌ 본인 게시물 제외
+    else:
         # ❌ 자신의 게시물(my_posts) 제외
-        from_neighbors = list(
-            Neighbor.objects.filter(from_user=user, status="accepted").values_list('to_user', flat=True)
-        )
-        to_neighbors = list(
-            Neighbor.objects.filter(to_user=user, status="accepted").values_list('from_user', flat=True)
-        )
-        neighbor_ids = set(from_neighbors + to_neighbors)
-        neighbor_ids.discard(user.id)  # ❌ 자신의 ID 제거
+        profile_id = card.profile_id if card else user.profile.id
+        neighbor_ids = neighbor_user_ids(profile_id)  # ✅ 서로이웃 관계 테이블 서브쿼리
 
         mutual_neighbor_posts = Q(visibility='mutual', author_id__in=neighbor_ids)  # ✅ 서로 이웃의 'mutual' 공개 글
         public_posts = Q(visibility='everyone')  # ✅ 전체 공개 글
 
         queryset = Post.objects.filter(
             (public_posts | mutual_neighbor_posts) & Q(is_complete=True)  # ✅ 자신의 글 제외
-        ).exclude(author=user)  # ❌ 본인 게시물 확실하게 제거
+        ).exclude(author_id=user_id)  # ❌ 본인 게시물 확실하게 제거
 
         if category:
             queryset = queryset.filter(category=category)
@@ -90,7 +84,39 @@ class PostListView(ListAPIView):
         if pk:
             queryset = queryset.filter(pk=pk)
 
-        return queryset
+    return queryset.select_related('author__profile').prefetch_related('texts', 'images')
+
+
+def post_detail_queryset(user):
+    """ ✅ 타인 게시물 상세 조회 queryset (PostDetailView / AsyncPostDetailView 공용) """
+    # ✅ 서로이웃 ID 리스트 가져오기
+    neighbor_ids = neighbor_user_ids(user.profile.id)  # ✅ 서로이웃 관계 테이블 서브쿼리
+
+    mutual_neighbor_posts = Q(visibility='mutual', author_id__in=neighbor_ids)  # ✅ 서로 이웃 게시물
+    public_posts = Q(visibility='everyone')  # ✅ 전체 공개 게시물
+
+    # ❌ 자신의 글 제외하고 필터링
+    return Post.objects.filter(
+        (public_posts | mutual_neighbor_posts) & Q(is_complete=True)
+    ).exclude(author=user).select_related('author__profile').prefetch_related('texts', 'images')  # ❌ 본인 게시물 제외
+
+
+class PostListView(ListAPIView):
+    permission_classes = [IsAuthenticated]
+    parser_classes = [JSONParser]
+    queryset = Post.objects.all()
+    serializer_class = PostSerializer
+
+    def get_queryset(self):
+        urlname, category, pk, keyword = validate_post_list_params(self.request.query_params)
+
+        card = None
+        if urlname:
+            card = get_profile_card(urlname)  # ✅ 캐시된 프로필 카드 (Profile/User 조회 없음)
+            if card is None:
+                return Post.objects.none()
+
+        return post_list_queryset(self.request.user, card, category, pk, keyword)
 
     @swagger_auto_schema(
         operation_summary="게시물 목록 조회",
@@ -317,14 +343,7 @@ class PostMutualView(ListAPIView):
         user = self.request.user
 
         # ✅ 서로이웃 ID 리스트 가져오기
-        from_neighbors = list(
-            Neighbor.objects.filter(from_user=user, status="accepted").values_list('to_user', flat=True)
-        )
-        to_neighbors = list(
-            Neighbor.objects.filter(to_user=user, status="accepted").values_list('from_user', flat=True)
-        )
-        neighbor_ids = set(from_neighbors + to_neighbors)
-        neighbor_ids.discard(user.id)
+        neighbor_ids = neighbor_user_ids(user.profile.id)  # ✅ 서로이웃 관계 테이블 서브쿼리
 
         mutual_neighbor_posts = Q(author_id__in=neighbor_ids) & (Q(visibility='mutual') | Q(visibility='everyone'))
 
@@ -357,28 +376,7 @@ class PostDetailView(RetrieveAPIView):
     parser_classes = [MultiPartParser, FormParser]
 
     def get_queryset(self):
-        user = self.request.user
-
-        # ✅ 서로이웃 ID 리스트 가져오기
-        from_neighbors = list(
-            Neighbor.objects.filter(from_user=user, status="accepted").values_list('to_user', flat=True)
-        )
-        to_neighbors = list(
-            Neighbor.objects.filter(to_user=user, status="accepted").values_list('from_user', flat=True)
-        )
-
-        neighbor_ids = set(from_neighbors + to_neighbors)
-        neighbor_ids.discard(user.id)  # ❌ 본인 ID 제외
-
-        mutual_neighbor_posts = Q(visibility='mutual', author_id__in=neighbor_ids)  # ✅ 서로 이웃 게시물
-        public_posts = Q(visibility='everyone')  # ✅ 전체 공개 게시물
-
-        # ❌ 자신의 글 제외하고 필터링
-        queryset = Post.objects.filter(
-            (public_posts | mutual_neighbor_posts) & Q(is_complete=True)
-        ).exclude(author=user)  # ❌ 본인 게시물 제외
-
-        return queryset
+        return post_detail_queryset(self.request.user)
 
     @swagger_auto_schema(
         operation_summary="게시물 상세 조회",
@@ -642,4 +640,35 @@ class DraftPostDetailView(RetrieveAPIView):
         """
         요청한 사용자의 특정 임시 저장된 게시물만 반환
         """
-        return Post.objects.filter(author=self.request.user, is_complete=False)
\ No newline at end of file
+        return Post.objects.filter(author=self.request.user, is_complete=False)
+
+class AsyncPostListView(AsyncAPIView):
+    """
+    ✅ PostListView의 async 버전 (GET /posts/async/) - ASGI 환경 전용
+    - 같은 쿼리 파라미터(urlname, category, pk, keyword)와 응답 형식
+    - 프로필 카드/인증 사용자는 async 캐시, 게시물은 async ORM으로 조회 (요청마다 스레드를 점유하지 않음)
+    """
+
+    async def get(self, request):
+        urlname, category, pk, keyword = validate_post_list_params(request.GET)
+
+        queryset = Post.objects.none()
+        card = await aget_profile_card(urlname) if urlname else None
+        if card is not None or not urlname:
+            queryset = post_list_queryset(request.user, card, category, pk, keyword)
+
+        context = {'request': request}
+        if pk:
+            post = await aget_object_or_404(queryset, pk=pk)
+            return api_response(PostSerializer(post, context=context).data)
+
+        posts = [post async for post in queryset]
+        return api_response(PostSerializer(posts, many=True, context=context).data)
+
+
+class AsyncPostDetailView(AsyncAPIView):
+    """ ✅ PostDetailView의 async 버전 (GET /posts/async/{pk}/) - ASGI 환경 전용 """
+
+    async def get(self, request, pk):
+        post = await aget_object_or_404(post_detail_queryset(request.user), pk=pk)
+        return api_response(PostSerializer(post, context={'request': request}).data)
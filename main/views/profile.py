@@ -11,8 +11,10 @@ from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from django.shortcuts import get_object_or_404
 from rest_framework.response import Response
 from ..models.profile import Profile
-from main.models.neighbor import Neighbor
-from ..serializers.profile import ProfileSerializer,UrlnameUpdateSerializer
+from main.models.neighbor import aare_neighbors, are_neighbors
+from main.profile_cards import aget_profile_card_or_404, get_profile_card_or_404
+from main.async_api import AsyncAPIView, api_response
+from ..serializers.profile import ProfileCardSerializer, ProfileSerializer, UrlnameUpdateSerializer
 from django.db.models import Q
 from rest_framework.exceptions import ValidationError
 
@@ -142,7 +144,7 @@ class ProfileUrlnameUpdateView(UpdateAPIView):
         # ✅ `urlname` 변경
         profile.urlname = serializer.validated_data["urlname"]
         profile.urlname_edit_count += 1  # ✅ 변경 횟수 증가
-        profile.save()
+        profile.save(update_fields=['urlname', 'urlname_edit_count'])  # ✅ 시그널에서 변경 전/후 urlname의 프로필 카드 캐시 삭제
 
         return Response({"message": "URL 이름이 변경되었습니다.", "urlname": profile.urlname}, status=200)
 
@@ -176,38 +178,35 @@ class ProfilePublicView(RetrieveAPIView):
             )
         ],
         responses={
-            200: openapi.Response(
-                description="성공적으로 프로필을 반환",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        "urlname": openapi.Schema(type=openapi.TYPE_STRING, description="사용자의 URL 이름"),
-                        "blog_name": openapi.Schema(type=openapi.TYPE_STRING, description="블로그 이름"),
-                        "blog_pic": openapi.Schema(type=openapi.TYPE_STRING, format="url", description="블로그 프로필 이미지 URL"),
-                        "username": openapi.Schema(type=openapi.TYPE_STRING, description="사용자 이름"),
-                        "user_pic": openapi.Schema(type=openapi.TYPE_STRING, format="url", description="프로필 사진 URL"),
-                        "intro": openapi.Schema(type=openapi.TYPE_STRING, description="사용자의 자기소개"),
-                        "is_neighbor": openapi.Schema(type=openapi.TYPE_BOOLEAN, description="현재 로그인한 사용자가 조회 대상과 서로이웃인지 여부")
-                    }
-                )
-            ),
+            200: openapi.Response(description="성공적으로 프로필을 반환", schema=ProfileCardSerializer()),
             404: openapi.Response(description="해당 사용자의 프로필을 찾을 수 없음")
         }
     )
     def get(self, request, urlname):
-        profile = get_object_or_404(Profile, urlname=urlname)
-        serializer = self.get_serializer(profile)
+        card = get_profile_card_or_404(urlname)  # ✅ 캐시된 프로필 카드 (Profile 조회 없음)
 
-        # ✅ 현재 로그인한 사용자가 서로이웃인지 확인 (status="accepted"인 경우만 체크)
+        # ✅ 현재 로그인한 사용자가 서로이웃인지 확인
         is_neighbor = False
         if request.user.is_authenticated:
-            is_neighbor = Neighbor.objects.filter(
-                (Q(from_user=request.user, to_user=profile.user) |
-                 Q(from_user=profile.user, to_user=request.user)),
-                status="accepted"
-            ).exists()
+            is_neighbor = are_neighbors(card.profile_id, request.user.profile.id)
 
-        response_data = serializer.data
-        response_data["is_neighbor"] = is_neighbor  # ✅ 서로이웃 여부 추가
+        serializer = ProfileCardSerializer(card, context={'request': request, 'is_neighbor': is_neighbor})
+        return Response(serializer.data)
+
+
+class AsyncProfilePublicView(AsyncAPIView):
+    """
+    ✅ ProfilePublicView의 async 버전 (GET /profile/{urlname}/async/) - ASGI 환경 전용
+    - 응답은 ProfilePublicView와 같음
+    """
+    authentication_required = False  # 로그인하지 않아도 조회 가능
+
+    async def get(self, request, urlname):
+        card = await aget_profile_card_or_404(urlname)
+
+        is_neighbor = False
+        if request.user.is_authenticated:
+            is_neighbor = await aare_neighbors(card.profile_id, request.user.profile.id)
 
-        return Response(response_data)
+        serializer = ProfileCardSerializer(card, context={'request': request, 'is_neighbor': is_neighbor})
+        return api_response(serializer.data)
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 from pathlib import Path
+import os
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -48,17 +49,22 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'main.middleware.RequestMetricsMiddleware',  # ✅ 뷰별 응답 시간 / DB 쿼리 지표 (가장 바깥에서 측정)
+    'main.db_router.ReplicaRoutingMiddleware',  # ✅ 읽기 전용 요청의 조회를 복제 DB로 (쓰기 후에는 주 DB에 고정)
+    'main.middleware.CompressionMiddleware',  # ✅ 큰 응답 br / gzip 압축 (본문을 바꾸는 미들웨어보다 바깥)
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'corsheaders.middleware.CorsMiddleware',  # ✅ CommonMiddleware의 리다이렉트 응답에도 CORS 헤더가 붙도록 앞에 둠
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'corsheaders.middleware.CorsMiddleware',
-    'django.middleware.common.CommonMiddleware',
 ]
 
+# ✅ 이 크기(바이트) 이상인 JSON / 텍스트 응답만 압축
+COMPRESSION_MIN_SIZE = 1024
+
 CORS_ALLOW_ALL_ORIGINS = True  # 모든 요청 허용 (테스트용, 보안 취약)
 
 
@@ -97,7 +103,47 @@ DATABASES = {
     }
 }
 
+# ✅ 복제(읽기 전용) DB - DB_REPLICA_HOST가 설정된 경우에만 사용
+# - 읽기 전용 요청(GET 등)의 조회만 복제 DB로 보내고, 쓰기 후 REPLICA_PIN_SECONDS 동안은 주 DB에서 조회
+DATABASE_ROUTERS = ['main.db_router.PrimaryReplicaRouter']
+DATABASE_REPLICAS = []
+if os.environ.get('DB_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.environ['DB_REPLICA_HOST'],
+        'PORT': os.environ.get('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS = ['replica']
+REPLICA_PIN_SECONDS = 5  # ✅ 복제 지연보다 길게 설정
+
+
+
+# Cache
+# ✅ 내 소식 배지 개수 등 가벼운 카운터 캐시. 여러 워커로 운영할 때는 Redis 등 공유 캐시로 교체
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'naver-blog',
+    }
+}
+
 
+# ✅ 비밀번호 해시
+# - PBKDF2 반복 횟수(cost)를 설정으로 조정, 기존 해시는 로그인할 때 새 cost로 다시 저장됨
+# - PASSWORD_HASH_ITERATIONS: 비우면 Django 기본값, Django 기본값보다 낮은 값은 허용하지 않음 (시스템 체크 / 해셔 생성 시 오류)
+# - PASSWORD_HASH_WORKERS: 비동기 로그인(/login/async/)의 해시 전용 스레드 수
+# - PASSWORD_HASH_MAX_PENDING: 해시 대기 + 실행 중인 작업 상한 (넘으면 503)
+PASSWORD_HASHERS = [
+    'main.hashers.ConfigurablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PASSWORD_HASH_ITERATIONS = int(os.environ['PASSWORD_HASH_ITERATIONS']) if os.environ.get('PASSWORD_HASH_ITERATIONS') else None
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', os.cpu_count() or 4))
+PASSWORD_HASH_MAX_PENDING = PASSWORD_HASH_WORKERS * 16
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -142,8 +188,12 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Django REST framework의 기본 인증 클래스 및 필터링 설정
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': (
+        'main.renderers.FastJSONRenderer',  # ✅ orjson 기반 (출력은 DRF JSONRenderer와 같음)
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'main.authentication.ProfileJWTAuthentication',  # ✅ 사용자 + 프로필을 한 번에 로드 (캐시 사용)
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -162,16 +212,34 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),  # 액세스 토큰 유효 기간 설정 (하루)
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),  # 리프레시 토큰 유효 기간 설정 (7일)
+    'TOKEN_REFRESH_SERIALIZER': 'main.revocation.FilteredTokenRefreshSerializer',  # 블랙리스트 확인 전 블룸 필터 확인
 }
 
+# ✅ 폐기 토큰 블룸 필터 전체 재생성 주기 (초)
+REVOKED_FILTER_REBUILD_SECONDS = 600
+# ✅ 필터의 "폐기되지 않음" 판단을 DB 확인 없이 믿는 시간 (초)
+# - 필터는 공유 캐시(Redis 등)에서만 동작, 프로세스별 캐시(LocMemCache)에서는 항상 블랙리스트 조회
+REVOKED_FILTER_SYNC_SECONDS = 1
+
+# ✅ urlname → 프로필 카드 캐시 유지 시간 (초)
+# - 변경 시 캐시 삭제는 같은 캐시를 쓰는 프로세스에만 전달됨. 워커별 LocMemCache에서는 다른 워커가 이 시간 동안
+#   이전 카드(공개 범위 등)를 볼 수 있으므로 짧게 유지하고, Redis 등 공유 캐시를 쓸 때만 늘릴 것
+PROFILE_CARD_TIMEOUT = 5
+
+# ✅ 요청 지표 (/metrics)
+# - METRICS_DIR: 여러 워커 프로세스로 운영할 때 워커별 집계 파일을 저장할 디렉터리 (비우면 현재 프로세스만)
+# - METRICS_FLUSH_SECONDS: 워커별 집계 파일 저장 주기 (초)
+# - METRICS_TOKEN: /metrics 조회에 필요한 `Authorization: Bearer <토큰>` (설정하지 않으면 DEBUG에서만 조회 가능)
+METRICS_DIR = os.environ.get('METRICS_DIR')
+METRICS_FLUSH_SECONDS = 5
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
 # Swagger 설정 추가
 
 
 
 AUTH_USER_MODEL = 'main.CustomUser'
 
-import os
-
 # MEDIA_ROOT: 파일이 실제로 저장되는 경로
 MEDIA_ROOT = os.path.join(BASE_DIR, 'main/media')
 
@@ -0,0 +1,27 @@
+"""
+✅ 벤치마크용 설정 (로컬 SQLite, 네트워크/MySQL 없이 실행)
+
+    DJANGO_SETTINGS_MODULE=naver_blog.settings_bench python manage.py migrate
+    DJANGO_SETTINGS_MODULE=naver_blog.settings_bench python manage.py seed_bench --users 1000
+    DJANGO_SETTINGS_MODULE=naver_blog.settings_bench python manage.py run_bench --output bench.json
+
+데이터를 다시 만들 때는 seed_bench --flush보다 BENCH_DB 파일을 지우고 migrate부터 다시 하는 편이 빠름
+(--flush는 댓글마다 삭제 시그널이 실행됨)
+"""
+from naver_blog.settings import *  # noqa: F401,F403
+from naver_blog.settings import BASE_DIR, os
+
+DEBUG = False  # ✅ DEBUG 쿼리 로그 저장 비용이 측정값에 섞이지 않도록
+ALLOWED_HOSTS = ['localhost', 'testserver']
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('BENCH_DB', BASE_DIR / 'bench.sqlite3'),
+        'OPTIONS': {
+            'timeout': 30,
+            'transaction_mode': 'IMMEDIATE',  # ✅ 동시 쓰기 시 읽기 → 쓰기 잠금 승격 실패(database is locked) 방지
+            'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+        },
+    }
+}
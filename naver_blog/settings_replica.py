@@ -0,0 +1,29 @@
+"""
+✅ 주/복제 DB 라우팅 로컬 확인용 설정 (SQLite 파일 두 개, 실제 복제 서버 없이 실행)
+
+    DJANGO_SETTINGS_MODULE=naver_blog.settings_replica python manage.py migrate
+    DJANGO_SETTINGS_MODULE=naver_blog.settings_replica python manage.py sync_replica
+    DJANGO_SETTINGS_MODULE=naver_blog.settings_replica python manage.py runserver
+
+복제는 자동으로 일어나지 않으므로, sync_replica를 실행하기 전까지 복제 DB는 "지연된" 상태
+(쓰기 직후 조회가 주 DB에 고정되는지 확인할 수 있음)
+
+실제 연결별 쿼리를 확인하는 라우팅 테스트도 이 설정에서만 실행됨
+
+    DJANGO_SETTINGS_MODULE=naver_blog.settings_replica python manage.py test main.tests.test_db_router
+"""
+from naver_blog.settings import *  # noqa: F401,F403
+from naver_blog.settings import BASE_DIR, os
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('PRIMARY_DB', BASE_DIR / 'primary.sqlite3'),
+    },
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('REPLICA_DB', BASE_DIR / 'replica.sqlite3'),
+        'TEST': {'MIRROR': 'default'},
+    },
+}
+DATABASE_REPLICAS = ['replica']
@@ -19,16 +19,19 @@ from django.contrib import admin
 from django.conf import settings
 from django.conf.urls.static import static
 from main.views.signup import SignupView
-from main.views.login import LoginView
+from main.views.login import LoginView, AsyncLoginView
 from main.views.logout import LogoutView
-from main.views.profile import ProfileDetailView, ProfilePublicView, ProfileUrlnameUpdateView
-from main.views.post import PostDetailView,PostMyView,PostMyDetailView,PostMutualView,PostManageView,PostListView,PostCreateView,DraftPostListView,DraftPostDetailView
-from main.views.comment import CommentListView, CommentDetailView
+from rest_framework_simplejwt.views import TokenRefreshView
+from main.views.profile import ProfileDetailView, ProfilePublicView, ProfileUrlnameUpdateView, AsyncProfilePublicView
+from main.views.post import PostDetailView,PostMyView,PostMyDetailView,PostMutualView,PostManageView,PostListView,PostCreateView,DraftPostListView,DraftPostDetailView,AsyncPostListView,AsyncPostDetailView
+from main.views.comment import CommentListView, CommentDetailView, CommentReplyListView, AsyncCommentListView
 from main.views.heart import ToggleHeartView, PostHeartUsersView, PostHeartCountView
 from main.views.commentHeart import ToggleCommentHeartView, CommentHeartCountView
-from main.views.neighbor import NeighborView,NeighborAcceptView,NeighborRejectView,NeighborRequestListView,PublicNeighborListView
-from main.views.news import MyNewsListView
-from main.views.activity import MyActivityListView
+from main.views.neighbor import NeighborView,NeighborAcceptView,NeighborRejectView,NeighborRequestListView,NeighborRequestBulkView,PublicNeighborListView,MyNeighborListView,MyNeighborRecommendationView
+from main.views.news import MyNewsListView, MyNewsReadView, MyNewsUnreadCountView, MyNewsDigestView, AsyncMyNewsListView
+from main.views.activity import MyActivityListView, MyActivityHistoryView
+from main.views.events import EventStreamView
+from main.views.metrics import MetricsView
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from rest_framework.permissions import AllowAny
@@ -50,7 +53,9 @@ urlpatterns = [
     path('signup/', SignupView.as_view(), name='signup'),
     # ✅ 로그인 및 로그아웃 API
     path('login/', LoginView.as_view(), name='login'),
+    path('login/async/', AsyncLoginView.as_view(), name='login-async'),  # 비동기 로그인 (ASGI 전용, 해시는 전용 스레드 풀에서 계산)
     path('logout/', LogoutView.as_view(), name='logout'),
+    path('token/refresh/', TokenRefreshView.as_view(), name='token-refresh'),  # 액세스 토큰 재발급 (리프레시 토큰 회전)
 
     # ✅ 내 프로필 관련 API
     path('profile/me/', ProfileDetailView.as_view(), name='profile-me'),  # 내 프로필 조회, 수정, 삭제
@@ -58,17 +63,29 @@ urlpatterns = [
 
     # 내 소식 및 내 활동 관련 API
     path('news/list/', MyNewsListView.as_view(), name='my-news-list'), # 내 소식
+    path('news/list/async/', AsyncMyNewsListView.as_view(), name='my-news-list-async'),  # 내 소식 (async, ASGI 전용)
+    path('news/read/', MyNewsReadView.as_view(), name='my-news-read'), # 내 소식 읽음 처리
+    path('news/unread-count/', MyNewsUnreadCountView.as_view(), name='my-news-unread-count'), # 읽지 않은 내 소식 개수 (배지)
+    path('news/digest/', MyNewsDigestView.as_view(), name='my-news-digest'), # 게시글별로 묶은 내 소식
+
+    # ✅ 실시간 이벤트 (SSE, ASGI 전용) - 내 소식 + 지정한 게시글의 새 댓글
+    path('events/stream/', EventStreamView.as_view(), name='event-stream'),
     path('activity/list/', MyActivityListView.as_view(), name='my-activity-list'), # 내 활동
+    path('activity/history/', MyActivityHistoryView.as_view(), name='my-activity-history'), # 내 활동 전체 기록 (커서 페이지네이션)
 
     # ✅ 타인 프로필 관련 API
-    path('profile/<str:user_id>/', ProfilePublicView.as_view(), name='profile-public'),
-    path('profile/<str:user_id>/neighbors/', PublicNeighborListView.as_view(), name='neighbor-list'),
+    path('profile/<str:urlname>/', ProfilePublicView.as_view(), name='profile-public'),
+    path('profile/<str:urlname>/async/', AsyncProfilePublicView.as_view(), name='profile-public-async'),  # async, ASGI 전용
+    path('profile/<str:urlname>/neighbors/', PublicNeighborListView.as_view(), name='neighbor-list'),
 
     # ✅ 서로이웃 관련 API
-    path('neighbors/<str:to_user_id>/', NeighborView.as_view(), name='neighbor-request'),
+    path('neighbors/list/me/', MyNeighborListView.as_view(), name='my-neighbor-list'),  # 내 서로이웃 목록 (커서 페이지네이션, neighbors/<urlname>/과 겹치지 않는 경로)
+    path('neighbors/recommendations/me/', MyNeighborRecommendationView.as_view(), name='neighbor-recommendations'),  # 알 수도 있는 이웃
+    path('neighbors/<str:to_urlname>/', NeighborView.as_view(), name='neighbor-request'),
     path('neighbors/requests/me', NeighborRequestListView.as_view(), name='neighbor-request-list'),
-    path('neighbors/accept/<str:from_user_id>/', NeighborAcceptView.as_view(), name='neighbor-accept'),
-    path('neighbors/reject/<str:from_user_id>/', NeighborRejectView.as_view(), name='neighbor-reject'),
+    path('neighbors/requests/bulk/', NeighborRequestBulkView.as_view(), name='neighbor-request-bulk'),  # 받은 요청 일괄 수락/거절
+    path('neighbors/accept/<str:from_urlname>/', NeighborAcceptView.as_view(), name='neighbor-accept'),
+    path('neighbors/reject/<str:from_urlname>/', NeighborRejectView.as_view(), name='neighbor-reject'),
 
     # ✅ 게시물 관련 API
 
@@ -82,6 +99,8 @@ urlpatterns = [
 
     path('posts/', PostListView.as_view(), name='post-list'),  # 타인 게시물 목록 조회 (GET, 쿼리 파라미터 활용)
     path('posts/<int:pk>/', PostDetailView.as_view(), name='post-detail'),  # 타인 게시물 상세 조회 (GET)
+    path('posts/async/', AsyncPostListView.as_view(), name='post-list-async'),  # 타인 게시물 목록 조회 (async, ASGI 전용)
+    path('posts/async/<int:pk>/', AsyncPostDetailView.as_view(), name='post-detail-async'),  # 타인 게시물 상세 조회 (async, ASGI 전용)
 
     #서로 이웃 새글 API
     path('posts/mutual/', PostMutualView.as_view(), name='post-mutual'),
@@ -92,7 +111,9 @@ urlpatterns = [
 
     # ✅ 특정 게시글의 댓글 목록 조회 & 댓글 작성
     path('posts/<int:post_id>/comments/', CommentListView.as_view(), name='comment-list'),
+    path('posts/<int:post_id>/comments/async/', AsyncCommentListView.as_view(), name='comment-list-async'),  # async, ASGI 전용
     path('posts/<int:post_id>/comments/<int:pk>/', CommentDetailView.as_view(), name='comment-detail'),
+    path('posts/<int:post_id>/comments/<int:comment_id>/replies/', CommentReplyListView.as_view(), name='comment-reply-list'),  # 대댓글 목록 (커서 페이지네이션)
 
     # ✅ 공감(좋아요) 관련 API
 
@@ -109,6 +130,9 @@ urlpatterns = [
     # 댓글/대댓글 좋아요 개수 조회
     path('posts/<int:post_id>/comments/<int:comment_id>/heart/count/', CommentHeartCountView.as_view(),
          name='comment-heart-count'),
+    # ✅ 뷰별 응답 시간 / 쿼리 지표 (Prometheus 텍스트 형식)
+    path('metrics', MetricsView.as_view(), name='metrics'),
+
     # Swagger 관련 경로 (drf-yasg 사용)
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),  # ReDoc UI 추가
     re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),